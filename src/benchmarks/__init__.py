@@ -0,0 +1,27 @@
+"""
+Benchmarks
+==========
+
+Headless performance suite for :class:`~core.charts.linechart.CoreLineChart`.
+
+Run it from the `src` directory::
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --baseline baseline.json --threshold 0.25
+
+Each case is timed on reproducible random walks of 1k, 10k, 100k and 1M
+points (see :mod:`benchmarks.datasets`) and reported as JSON with its wall
+time, including one offscreen frame rendered after it, the number of
+canvas instructions it leaves and its peak Python memory. Against a
+baseline, the run fails when a metric grows by more than the threshold.
+`--renderer mesh` draws the series with
+:class:`~core.charts.linechart.meshline.MeshLine`, and
+:mod:`benchmarks.renderers` compares the line renderers frame by frame.
+
+The cases live in :mod:`benchmarks.runner`, which opens the Kivy window on
+import; the package itself does not import it so the entry points can
+select a headless window first through :mod:`benchmarks.headless`.
+"""
+
+from .datasets import SIZES, random_walk
+from .compare import compare, load_results, save_results
@@ -0,0 +1,67 @@
+"""
+Command line entry point: `python -m benchmarks --help`.
+"""
+
+import argparse
+import sys
+
+import benchmarks.headless  # noqa: F401 (must precede Kivy)
+from benchmarks.datasets import SIZES
+from benchmarks.runner import CASES, run_benchmarks
+from benchmarks.compare import compare, load_results, save_results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='benchmarks', description="CoreLineChart benchmark suite.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES), help="point counts to run at")
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), help="cases to run (default: all)")
+    parser.add_argument('--repeat', type=int, default=5, help="timed runs per case and size")
+    parser.add_argument('--decimation', choices=('lttb', 'minmax'), help="decimation of the charts")
+    parser.add_argument('--renderer', choices=('smooth', 'mesh'), default='smooth', help="line renderer of the series")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the synthetic series")
+    parser.add_argument('--output', help="file to write the results to (default: stdout)")
+    parser.add_argument('--baseline', help="results file to compare against")
+    parser.add_argument('--threshold', type=float, default=0.25, help="allowed growth of a metric, as a fraction")
+    parser.add_argument('--save-baseline', action='store_true', help="write the results to --baseline instead of comparing")
+    return parser.parse_args(argv)
+
+
+def report(case, size, metrics):
+    print(
+        f"{case:>12} {size:>9,}  {metrics['wall_ms']:>10.3f} ms"
+        f"  {metrics['instructions']:>7} instructions  {metrics['peak_bytes'] / 1e6:>9.2f} MB",
+        file=sys.stderr
+    )
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.save_baseline and not args.baseline:
+        raise SystemExit("--save-baseline requires --baseline.")
+
+    results = run_benchmarks(
+        args.sizes, args.cases, args.repeat, args.decimation, args.seed, report, args.renderer
+    )
+
+    if args.output:
+        save_results(results, args.output)
+    elif not args.save_baseline:
+        save_results(results, sys.stdout)
+
+    if args.baseline is None:
+        return 0
+    if args.save_baseline:
+        save_results(results, args.baseline)
+        return 0
+
+    regressions = compare(results, load_results(args.baseline), args.threshold)
+    for regression in regressions:
+        print(
+            "regression: {case} at {size} points, {metric} {baseline} -> {current} (x{ratio})".format(**regression),
+            file=sys.stderr
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+Benchmarks/Compare
+==================
+
+Storage of benchmark results and regression checks against a baseline.
+"""
+
+from __future__ import annotations
+
+import json
+
+
+METRICS = ('wall_ms', 'instructions', 'peak_bytes')
+'''
+Metrics checked against the baseline; for all of them lower is better.
+'''
+
+
+def load_results(path):
+    with open(path) as stream:
+        return json.load(stream)
+
+
+def save_results(results, path):
+    """
+    Writes `results` as JSON to the file at `path`, or to `path` itself
+    when it is a text stream such as :data:`sys.stdout`.
+    """
+
+    if hasattr(path, 'write'):
+        dump_results(results, path)
+        return
+
+    with open(path, 'w') as stream:
+        dump_results(results, stream)
+
+
+def dump_results(results, stream):
+    json.dump(results, stream, indent=2, sort_keys=True)
+    stream.write('\n')
+
+
+def compare(results, baseline, threshold=0.25):
+    """
+    Returns the regressions of `results` against `baseline`, both in the
+    shape produced by :func:`~benchmarks.runner.run_benchmarks`.
+
+    A metric regresses when it exceeds its baseline value by more than the
+    `threshold` fraction. Cases or sizes missing from either side are
+    skipped. Each regression is a dict with its `case`, `size`, `metric`,
+    `baseline` and `current` values and their `ratio`.
+    """
+
+    regressions = []
+    for case, sizes in results['cases'].items():
+        for size, metrics in sizes.items():
+            reference = baseline['cases'].get(case, {}).get(size)
+            if reference is None:
+                continue
+
+            for metric in METRICS:
+                before, after = reference.get(metric), metrics.get(metric)
+                if not before or after is None:
+                    continue
+
+                ratio = after / before
+                if ratio > 1 + threshold:
+                    regressions.append({
+                        'case': case,
+                        'size': size,
+                        'metric': metric,
+                        'baseline': before,
+                        'current': after,
+                        'ratio': round(ratio, 3),
+                    })
+    return regressions
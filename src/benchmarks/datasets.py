@@ -0,0 +1,53 @@
+"""
+Benchmarks/Datasets
+===================
+
+Reproducible synthetic series.
+"""
+
+from __future__ import annotations
+
+import random
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional dependency
+    np = None
+
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+'''
+Point counts the suite runs at by default.
+'''
+
+
+def random_walk(count, seed=0):
+    """
+    Returns the `(xs, ys)` columns of a Gaussian random walk of `count`
+    points over the x values `0 .. count - 1`. The same `seed` always gives
+    the same series.
+    """
+
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        return np.arange(count, dtype=np.float64), np.cumsum(rng.standard_normal(count))
+
+    rng = random.Random(seed)
+    ys = array('d')
+    y = 0.0
+    for _ in range(count):
+        y += rng.gauss(0.0, 1.0)
+        ys.append(y)
+    return array('d', range(count)), ys
+
+
+def value_range(values):
+    """
+    Returns `[low, high]` of `values`, widened when they are all equal.
+    """
+
+    low, high = float(min(values)), float(max(values))
+    if low == high:
+        low, high = low - 1, high + 1
+    return [low, high]
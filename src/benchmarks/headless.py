@@ -0,0 +1,19 @@
+"""
+Selects a headless Kivy setup before Kivy is imported.
+
+Without a display, the SDL offscreen video driver is used so the suite runs
+on headless machines; under Xvfb the virtual display is used as is. Import
+this module first in every entry point.
+"""
+
+import logging
+import os
+
+if not os.environ.get('DISPLAY') and not os.environ.get('WAYLAND_DISPLAY'):
+    os.environ.setdefault('SDL_VIDEODRIVER', 'offscreen')
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+os.environ.setdefault('KIVY_LOG_MODE', 'PYTHON')
+logging.getLogger('kivy').setLevel(logging.ERROR)
+
+from config import set_fonts  # noqa: E402
+set_fonts()
@@ -0,0 +1,145 @@
+"""
+Benchmarks/Renderers
+====================
+
+Compares the line renderers of
+:meth:`~core.charts.linechart.CoreLineChart.draw_line`::
+
+    python -m benchmarks.renderers --sizes 1000 10000 100000
+
+:class:`~kivy.graphics.SmoothLine` tessellates when the canvas is drawn,
+so every case renders one frame into an offscreen
+:class:`~kivy.graphics.Fbo` and times the whole of it:
+
+- `build`: creating the line from a point list,
+- `update`: replacing all of its points,
+- `append`: adding 1% more points at its end.
+
+SmoothLine is skipped above
+:data:`~core.charts.linechart.linechart.SMOOTH_LINE_MAX_POINTS`, past which
+its 16-bit vertex indices overflow and Kivy 2.3 crashes; charts switch to a
+MeshLine there.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from statistics import median
+from time import perf_counter
+
+import benchmarks.headless  # noqa: F401 (must precede Kivy)
+
+from kivy.graphics import Color, Fbo, SmoothLine
+
+from core.charts.linechart.linechart import SMOOTH_LINE_MAX_POINTS
+from core.charts.linechart.meshline import MeshLine
+from core.charts.linechart.projection import interleave
+from benchmarks.datasets import random_walk, value_range
+from benchmarks.compare import save_results
+
+
+SIZES = (1_000, 10_000, 100_000)
+
+FRAME_SIZE = (1200, 600)
+
+RENDERERS = {'smooth': SmoothLine, 'mesh': MeshLine}
+
+
+def frame_points(count, seed=0):
+    """
+    Returns a random walk of `count` points as a flat pixel list spanning
+    :data:`FRAME_SIZE`.
+    """
+
+    xs, ys = random_walk(count, seed)
+    (x_low, x_high), (y_low, y_high) = value_range(xs), value_range(ys)
+    width, height = FRAME_SIZE
+    px = [(x - x_low) * width / (x_high - x_low) for x in xs]
+    py = [(y - y_low) * height / (y_high - y_low) for y in ys]
+    return interleave(px, py)
+
+
+def extend_line(line, points):
+    if isinstance(line, MeshLine):
+        line.extend(points)
+    else:
+        line.points = line.points + points
+
+
+def time_frame(fbo, change):
+    start = perf_counter()
+    change()
+    fbo.draw()
+    return perf_counter() - start
+
+
+def measure_renderer(line_class, points, repeat, width=2):
+    """
+    Returns the median time in milliseconds of each case for `line_class`.
+    """
+
+    tail = points[-2 * max(len(points) // 200, 1):]
+    times = {'build': [], 'update': [], 'append': []}
+
+    for _ in range(repeat):
+        fbo = Fbo(size=FRAME_SIZE)
+        fbo.add(Color(1, 1, 1, 1))
+        lines = []
+
+        def build():
+            lines.append(line_class(points=points, width=width))
+            fbo.add(lines[0])
+
+        times['build'].append(time_frame(fbo, build))
+        line = lines[0]
+        times['update'].append(time_frame(fbo, lambda: setattr(line, 'points', points)))
+        times['append'].append(time_frame(fbo, lambda: extend_line(line, tail)))
+
+    return {f'{case}_ms': round(median(values) * 1000, 4) for case, values in times.items()}
+
+
+def compare_renderers(sizes=SIZES, repeat=5, seed=0, report=None):
+    """
+    Returns the timings of every renderer at each of the `sizes`, keyed by
+    renderer and then by size. `report`, if given, is called with
+    `(renderer, size, timings)` as each renderer completes.
+    """
+
+    results = {'meta': {'frame_size': list(FRAME_SIZE), 'repeat': repeat, 'seed': seed}, 'renderers': {}}
+
+    for size in sizes:
+        points = frame_points(size, seed)
+        for name, line_class in RENDERERS.items():
+            if line_class is SmoothLine and size > SMOOTH_LINE_MAX_POINTS:
+                continue
+
+            timings = measure_renderer(line_class, points, repeat)
+            results['renderers'].setdefault(name, {})[str(size)] = timings
+            if report is not None:
+                report(name, size, timings)
+
+    return results
+
+
+def report(renderer, size, timings):
+    print(
+        f"{renderer:>6} {size:>9,}" + ''.join(f"  {case} {value:>10.3f}" for case, value in timings.items()),
+        file=sys.stderr
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='benchmarks.renderers', description="Line renderer comparison.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES), help="point counts to run at")
+    parser.add_argument('--repeat', type=int, default=5, help="timed runs per renderer and size")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the synthetic series")
+    parser.add_argument('--output', help="file to write the results to (default: stdout)")
+    args = parser.parse_args(argv)
+
+    save_results(compare_renderers(args.sizes, args.repeat, args.seed, report), args.output or sys.stdout)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
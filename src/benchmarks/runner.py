@@ -0,0 +1,312 @@
+"""
+Benchmarks/Runner
+=================
+
+Timed cases run against a real :class:`~core.charts.linechart.CoreLineChart`.
+
+Each case has a `setup` that brings the chart into the state the measured
+operation starts from, and a `run` that performs it once. Only `run` is
+timed, with the garbage collector paused, together with one frame of the
+chart rendered into an offscreen :class:`~kivy.graphics.Fbo`, since
+:class:`~kivy.graphics.SmoothLine` tessellates when it is drawn. Peak
+memory is measured on one more run traced by :mod:`tracemalloc`, which
+sees NumPy buffers as well as Python objects but not GPU-side
+allocations.
+"""
+
+from __future__ import annotations
+
+import gc
+import platform
+from abc import ABC, abstractmethod
+import tracemalloc
+from statistics import median
+from time import perf_counter
+
+import kivy
+from kivy.core.window import Window
+from kivy.graphics import Canvas, Fbo, InstructionGroup
+from kivy.input.motionevent import MotionEvent
+
+from core.charts.linechart import CoreLineChart
+from benchmarks.datasets import SIZES, random_walk, value_range
+from core.charts._np import np
+
+
+CHART_SIZE = (1200, 600)
+RESIZED_CHART_SIZE = (1000, 500)
+
+SERIES = 'series'
+OTHER = 'other'
+COLOR = (0.2, 0.5, 0.9, 1)
+OTHER_COLOR = (0.9, 0.4, 0.2, 1)
+
+
+class BenchmarkTouch(MotionEvent):
+    """
+    Synthetic mouse touch at the window position `(x, y)`.
+    """
+
+    def __init__(self, x, y):
+        super().__init__('benchmark', 1, (x, y), is_touch=True)
+
+    def depack(self, args):
+        self.sx = args[0] / float(Window.width)
+        self.sy = args[1] / float(Window.height)
+        super().depack(args)
+        self.scale_for_screen(Window.width, Window.height)
+
+
+def count_instructions(group):
+    """
+    Returns the number of graphics instructions under `group`, a canvas or
+    an instruction group, including nested groups and canvases.
+    """
+
+    children = list(group.children)
+    if isinstance(group, Canvas):
+        if group.has_before:
+            children.append(group.before)
+        if group.has_after:
+            children.append(group.after)
+
+    count = 0
+    for child in children:
+        count += 1
+        if isinstance(child, InstructionGroup):
+            count += count_instructions(child)
+    return count
+
+
+def make_chart(xs, ys, decimation=None):
+    """
+    Returns a drawn, empty chart whose ranges frame `xs`/`ys`.
+    """
+
+    chart = CoreLineChart(size=CHART_SIZE, decimation=decimation)
+    chart.x_range = value_range(xs)
+    chart.y_left_range = value_range(ys)
+    chart.redraw()
+    return chart
+
+
+def make_frame(chart):
+    """
+    Returns an offscreen :class:`~kivy.graphics.Fbo` drawing `chart`.
+    """
+
+    frame = Fbo(size=CHART_SIZE)
+    frame.add(chart.canvas)
+    return frame
+
+
+def ensure_drawn(chart, xs, ys, renderer, name=SERIES, color=COLOR):
+    if name not in chart.line_instructions:
+        chart.draw_line(name, xs=xs, ys=ys, color=color, renderer=renderer)
+
+
+#  ================================= #
+#               Cases
+#  ================================= #
+class Case(ABC):
+    """
+    Base of the cases, drawing their series with the line `renderer`.
+    """
+
+    name = None
+
+    def __init__(self, renderer='smooth'):
+        self.renderer = renderer
+
+    def setup(self, chart, xs, ys):
+        pass
+
+    @abstractmethod
+    def run(self, chart):
+        pass
+
+
+class DrawLine(Case):
+
+    name = 'draw_line'
+
+    def setup(self, chart, xs, ys):
+        self.xs, self.ys = xs, ys
+        chart.clear_lines()
+
+    def run(self, chart):
+        chart.draw_line(SERIES, xs=self.xs, ys=self.ys, color=COLOR, renderer=self.renderer)
+
+
+class Resize(Case):
+    """
+    Full redraw after a size change and the reprojection of the series that
+    follows it, flushed without waiting for a frame.
+    """
+
+    name = 'resize'
+
+    def setup(self, chart, xs, ys):
+        ensure_drawn(chart, xs, ys, self.renderer)
+        self.size = RESIZED_CHART_SIZE if tuple(chart.size) == CHART_SIZE else CHART_SIZE
+
+    def run(self, chart):
+        chart.size = self.size
+        chart.update_layers()
+        chart.settle_series()
+
+
+class UndrawLine(Case):
+
+    name = 'undraw_line'
+
+    def setup(self, chart, xs, ys):
+        ensure_drawn(chart, xs, ys, self.renderer)
+
+    def run(self, chart):
+        chart.undraw_line(SERIES)
+
+
+class Focus(Case):
+
+    name = 'focus'
+
+    def setup(self, chart, xs, ys):
+        ensure_drawn(chart, xs, ys, self.renderer)
+        ensure_drawn(chart, xs, ys, self.renderer, OTHER, OTHER_COLOR)
+        chart.unfocus()
+
+    def run(self, chart):
+        chart.focus(SERIES)
+
+
+class TouchDown(Case):
+    """
+    Touch on the middle point of the series: hit testing and the tooltip.
+    """
+
+    name = 'touch_down'
+
+    def setup(self, chart, xs, ys):
+        ensure_drawn(chart, xs, ys, self.renderer)
+        chart.tooltip.dismiss()
+        x, y = chart.dot_info[SERIES][len(xs) // 2]['pos']
+        self.touch = BenchmarkTouch(*chart.to_window(x, y))
+
+    def run(self, chart):
+        chart.on_touch_down(self.touch)
+
+
+class MarkerMove(Case):
+
+    name = 'marker_move'
+
+    def setup(self, chart, xs, ys):
+        ensure_drawn(chart, xs, ys, self.renderer)
+        count = len(xs)
+        self.index = count // 4 if chart.marker.selected_index == count // 2 else count // 2
+
+    def run(self, chart):
+        chart.marker.move(self.index)
+
+
+CASES = {case.name: case for case in (DrawLine, Resize, UndrawLine, Focus, TouchDown, MarkerMove)}
+'''
+Case classes by name, in the order they run.
+'''
+
+
+#  ================================= #
+#              Running
+#  ================================= #
+def measure(case, chart, frame, xs, ys, repeat):
+    """
+    Runs `case` `repeat` times, after one untimed warm-up run, and returns
+    its metrics. Each run renders one frame of `frame`.
+    """
+
+    def run():
+        case.run(chart)
+        frame.draw()
+
+    case.setup(chart, xs, ys)
+    run()
+
+    times = []
+    for _ in range(repeat):
+        case.setup(chart, xs, ys)
+        gc.collect()
+        gc.disable()
+        try:
+            start = perf_counter()
+            run()
+            times.append(perf_counter() - start)
+        finally:
+            gc.enable()
+
+    case.setup(chart, xs, ys)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'wall_ms': round(median(times) * 1000, 4),
+        'wall_min_ms': round(min(times) * 1000, 4),
+        'instructions': count_instructions(chart.canvas),
+        'peak_bytes': peak,
+    }
+
+
+def run_benchmarks(sizes=SIZES, cases=None, repeat=5, decimation=None, seed=0, report=None, renderer='smooth'):
+    """
+    Runs the `cases` (names from :data:`CASES`, all by default) on a random
+    walk of each of the `sizes` and returns the results as a JSON-ready
+    dict with a `meta` and a `cases` section, the latter keyed by case name
+    and then by size.
+
+    `decimation` is passed to the charts and `renderer` to
+    :meth:`~core.charts.linechart.CoreLineChart.draw_line`. `report`, if
+    given, is called with `(case, size, metrics)` as each measurement
+    completes.
+    """
+
+    names = list(CASES) if cases is None else list(cases)
+    for name in names:
+        if name not in CASES:
+            raise ValueError(f"Unknown benchmark case {name!r}; expected one of {tuple(CASES)}.")
+
+    results = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'kivy': kivy.__version__,
+            'numpy': np.__version__ if np is not None else None,
+            'window': type(Window).__name__,
+            'chart_size': list(CHART_SIZE),
+            'decimation': decimation,
+            'renderer': renderer,
+            'repeat': repeat,
+            'seed': seed,
+        },
+        'cases': {name: {} for name in names},
+    }
+
+    for size in sizes:
+        xs, ys = random_walk(size, seed)
+        chart = make_chart(xs, ys, decimation)
+        frame = make_frame(chart)
+
+        for name in names:
+            metrics = measure(CASES[name](renderer), chart, frame, xs, ys, repeat)
+            results['cases'][name][str(size)] = metrics
+            if report is not None:
+                report(name, size, metrics)
+
+        chart.clear_lines()
+        frame.remove(chart.canvas)
+
+    return results
@@ -0,0 +1,13 @@
+"""
+Charts/NumPy
+============
+
+NumPy is an optional dependency of the charts, installed with the `numpy`
+extra (`pip install kivycore[numpy]`). Chart modules import :data:`np`
+from here and fall back to plain Python buffers when it is `None`.
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
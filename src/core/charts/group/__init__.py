@@ -0,0 +1 @@
+from .group import ChartGroup
\ No newline at end of file
@@ -0,0 +1,161 @@
+"""
+Charts/Group
+============
+
+Keeps the markers of several :class:`~core.charts.linechart.CoreLineChart`
+in sync along a shared x axis.
+
+When the marker of one chart moves, the others follow to the nearest x on
+the next frame, in one batch. Charts whose first series hold the same x
+values share their nearest index lookup, matched by the
+:attr:`~core.charts.linechart.buffers.ColumnBuffer.fingerprint` of their
+x columns, which each chart computes once per data change. Charts in the `'interpolate'`
+:attr:`~core.charts.linechart.CoreLineChart.cursor_mode` follow to the
+exact x instead and report their interpolated values. A single
+`on_cursor_items` event then reports the items of every chart.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+
+from kivy.clock import Clock
+from kivy.event import EventDispatcher
+from kivy.properties import ListProperty
+
+from core.charts._np import np
+
+
+def nearest_value_index(values, x):
+    """
+    Returns the index of the value of the sorted `values` closest to `x`.
+    """
+
+    count = len(values)
+    if np is not None:
+        i = int(np.searchsorted(values, x, side='left'))
+    else:
+        i = bisect_left(values, x)
+
+    if i >= count:
+        return count - 1
+    if i > 0 and x - values[i - 1] <= values[i] - x:
+        return i - 1
+    return i
+
+
+class ChartGroup(EventDispatcher):
+
+    charts = ListProperty()
+    '''
+    `charts` lists the synchronized charts.
+
+    :attr:`charts` is a :class:`~kivy.properties.ListProperty`
+    '''
+
+    __events__ = ('on_cursor_items', )
+
+    def __init__(self, charts=(), **kwargs):
+        super().__init__(**kwargs)
+
+        self._pending = None
+        self._flush_trigger = Clock.create_trigger(self.flush, -1)
+
+        for chart in charts:
+            self.add_chart(chart)
+
+    def add_chart(self, chart):
+        if chart in self.charts:
+            return
+
+        self.charts.append(chart)
+        chart.fbind('on_cursor_items', self.on_chart_cursor, chart)
+
+    def remove_chart(self, chart):
+        if chart in self.charts:
+            self.charts.remove(chart)
+            chart.funbind('on_cursor_items', self.on_chart_cursor, chart)
+
+    def get_x_column(self, chart):
+        """
+        Returns the x :class:`~core.charts.linechart.buffers.ColumnBuffer` of
+        the first series of `chart`, or `None`.
+        """
+
+        for instructions in chart.line_instructions.values():
+            column = instructions['data'].xs
+            return column if len(column) else None
+        return None
+
+    def get_x_values(self, chart):
+        """
+        Returns the x data of the first series of `chart`, or `None`.
+        """
+
+        column = self.get_x_column(chart)
+        return None if column is None else column.values
+
+    def on_chart_cursor(self, chart, instance, items):
+        # Only user-driven selections are dispatched by the charts; the
+        # markers moved by `flush` stay silent.
+        if chart.cursor_mode == 'interpolate':
+            if chart.cursor_x is not None:
+                self.select_x(chart.cursor_x, origin=chart)
+            return
+
+        xs = self.get_x_values(chart)
+        if xs is None or chart.marker is None:
+            return
+
+        index = chart.marker.selected_index
+        if 0 <= index < len(xs):
+            self.select_x(float(xs[index]), origin=chart)
+
+    def select_x(self, x, origin=None):
+        """
+        Moves the marker of every chart to the point nearest to the data
+        value `x` on the next frame. The marker of `origin`, if given, is
+        left where it is.
+        """
+
+        self._pending = (x, origin)
+        self._flush_trigger()
+
+    def flush(self, *args):
+        """
+        Applies the pending selection to all charts at once and dispatches
+        `on_cursor_items` with the items of every chart, by chart.
+        """
+
+        if self._pending is None:
+            return
+        x, origin = self._pending
+        self._pending = None
+
+        lookups = {}
+        items = {}
+        for chart in self.charts:
+            if chart.cursor_mode == 'interpolate':
+                if chart is not origin:
+                    chart.place_cursor_x(x)
+                items[chart] = chart.get_crosshair_items(x)
+                continue
+
+            marker = chart.marker
+            column = self.get_x_column(chart)
+            if marker is None or column is None:
+                continue
+
+            if chart is not origin:
+                key = column.fingerprint
+                index = lookups.get(key)
+                if index is None:
+                    index = lookups[key] = nearest_value_index(column.values, x)
+                marker.move(index, dispatch=False)
+
+            items[chart] = marker.get_items(marker.selected_index)
+
+        self.dispatch('on_cursor_items', items)
+
+    def on_cursor_items(self, items):
+        pass
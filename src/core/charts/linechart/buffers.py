@@ -0,0 +1,144 @@
+"""
+Charts/Buffers
+==============
+
+Growable float columns used to store series data.
+
+A :class:`ColumnBuffer` either grows without bound or, when a `capacity`
+is given, behaves as a rolling window that drops its oldest values as new
+ones arrive. Values are always exposed as one contiguous block so they can
+be projected and drawn without reordering.
+"""
+
+from __future__ import annotations
+
+import zlib
+from array import array
+
+from core.charts._np import np
+
+
+class ColumnBuffer:
+
+    __slots__ = ('capacity', '_data', '_start', '_end', '_fingerprint')
+
+    def __init__(self, values, capacity=None):
+        self.capacity = capacity
+
+        if capacity is not None:
+            values = values[-capacity:] if len(values) > capacity else values
+
+        count = len(values)
+        if np is not None:
+            size = max(count, 2 * capacity if capacity is not None else count, 16)
+            self._data = np.empty(size, dtype=np.float64)
+            self._data[:count] = values
+        else:
+            self._data = array('d', values)
+
+        self._start = 0
+        self._end = count
+        self._fingerprint = None
+
+    @classmethod
+    def wrap(cls, values):
+        """
+        Returns an unbounded buffer over the float64 `values` without copying
+        them. The buffer moves to storage of its own once it needs to grow.
+        """
+
+        buffer = cls.__new__(cls)
+        buffer.capacity = None
+        buffer._data = values
+        buffer._start = 0
+        buffer._end = len(values)
+        buffer._fingerprint = None
+        return buffer
+
+    def __len__(self):
+        return self._end - self._start
+
+    @property
+    def nbytes(self):
+        """
+        Bytes allocated for the column, including room reserved for growth.
+        """
+
+        return len(self._data) * self._data.itemsize
+
+    @property
+    def values(self):
+        """
+        The stored values, oldest first.
+
+        With NumPy this is a view into the buffer and stays valid until the
+        next call to :meth:`extend`.
+        """
+
+        if np is not None:
+            return self._data[self._start:self._end]
+        return self._data
+
+    @property
+    def fingerprint(self):
+        """
+        `(length, CRC-32 of the values)`, computed on first access and
+        again after :meth:`extend`. Columns with equal fingerprints hold the
+        same values, barring a checksum collision.
+        """
+
+        if self._fingerprint is None:
+            values = self.values
+            if np is not None:
+                values = np.ascontiguousarray(values)
+            self._fingerprint = (len(values), zlib.crc32(memoryview(values).cast('B')))
+        return self._fingerprint
+
+    def extend(self, values):
+        """
+        Appends `values` and returns how many of the oldest values were
+        dropped to stay within :attr:`capacity`.
+        """
+
+        self._fingerprint = None
+        count = len(values)
+        capacity = self.capacity
+
+        if capacity is not None and count > capacity:
+            values = values[-capacity:]
+            count = capacity
+
+        dropped = 0
+        if capacity is not None:
+            dropped = max(0, len(self) + count - capacity)
+
+        if np is None:
+            if dropped:
+                del self._data[:dropped]
+            self._data.extend(values)
+            self._end = len(self._data)
+            return dropped
+
+        self._start += dropped
+        if self._end + count > len(self._data):
+            self._reserve(count)
+
+        self._data[self._end:self._end + count] = values
+        self._end += count
+        return dropped
+
+    def _reserve(self, count):
+        length = len(self)
+        size = len(self._data)
+
+        if self.capacity is None and length + count > size // 2:
+            size = max(size * 2, length + count)
+            data = np.empty(size, dtype=np.float64)
+        else:
+            # Rolling window: slide the live values back to the front.
+            data = self._data
+
+        data[:length] = self._data[self._start:self._end]
+        self._data = data
+        self._start = 0
+        self._end = length
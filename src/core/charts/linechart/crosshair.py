@@ -0,0 +1,76 @@
+"""
+Charts/Crosshair
+================
+
+Values of every series at one x, for a crosshair readout.
+
+Series may be sampled at different x values, so each one is searched on
+its own sorted x column and its y linearly interpolated between the two
+points around the cursor. The series of a table share their x column: it
+is searched once and all of their columns are interpolated in one pass.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+
+from core.charts._np import np
+
+
+def locate(xs, x):
+    """
+    Returns `(i, t)` such that `x` lies at the fraction `t` of the way from
+    `xs[i]` to `xs[i + 1]`, or `None` when `x` is outside the sorted `xs`.
+    An exact match on the last value gives `t == 0`.
+    """
+
+    count = len(xs)
+    if not count or not xs[0] <= x <= xs[count - 1]:
+        return None
+
+    if np is not None:
+        i = int(np.searchsorted(xs, x, side='left'))
+    else:
+        i = bisect_left(xs, x)
+
+    if xs[i] == x:
+        return i, 0.0
+
+    x0, x1 = float(xs[i - 1]), float(xs[i])
+    return i - 1, (x - x0) / (x1 - x0)
+
+
+def interpolate(xs, ys, x):
+    """
+    Returns the y of the series `xs`/`ys` at `x`, or `None` outside it.
+    """
+
+    found = locate(xs, x)
+    if found is None:
+        return None
+
+    i, t = found
+    y0 = float(ys[i])
+    return y0 if t == 0 else y0 + t * (float(ys[i + 1]) - y0)
+
+
+def interpolate_columns(xs, columns, x):
+    """
+    Returns the y of each column of `columns` sharing the x column `xs` at
+    `x`, or `None` outside it. `xs` is searched once.
+    """
+
+    found = locate(xs, x)
+    if found is None:
+        return None
+
+    i, t = found
+    if np is not None:
+        if t == 0:
+            return np.fromiter((column[i] for column in columns), dtype=np.float64, count=len(columns)).tolist()
+        pairs = np.array([column[i:i + 2] for column in columns], dtype=np.float64)
+        return (pairs[:, 0] + t * (pairs[:, 1] - pairs[:, 0])).tolist()
+
+    if t == 0:
+        return [float(column[i]) for column in columns]
+    return [column[i] + t * (column[i + 1] - column[i]) for column in columns]
@@ -0,0 +1,129 @@
+"""
+Charts/Decimation
+=================
+
+Level-of-detail reduction for line series.
+
+Every function returns the sorted indices of the points to keep, so callers
+can slice the data columns and their pixel projections alike while the
+full-resolution series stays untouched. Both modes expect the series to be
+sorted by x.
+"""
+
+from __future__ import annotations
+
+from core.charts._np import np
+
+
+def lttb_indices(xs, ys, threshold):
+    """
+    Largest-Triangle-Three-Buckets: keeps `threshold` points that best
+    preserve the visual shape of the series.
+    """
+
+    count = len(xs)
+    threshold = int(threshold)
+    if threshold >= count or threshold < 3:
+        return range(count)
+
+    every = (count - 2) / (threshold - 2)
+    selected = [0]
+    a = 0
+
+    for i in range(threshold - 2):
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, count)
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+
+        if np is not None:
+            avg_x = xs[avg_start:avg_end].mean()
+            avg_y = ys[avg_start:avg_end].mean()
+            ax, ay = xs[a], ys[a]
+            area = np.abs(
+                (ax - avg_x) * (ys[start:end] - ay) - (ax - xs[start:end]) * (avg_y - ay)
+            )
+            a = start + int(area.argmax())
+        else:
+            span = avg_end - avg_start
+            avg_x = sum(xs[avg_start:avg_end]) / span
+            avg_y = sum(ys[avg_start:avg_end]) / span
+            ax, ay = xs[a], ys[a]
+            best, best_area = start, -1.0
+            for j in range(start, end):
+                area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+                if area > best_area:
+                    best, best_area = j, area
+            a = best
+
+        selected.append(a)
+
+    selected.append(count - 1)
+    return selected
+
+
+def minmax_indices(px, ys, origin=0.0):
+    """
+    Keeps the lowest and highest point of every pixel column, plus the
+    first and last point of the series.
+
+    `px` holds the projected x pixel positions of the series.
+    """
+
+    count = len(px)
+    if count < 3:
+        return range(count)
+
+    if np is not None:
+        columns = np.floor(np.asarray(px) - origin).astype(np.int64)
+        starts = np.flatnonzero(np.diff(columns)) + 1
+        if len(starts) * 2 + 2 >= count:
+            return range(count)
+
+        starts = np.concatenate(([0], starts))
+        ends = np.concatenate((starts[1:], [count]))
+        order = np.lexsort((ys, columns))
+        keep = np.concatenate((order[starts], order[ends - 1], [0, count - 1]))
+        return np.unique(keep)
+
+    keep = {0, count - 1}
+    column = None
+    low = high = 0
+    for i in range(count):
+        current = int((px[i] - origin) // 1)
+        if current != column:
+            if column is not None:
+                keep.add(low)
+                keep.add(high)
+            column, low, high = current, i, i
+        elif ys[i] < ys[low]:
+            low = i
+        elif ys[i] > ys[high]:
+            high = i
+    keep.add(low)
+    keep.add(high)
+
+    if len(keep) >= count:
+        return range(count)
+    return sorted(keep)
+
+
+def decimate(mode, xs, ys, px, origin, width, factor=2):
+    """
+    Returns the indices kept by `mode` (`'lttb'` or `'minmax'`) for a series
+    drawn across `width` pixels, or `None` when nothing needs to be dropped.
+    """
+
+    if mode is None or len(xs) <= width * factor:
+        return None
+
+    if mode == 'lttb':
+        indices = lttb_indices(xs, ys, width * factor)
+    elif mode == 'minmax':
+        indices = minmax_indices(px, ys, origin)
+    else:
+        raise ValueError(f"Unknown decimation mode {mode!r}.")
+
+    if isinstance(indices, range):
+        return None
+    return indices
@@ -0,0 +1,148 @@
+"""
+Charts/Dots
+===========
+
+Batched dot rendering for line series.
+
+Instead of one :class:`~kivy.graphics.Ellipse` per point, the dots of a
+series are drawn as textured quads packed into a few
+:class:`~kivy.graphics.Mesh` instructions. A mesh indexes its vertices
+with 16 bits, so each one holds up to :data:`DOTS_PER_MESH` dots.
+"""
+
+from __future__ import annotations
+
+from array import array
+
+from kivy.graphics import Mesh
+from kivy.graphics.texture import Texture
+
+from core.charts._np import np
+
+
+DOTS_PER_MESH = 65536 // 4
+'''
+Maximum number of dots per mesh (4 vertices each, 16-bit indices).
+'''
+
+DOT_TEXTURE_SIZE = 64
+
+_texture = None
+_indices = {}
+
+
+def get_dot_texture():
+    """
+    Returns the shared white disc texture the dot quads are mapped with.
+    """
+
+    global _texture
+
+    if _texture is None:
+        _texture = Texture.create(size=(DOT_TEXTURE_SIZE, DOT_TEXTURE_SIZE), colorfmt='rgba')
+        _texture.add_reload_observer(_blit_dot_texture)
+        _blit_dot_texture(_texture)
+    return _texture
+
+
+def _blit_dot_texture(texture):
+    size = DOT_TEXTURE_SIZE
+    center = (size - 1) / 2
+    radius = size / 2
+    pixels = bytearray(size * size * 4)
+
+    for row in range(size):
+        for column in range(size):
+            distance = ((row - center) ** 2 + (column - center) ** 2) ** 0.5
+            # One texel of antialiasing along the rim.
+            alpha = max(0.0, min(1.0, radius - distance))
+            offset = (row * size + column) * 4
+            pixels[offset:offset + 4] = (255, 255, 255, int(alpha * 255))
+
+    texture.blit_buffer(bytes(pixels), colorfmt='rgba', bufferfmt='ubyte')
+
+
+def get_dot_indices(count):
+    """
+    Returns the triangle indices for `count` quads, cached per count.
+    """
+
+    indices = _indices.get(count)
+    if indices is None:
+        if np is not None:
+            base = (np.arange(count, dtype=np.uint16) * 4)[:, None]
+            indices = (base + np.array([0, 1, 2, 2, 3, 0], dtype=np.uint16)).ravel()
+        else:
+            indices = array('H')
+            for i in range(0, count * 4, 4):
+                indices.extend((i, i + 1, i + 2, i + 2, i + 3, i))
+
+        if len(_indices) > 8:
+            _indices.clear()
+        _indices[count] = indices
+    return indices
+
+
+def dot_vertices(points, radius):
+    """
+    Returns the quad vertices (`x, y, u, v` per corner) for the flat
+    `[x0, y0, x1, y1, ...]` point list `points`.
+    """
+
+    if np is not None:
+        centers = np.asarray(points, dtype=np.float32).reshape(-1, 2)
+        vertices = np.empty((len(centers), 4, 4), dtype=np.float32)
+        vertices[:, :, 0:2] = centers[:, None, :]
+        vertices[:, :, 0:2] += np.array(
+            [[-radius, -radius], [radius, -radius], [radius, radius], [-radius, radius]],
+            dtype=np.float32
+        )
+        vertices[:, :, 2:4] = np.array([[0, 0], [1, 0], [1, 1], [0, 1]], dtype=np.float32)
+        return vertices.ravel()
+
+    vertices = array('f')
+    for i in range(0, len(points), 2):
+        x, y = points[i], points[i + 1]
+        vertices.extend((
+            x - radius, y - radius, 0, 0,
+            x + radius, y - radius, 1, 0,
+            x + radius, y + radius, 1, 1,
+            x - radius, y + radius, 0, 1,
+        ))
+    return vertices
+
+
+def layout_dot_meshes(group, meshes, points, radius):
+    """
+    Updates the dot meshes of a series in place so they draw a dot of
+    `radius` at each point of `points`.
+
+    Existing meshes are reused; only missing ones are created and extra
+    ones removed from `group`. Nothing is drawn when `radius` is 0.
+    """
+
+    count = len(points) // 2 if radius > 0 else 0
+    chunks = (count + DOTS_PER_MESH - 1) // DOTS_PER_MESH
+
+    while len(meshes) > chunks:
+        group.remove(meshes.pop())
+
+    if not count:
+        return
+
+    vertices = dot_vertices(points, radius)
+    texture = get_dot_texture()
+    floats = DOTS_PER_MESH * 16
+
+    for chunk in range(chunks):
+        chunk_vertices = vertices[chunk * floats:(chunk + 1) * floats]
+        indices = get_dot_indices(len(chunk_vertices) // 16)
+
+        if chunk < len(meshes):
+            mesh = meshes[chunk]
+            mesh.vertices = chunk_vertices
+            mesh.indices = indices
+        else:
+            mesh = Mesh(vertices=chunk_vertices, indices=indices, mode='triangles', texture=texture)
+            group.add(mesh)
+            meshes.append(mesh)
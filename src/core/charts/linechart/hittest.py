@@ -0,0 +1,160 @@
+"""
+Charts/Hit Testing
+==================
+
+Per-series index answering "which point is under this position" in
+logarithmic time.
+
+The projected points of a series are kept sorted by their x pixel, so a
+lookup only bisects to the window `[x - tolerance, x + tolerance]` and scans
+the candidates inside it.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from core.charts._np import np
+
+
+class SeriesIndex:
+
+    __slots__ = ('px', 'py', 'order', 'offset')
+
+    def __init__(self, px, py, offset=0, indices=None):
+        """
+        Indexes the points `px`/`py`. When they are a slice of the series
+        starting at `offset`, or a subset whose series indices are
+        `indices`, returned indices still refer to the series.
+        """
+
+        if np is not None:
+            px = np.asarray(px, dtype=np.float64)
+            py = np.asarray(py, dtype=np.float64)
+            order = None
+            if len(px) > 1 and not bool(np.all(px[1:] >= px[:-1])):
+                order = np.argsort(px, kind='stable')
+                px, py = px[order], py[order]
+        else:
+            order = None
+            if any(px[i] > px[i + 1] for i in range(len(px) - 1)):
+                order = sorted(range(len(px)), key=px.__getitem__)
+                px = array('d', [px[i] for i in order])
+                py = array('d', [py[i] for i in order])
+
+        if indices is not None:
+            if order is None:
+                order = indices
+            elif np is not None:
+                order = np.asarray(indices)[order]
+            else:
+                order = [indices[i] for i in order]
+
+        self.px = px
+        self.py = py
+        self.order = order
+        self.offset = offset
+
+    def share(self, py):
+        """
+        Returns the index of another series drawn at the same x pixels, with
+        the y pixels `py`. The sorted x column and its order are shared.
+        """
+
+        index = SeriesIndex.__new__(SeriesIndex)
+        index.px = self.px
+        index.order = self.order
+        index.offset = self.offset
+        if self.order is None:
+            index.py = py
+        elif np is not None:
+            index.py = np.asarray(py, dtype=np.float64)[self.order]
+        else:
+            index.py = array('d', [py[i] for i in self.order])
+        return index
+
+    def __len__(self):
+        return len(self.px)
+
+    def nearest_x(self, x):
+        """
+        Returns the index of the point whose x pixel is closest to `x`, or
+        `None` for an empty series. Ties go to the leftmost point.
+        """
+
+        count = len(self.px)
+        if not count:
+            return None
+
+        if np is not None:
+            i = int(np.searchsorted(self.px, x, side='left'))
+        else:
+            i = bisect_left(self.px, x)
+
+        if i >= count:
+            i = count - 1
+        elif i > 0 and x - self.px[i - 1] <= self.px[i] - x:
+            i -= 1
+
+        if self.order is not None:
+            i = int(self.order[i])
+        return i + self.offset
+
+    def nearest(self, x, y, tolerance, scale_x=1.0, scale_y=1.0, bounds=None):
+        """
+        Returns `(index, distance)` of the point closest to `(x, y)` whose
+        offset on both axes is within `tolerance`, or `None`.
+
+        When the indexed pixels are drawn through a scale, `scale_x` and
+        `scale_y` give it so `tolerance` and the distance are measured in
+        screen pixels. `bounds` (`(x0, y0, x1, y1)` in indexed pixels)
+        excludes points outside a visible area. `index` refers to the
+        original order of the series.
+        """
+
+        tolerance_x = tolerance / abs(scale_x)
+        tolerance_y = tolerance / abs(scale_y)
+        low, high = x - tolerance_x, x + tolerance_x
+        if bounds is not None:
+            low, high = max(low, bounds[0]), min(high, bounds[2])
+
+        if np is not None:
+            start = int(np.searchsorted(self.px, low, side='left'))
+            end = int(np.searchsorted(self.px, high, side='right'))
+            if start >= end:
+                return None
+
+            py = self.py[start:end]
+            dx = (self.px[start:end] - x) * scale_x
+            dy = (py - y) * scale_y
+            distance = dx * dx + dy * dy
+            distance[np.abs(py - y) > tolerance_y] = np.inf
+            if bounds is not None:
+                distance[(py < bounds[1]) | (py > bounds[3])] = np.inf
+            best = int(distance.argmin())
+            if distance[best] == np.inf:
+                return None
+            best_distance = float(distance[best])
+            best += start
+        else:
+            start = bisect_left(self.px, low)
+            end = bisect_right(self.px, high)
+            best, best_distance = None, None
+            for i in range(start, end):
+                py = self.py[i]
+                if abs(py - y) > tolerance_y:
+                    continue
+                if bounds is not None and not bounds[1] <= py <= bounds[3]:
+                    continue
+                dx = (self.px[i] - x) * scale_x
+                dy = (py - y) * scale_y
+                distance = dx * dx + dy * dy
+                if best is None or distance < best_distance:
+                    best, best_distance = i, distance
+            if best is None:
+                return None
+
+        if self.order is not None:
+            best = int(self.order[best])
+        return best + self.offset, best_distance ** 0.5
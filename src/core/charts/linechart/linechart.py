@@ -2,11 +2,33 @@ from __future__ import annotations
 from typing import Callable, Type
 
 import random
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from concurrent.futures import CancelledError
+from functools import partial
+from time import perf_counter
 
-from kivy.uix.label import CoreLabel
 from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.logger import Logger
+from kivy.vector import Vector
 from kivy.uix.relativelayout import RelativeLayout
-from kivy.graphics import Color, Line, Rectangle, SmoothLine, Ellipse
+from kivy.graphics import (
+    Canvas,
+    Color,
+    Line,
+    Rectangle,
+    SmoothLine,
+    InstructionGroup,
+    PushMatrix,
+    PopMatrix,
+    Translate,
+    Scale,
+    StencilPush,
+    StencilUse,
+    StencilUnUse,
+    StencilPop
+)
 from kivy.properties import (
     ListProperty,
     NumericProperty,
@@ -24,6 +46,52 @@ from kivy.properties import (
 from core.effects import Style
 from core.charts.marker import Marker
 from core.charts.tooltip import Tooltip
+from core.charts.linechart.projection import (
+    to_columns,
+    to_table,
+    project,
+    interleave,
+    interleave_buffer,
+    take,
+    axis_transform,
+    visible_slice
+)
+from core.charts.linechart.decimation import decimate
+from core.charts.linechart.series import SeriesData, SharedX, DotInfoView
+from core.charts.linechart.hittest import SeriesIndex
+from core.charts.linechart.texturecache import tick_label_cache
+from core.charts.linechart.ticks import layout_ticks, tick_layout_cache
+from core.charts.linechart.dots import layout_dot_meshes
+from core.charts.linechart.loader import get_executor, prepare_series
+from core.charts.linechart.pyramid import MinMaxPyramid
+from core.charts.linechart.meshline import MeshLine
+from core.charts.linechart.crosshair import interpolate, interpolate_columns
+
+FULL_REDRAW = frozenset(('grid', 'axes', 'overlay', 'series'))
+'''
+Layers rebuilt by :meth:`CoreLineChart.redraw`.
+'''
+
+TICK_FONT_SIZE = 11
+
+RENDERERS = {'smooth': SmoothLine, 'mesh': MeshLine}
+'''
+Line instructions a series can be drawn with, by `renderer` name.
+'''
+
+SMOOTH_LINE_MAX_POINTS = 16384
+'''
+Most points drawn with a :class:`~kivy.graphics.SmoothLine`. Past this,
+its 16-bit vertex indices overflow and Kivy crashes, so longer lines are
+drawn with a :class:`~core.charts.linechart.meshline.MeshLine` instead.
+'''
+
+REFINE_CHUNK = 65536
+'''
+Points projected, decimated and built into vertices per step when a large
+series is refined progressively (see :attr:`CoreLineChart.progressive`).
+'''
+
 
 class CoreLineChart(Style, RelativeLayout):
 
@@ -47,11 +115,28 @@ class CoreLineChart(Style, RelativeLayout):
 
     x_ticks = NumericProperty(12)
     '''
-    `x_ticks`
+    `x_ticks` is the maximum number of intervals between x ticks. Ticks
+    fall on the nicest step that stays within it.
 
     :attr:`x_ticks` is a :class:`~kivy.properties.NumericProperty`
     '''
 
+    x_tick_mode = OptionProperty('linear', options=('linear', 'time'))
+    '''
+    `x_tick_mode` is `'time'` when x values are timestamps in seconds
+    since the epoch: ticks then fall on whole seconds, minutes, hours or
+    days and are labeled as UTC times or dates.
+
+    :attr:`x_tick_mode` is a :class:`~kivy.properties.OptionProperty`
+    '''
+
+    x_formatter: Callable | None = ObjectProperty(None, allownone=True)
+    '''
+    `x_formatter`
+
+    :attr:`x_formatter` is a callable that formats the x-axis values.
+    '''
+
     x_axis_color = ColorProperty([0, 0, 0, 1])
     '''
     `x_axis_color`
@@ -96,7 +181,7 @@ class CoreLineChart(Style, RelativeLayout):
     
     y_ticks = NumericProperty(16)
     '''
-    `y_ticks`
+    `y_ticks` is the maximum number of intervals between y ticks.
 
     :attr:`y_ticks` is a :class:`~kivy.properties.NumericProperty`
     '''
@@ -192,6 +277,31 @@ class CoreLineChart(Style, RelativeLayout):
     :attr:`ticks_color` is an :class:`~kivy.properties.AliasProperty`
     '''
 
+    tick_label_gap = NumericProperty(8)
+    '''
+    `tick_label_gap` is the smallest distance kept between two tick labels
+    of an axis. Labels closer than that to the previous one are dropped.
+
+    :attr:`tick_label_gap` is a :class:`~kivy.properties.NumericProperty`
+    '''
+
+    tick_layouts = ObjectProperty(tick_layout_cache)
+    '''
+    `tick_layouts` is the :class:`~core.charts.linechart.ticks.TickLayoutCache`
+    axis layouts are memoized in. Charts share one cache by default.
+
+    :attr:`tick_layouts` is a :class:`~kivy.properties.ObjectProperty`
+    '''
+
+    label_cache = ObjectProperty(tick_label_cache)
+    '''
+    `label_cache` is the :class:`~core.charts.linechart.texturecache.TextureCache`
+    tick labels are rendered through. Charts share one cache by default;
+    its `hits`/`misses` counters show how often labels are reused.
+
+    :attr:`label_cache` is a :class:`~kivy.properties.ObjectProperty`
+    '''
+
     # ================================= #
     # Info
     # ================================= #
@@ -244,6 +354,15 @@ class CoreLineChart(Style, RelativeLayout):
     :attr:`tooltip_background_color` is a :class:`~kivy.properties.ColorProperty`
     '''
 
+    tooltip_all_series = BooleanProperty(False)
+    '''
+    `tooltip_all_series` makes the tooltip list the value of every series at
+    the index of the point hit, like the items of `on_cursor_items`, instead
+    of that point alone.
+
+    :attr:`tooltip_all_series` is a :class:`~kivy.properties.BooleanProperty`
+    '''
+
     marker: Type[Marker] = ObjectProperty(None)
     '''
     `marker`
@@ -265,11 +384,50 @@ class CoreLineChart(Style, RelativeLayout):
     :attr:`marker_background_color` is a :class:`~kivy.properties.ColorProperty`
     '''
 
-    dot_info: dict[str, dict] = DictProperty()
+    marker_snap_while_dragging = BooleanProperty(False)
+    '''
+    `marker_snap_while_dragging` makes the marker update its selected index and
+    dispatch `on_cursor_items` continuously while it is dragged.
+
+    :attr:`marker_snap_while_dragging` is a :class:`~kivy.properties.BooleanProperty`
     '''
-    `dot_info`
 
-    :attr:`dot_info` is a :class:`~kivy.properties.ListProperty`
+    cursor_mode = OptionProperty('index', options=('index', 'interpolate'))
+    '''
+    `cursor_mode` selects the items reported by `on_cursor_items`.
+
+    With `'index'`, the marker snaps to the points of the first series and
+    every series reports its point at the same index, which assumes they
+    share their x values. With `'interpolate'`, the marker moves freely and
+    every series reports its y linearly interpolated at the cursor x, so
+    series sampled at different x values read correctly. Items are then
+    reported once per frame while the marker is dragged.
+
+    :attr:`cursor_mode` is a :class:`~kivy.properties.OptionProperty`
+    '''
+
+    cursor_x = NumericProperty(None, allownone=True)
+    '''
+    `cursor_x` is the data x of the crosshair in `'interpolate'`
+    :attr:`cursor_mode`, `None` until it is placed.
+
+    :attr:`cursor_x` is a :class:`~kivy.properties.NumericProperty`
+    '''
+
+    def get_dot_info(self):
+        return self._dot_info
+
+    dot_info: Mapping = AliasProperty(get_dot_info)
+    '''
+    `dot_info` maps each series name to the sequence of its points, each
+    given as `{'data': (x, y), 'pos': (px, py)}` with `pos` in chart-local
+    pixels.
+
+    It is a read-only view over the columnar series store (see
+    :mod:`core.charts.linechart.series`); the point dicts are built on
+    access.
+
+    :attr:`dot_info` is a :class:`~kivy.properties.AliasProperty`
     '''
 
     dot_radius = NumericProperty(0)
@@ -279,6 +437,46 @@ class CoreLineChart(Style, RelativeLayout):
     :attr:`dot_radius` is a :class:`~kivy.properties.NumericProperty`
     '''
 
+    decimation = OptionProperty(None, options=('lttb', 'minmax'), allownone=True)
+    '''
+    `decimation` selects how series are reduced to what the grid can show:
+    `'lttb'` (largest-triangle-three-buckets), `'minmax'` (lowest and highest
+    point per pixel column) or `None` to draw every point. Series whose x
+    values are not sorted are always drawn in full.
+
+    :attr:`decimation` is a :class:`~kivy.properties.OptionProperty`
+    '''
+
+    decimation_factor = NumericProperty(2)
+    '''
+    `decimation_factor` is the number of points per pixel column kept by
+    the `'lttb'` mode and the density above which decimation kicks in.
+
+    :attr:`decimation_factor` is a :class:`~kivy.properties.NumericProperty`
+    '''
+
+    use_pyramid = BooleanProperty(False)
+    '''
+    `use_pyramid` builds a min/max pyramid (see
+    :mod:`core.charts.linechart.pyramid`) for series drawn from then on. They
+    are drawn from the coarsest level that keeps :attr:`decimation_factor`
+    points per pixel column over :attr:`x_range`, instead of being decimated
+    in full. Requires NumPy.
+
+    :attr:`use_pyramid` is a :class:`~kivy.properties.BooleanProperty`
+    '''
+
+    viewport_culling = BooleanProperty(True)
+    '''
+    `viewport_culling` draws only the points of a series sorted by x that
+    fall within :attr:`x_range` widened by :attr:`lazy_window_margin`, plus
+    one boundary point on each side, instead of the whole series. Panning or
+    zooming past that window draws the new one. Unsorted series are always
+    drawn in full.
+
+    :attr:`viewport_culling` is a :class:`~kivy.properties.BooleanProperty`
+    '''
+
     touch_tolerance = NumericProperty(20)
     '''
     `touch_tolerance` is a property that defines the touch tolerance area for interacting with the tooltip
@@ -286,6 +484,31 @@ class CoreLineChart(Style, RelativeLayout):
     :attr:`touch_tolerance` is a :class:`~kivy.properties.NumericProperty`
     '''
 
+    focus_dim = NumericProperty(0.75)
+    '''
+    `focus_dim` is the opacity of the veil, in :attr:`grid_background_color`,
+    drawn over the other series while one is focused. The grid lines and
+    axes are kept above it.
+
+    :attr:`focus_dim` is a :class:`~kivy.properties.NumericProperty`
+    '''
+
+    hover_focus = BooleanProperty(False)
+    '''
+    `hover_focus` focuses the series under the mouse or a moving touch,
+    found with :meth:`hit_test`, and unfocuses when there is none.
+
+    :attr:`hover_focus` is a :class:`~kivy.properties.BooleanProperty`
+    '''
+
+    hover_tooltip = BooleanProperty(False)
+    '''
+    `hover_tooltip` shows the tooltip for the point under the mouse or a
+    moving touch, and dismisses it when there is none.
+
+    :attr:`hover_tooltip` is a :class:`~kivy.properties.BooleanProperty`
+    '''
+
 
     # ================================= # 
     # Grid
@@ -413,6 +636,117 @@ class CoreLineChart(Style, RelativeLayout):
     :attr:`grid_size` is an :class:`~kivy.properties.AliasProperty`
     '''
 
+    # ================================= #
+    # Interaction
+    # ================================= #
+    do_pan = BooleanProperty(False)
+    '''
+    `do_pan` lets the user drag the grid to pan the ranges.
+
+    :attr:`do_pan` is a :class:`~kivy.properties.BooleanProperty`
+    '''
+
+    do_zoom = BooleanProperty(False)
+    '''
+    `do_zoom` lets the user zoom the ranges with the mouse wheel or a pinch.
+
+    :attr:`do_zoom` is a :class:`~kivy.properties.BooleanProperty`
+    '''
+
+    pan_zoom_axes = OptionProperty('x', options=('x', 'y', 'xy'))
+    '''
+    `pan_zoom_axes` selects the ranges affected by panning and zooming.
+
+    :attr:`pan_zoom_axes` is a :class:`~kivy.properties.OptionProperty`
+    '''
+
+    zoom_step = NumericProperty(1.1)
+    '''
+    `zoom_step` is the zoom factor applied per mouse wheel notch.
+
+    :attr:`zoom_step` is a :class:`~kivy.properties.NumericProperty`
+    '''
+
+    transform_settle_delay = NumericProperty(0.2)
+    '''
+    `transform_settle_delay` is the delay, in seconds, after which series
+    shown through a transform are reprojected. Resizes and range changes are
+    first applied as a matrix update per series; the reprojection then
+    restores exact stroke widths and decimation.
+
+    :attr:`transform_settle_delay` is a :class:`~kivy.properties.NumericProperty`
+    '''
+
+    lazy_window_margin = NumericProperty(0.5)
+    '''
+    `lazy_window_margin` is how much data beyond each side of :attr:`x_range`
+    is loaded for lazy series, or drawn for culled ones (see
+    :attr:`viewport_culling`), as a fraction of the visible span. Pans within
+    the margin do not touch the source.
+
+    :attr:`lazy_window_margin` is a :class:`~kivy.properties.NumericProperty`
+    '''
+
+    progressive = BooleanProperty(False)
+    '''
+    `progressive` spreads redraws and large series renders over several
+    frames, within :attr:`frame_budget` per frame. Layers are rebuilt one per
+    step and large series are first shown from a subsample, then refined
+    :data:`REFINE_CHUNK` points per step.
+    `on_render_complete` is dispatched once everything is drawn.
+
+    :attr:`progressive` is a :class:`~kivy.properties.BooleanProperty`
+    '''
+
+    frame_budget = NumericProperty(8)
+    '''
+    `frame_budget` is the time, in milliseconds, progressive rendering may
+    spend per frame. A step is never interrupted, so one step may exceed it.
+
+    :attr:`frame_budget` is a :class:`~kivy.properties.NumericProperty`
+    '''
+
+    # ================================= #
+    # Invalidation
+    # ================================= #
+    invalidation_map = {
+        'size': FULL_REDRAW,
+        'padding': FULL_REDRAW,
+        'x_range': ('x_ticks', 'series'),
+        'y_left_range': ('grid', 'axes', 'series'),
+        'y_right_range': ('grid', 'axes', 'series'),
+        'x_ticks': ('x_ticks', ),
+        'x_tick_mode': ('x_ticks', ),
+        'x_formatter': ('x_ticks', ),
+        'y_ticks': ('grid', 'axes'),
+        'tick_label_gap': ('axes', ),
+        'tick_layouts': ('grid', 'axes'),
+        'y_left_formatter': ('axes', ),
+        'y_right_formatter': ('axes', ),
+        'tick_position': ('axes', ),
+        'x_tick_length': ('axes', ),
+        'y_tick_length': ('axes', ),
+        'y_tick_label_spacing': ('axes', ),
+        'do_axis_x': ('axes', ),
+        'do_axis_y': ('axes', ),
+        'do_x_ticks': ('axes', ),
+        'do_y_ticks': ('axes', ),
+        'label_cache': ('axes', ),
+        'do_grid_x': ('grid', ),
+        'do_grid_y': ('grid', ),
+        'cursor_width': ('overlay', ),
+        'dot_radius': ('dots', ),
+    }
+    '''
+    Maps each property to the layers its changes invalidate: `'grid'`,
+    `'axes'` (axes, ticks and labels), `'x_ticks'` (x ticks, their labels
+    and the x grid lines only), `'overlay'`, `'series'` (series transforms)
+    and `'dots'`. Colors are applied to their :class:`~kivy.graphics.Color`
+    instruction directly.
+
+    The chart is drawn in local coordinates, so `pos` invalidates nothing.
+    '''
+
     # ================================= #
     # References
     # ================================= #
@@ -437,43 +771,302 @@ class CoreLineChart(Style, RelativeLayout):
     '''
 
 
-    __events__ = ('on_cursor_items', )
+    __events__ = ('on_cursor_items', 'on_series_progress', 'on_series_ready', 'on_render_complete')
 
     def __init__(self, **kwargs):
+        # Set before the properties given as kwargs dispatch their handlers.
+        self._hover_bound = False
         super().__init__(**kwargs)
 
-
-        self.trigger = Clock.create_trigger(self.redraw, -1)
+        self.trigger = Clock.create_trigger(self.update_layers, -1)
+        self._dirty = set()
+        self.full_redraws = 0
+        self.partial_redraws = 0
+        self.settle_trigger = Clock.create_trigger(self.settle_series, self.transform_settle_delay)
+        self.rebake_trigger = Clock.create_trigger(self.rebake_series, -1)
+        self.render_trigger = Clock.create_trigger(self.run_render_steps, 0)
+        self._render_steps = deque()
+        self.x_ticks_canvas = None
+        self.x_grid_canvas = None
+        self._scrolling = False
+        self._gesture_touches = []
+        self._pending_cursor_x = None
+        self.cursor_trigger = Clock.create_trigger(self.flush_cursor, -1)
+
+        # Layers, bottom to top. Each one is rebuilt on its own. While a
+        # series is focused, the series layer moves below the grid lines.
+        self.grid_canvas = Canvas()
+        self.grid_lines_canvas = Canvas()
+        self.axes_canvas = Canvas()
+        self.series_canvas = Canvas()
+        self.focus_canvas = Canvas()
+        self.overlay_canvas = Canvas()
+        for layer in (
+            self.grid_canvas, self.grid_lines_canvas, self.axes_canvas,
+            self.series_canvas, self.focus_canvas, self.overlay_canvas
+        ):
+            self.canvas.add(layer)
+        self._hit_index = {}
+        self._dot_info = DotInfoView(self)
+
+        # Async loads: latest generation and pending future per series name.
+        self._load_generations = {}
+        self._pending_loads = {}
+
+        # Series names from bottom to top of the series layer.
+        self._series_order = OrderedDict()
+
+        # Series are stacked in `series_group`. A focused series is moved to
+        # `focus_group`, in a layer above the chrome, and the others are
+        # dimmed by a veil below the grid lines and axes.
+        self.series_group = InstructionGroup()
+        self._dim_color = Color(0, 0, 0, 0)
+        self._dim_rect = Rectangle(pos=self.grid_pos, size=self.grid_size)
+        self.focus_group = InstructionGroup()
+        for instruction in (self.series_group, self._dim_color, self._dim_rect):
+            self.series_canvas.add(instruction)
+        self.focus_canvas.add(self.focus_group)
+
+        # Series are clipped to the grid instead of being clamped to it.
+        self._clip_rects = []
+        for layer in (self.series_canvas, self.focus_canvas):
+            with layer.before:
+                StencilPush()
+                self._clip_rects.append(Rectangle(pos=self.grid_pos, size=self.grid_size))
+                StencilUse()
+
+            with layer.after:
+                StencilUnUse()
+                self._clip_rects.append(Rectangle(pos=self.grid_pos, size=self.grid_size))
+                StencilPop()
+
+        for name, layers in self.invalidation_map.items():
+            self.fbind(name, self.invalidate_property, layers)
 
         self.bind(
-            pos=self.trigger_redraw,
-            size=self.trigger_redraw,
-            x_range=self.trigger_redraw,
-            y_left_range=self.trigger_redraw,
-            y_right_range=self.trigger_redraw
+            decimation=self.rebake_trigger,
+            decimation_factor=self.rebake_trigger,
+            viewport_culling=self.rebake_trigger
         )
 
     #  ================================= # 
     #            Redraw Method
     #  ================================= #          
     def trigger_redraw(self, *args):
-        self.trigger.cancel()
+        self.invalidate(*FULL_REDRAW)
+
+    def invalidate(self, *layers):
+        """
+        Marks `layers` (see :attr:`invalidation_map`) for an update before
+        the next frame. Changes within one frame are coalesced into a single
+        update of the union of their layers.
+        """
+
+        self._dirty.update(layers)
         self.trigger()
 
+    def invalidate_property(self, layers, instance, value):
+        if self._scrolling:
+            return  # scroll_x_range updates what it needs itself
+        self.invalidate(*layers)
+
+    def update_layers(self, *args):
+        """
+        Rebuilds the invalidated layers: through :meth:`redraw` when all of
+        them are dirty or the chart was never drawn, one by one otherwise.
+        Updates are counted in :attr:`full_redraws` and
+        :attr:`partial_redraws`.
+        """
+
+        dirty, self._dirty = self._dirty, set()
+        if not dirty:
+            return
+
+        if FULL_REDRAW <= dirty or self.marker is None:
+            self.redraw()
+            if 'dots' in dirty:
+                self.relayout_dots()
+            return
+
+        self.partial_redraws += 1
+        steps = []
+        if 'grid' in dirty:
+            steps.append((self.draw_grid_layer, ))
+        if 'axes' in dirty:
+            steps.append((self.draw_axes_layer, ))
+            if 'grid' not in dirty:
+                # The x grid lines follow the x ticks rebuilt with the axes.
+                steps.append((self.draw_x_grid_layer, ))
+        elif 'x_ticks' in dirty:
+            steps.append((self.draw_x_ticks_layer, ))
+        if 'overlay' in dirty:
+            steps.append((self.draw_overlay_layer, ))
+        if 'series' in dirty:
+            steps.append((self.draw_series_layer, ))
+        if 'dots' in dirty:
+            steps.append((self.relayout_dots, ))
+
+        if self.progressive:
+            self.queue_render(*steps)
+            return
+
+        for function, *args in steps:
+            function(*args)
+        self.dispatch('on_render_complete')
+
+    def get_redraw_stats(self):
+        """
+        Returns the number of full and partial redraws so far.
+        """
+
+        return {'full': self.full_redraws, 'partial': self.partial_redraws}
+
     def redraw(self, *args):
+        """
+        Redraws the grid, axes and overlay layers and reprojects the series
+        in place. Series are never re-ingested by a redraw.
+
+        With :attr:`progressive`, the grid, axes and series layers are
+        rebuilt over the next frames instead; the cheap overlay is not.
+        """
+
+        self._dirty.difference_update(FULL_REDRAW)
+        self.full_redraws += 1
+
+        if self.progressive:
+            self.queue_render((self.draw_grid_layer, ), (self.draw_axes_layer, ), (self.draw_series_layer, ))
+            self.draw_overlay_layer()
+        else:
+            self.draw_grid_layer()
+            self.draw_axes_layer()
+            self.draw_overlay_layer()
+            self.draw_series_layer()
+
+        if self.marker is None:
+            self.marker = Marker(self)
+            self.marker.bind(center_x=self.on_marker_x)
+            self.add_widget(self.marker)
+
+        if self.tooltip is None:
+            self.tooltip = Tooltip(self)
+            self.add_widget(self.tooltip)
 
-        self.clear_widgets()
-        self.canvas.clear()
-        with self.canvas:
+        self.marker.top = self.grid_y
+        self.marker.center_x = self.grid_x
+        self.place_marker()
+
+        if not self.progressive:
+            self.dispatch('on_render_complete')
+
+    def queue_render(self, *steps):
+        """
+        Appends `steps` to the progressive render queue, run by
+        :meth:`run_render_steps` from the next frame on. Each step is a
+        `(callable, *args)` tuple; steps already queued are not added again.
+        """
+
+        queued = self._render_steps
+        for step in steps:
+            if step not in queued:
+                queued.append(step)
+        self.render_trigger()
+
+    def run_render_steps(self, *args):
+        """
+        Runs queued render steps until :attr:`frame_budget` is spent, then
+        yields to the next frame. Dispatches `on_render_complete` once the
+        queue is empty.
+        """
+
+        deadline = perf_counter() + self.frame_budget / 1000
+        steps = self._render_steps
+        while steps:
+            function, *args = steps.popleft()
+            function(*args)
+            if perf_counter() >= deadline:
+                break
+
+        if steps:
+            self.render_trigger()
+        else:
+            self.dispatch('on_render_complete')
+
+    def render_step(self, name, coarse=False):
+        """
+        Render step of the series `name`, skipped if it was removed since.
+        """
 
+        if name in self.line_instructions:
+            if coarse:
+                self.render_line_coarse(name)
+            elif self.is_coarse(name):
+                steps = self.line_instructions[name]['refine'] = self.refine_line(name)
+                self.refine_step(name, steps)
+            else:
+                self.render_line(name)
+
+    def refine_step(self, name, steps):
+        """
+        Runs the next chunk of the refine `steps` of `name` (see
+        :meth:`refine_line`) and queues the rest ahead of the other steps.
+        Skipped once the series was removed or rendered again.
+        """
+
+        instructions = self.line_instructions.get(name)
+        if instructions is None or instructions['refine'] is not steps:
+            return
+
+        if next(steps, True) is None:
+            self._render_steps.appendleft((self.refine_step, name, steps))
+        else:
+            instructions['refine'] = None
+
+    def render_progressively(self, names):
+        """
+        Queues the render of the series `names`: a coarse pass of every large
+        series first, then the full-resolution renders.
+        """
+
+        names = list(names)
+        self.queue_render(*((self.render_step, name, True) for name in names if self.is_coarse(name)))
+        self.queue_render(*((self.render_step, name) for name in names))
+
+    def draw_grid_layer(self):
+        """
+        Rebuilds the grid background and grid lines.
+        """
+
+        self.grid_canvas.clear()
+        with self.grid_canvas:
             self.draw_grid_background()
 
+        self.grid_lines_canvas.clear()
+        with self.grid_lines_canvas:
+            self.color_instructions['grid_color'] = Color(*self.grid_color)
+            self.x_grid_canvas = Canvas()
+            if self.do_grid_x:
+                with self.x_grid_canvas:
+                    self.draw_x_grid()
+
+            if self.do_grid_y:
+                self.draw_y_grid()
+
+    def draw_axes_layer(self):
+        """
+        Rebuilds the axes, the tick marks and their labels.
+        """
+
+        self.axes_canvas.clear()
+        with self.axes_canvas:
+
             if self.do_axis_x:
                 self.draw_x_axis()
 
+            self.x_ticks_canvas = Canvas()
             if self.do_x_ticks:
-                self.color_instructions['x_ticks_color'] = Color(*self.x_ticks_color)
-                self.draw_x_ticks()
+                with self.x_ticks_canvas:
+                    self.color_instructions['x_ticks_color'] = Color(*self.x_ticks_color)
+                    self.draw_x_ticks()
 
             if self.do_axis_y:
                 self.color_instructions['y_axis_color'] =  Color(*self.y_axis_color)
@@ -493,54 +1086,122 @@ class CoreLineChart(Style, RelativeLayout):
                 if self.y_right_range is not None:
                     self.draw_y_ticks(placement='right')
 
-            self.color_instructions['grid_color'] = Color(*self.grid_color)
-            if self.do_grid_x:
+    def draw_x_grid_layer(self):
+        """
+        Rebuilds the x grid lines only.
+        """
+
+        if self.x_grid_canvas is not None and self.do_grid_x:
+            self.x_grid_canvas.clear()
+            with self.x_grid_canvas:
                 self.draw_x_grid()
 
-            if self.do_grid_y:
-                self.draw_y_grid()
+    def draw_x_ticks_layer(self):
+        """
+        Rebuilds the x tick marks, their labels and the x grid lines only.
+        """
+
+        self.draw_x_grid_layer()
 
+        if self.x_ticks_canvas is not None and self.do_x_ticks:
+            self.x_ticks_canvas.clear()
+            with self.x_ticks_canvas:
+                self.color_instructions['x_ticks_color'] = Color(*self.x_ticks_color)
+                self.draw_x_ticks()
+
+    def draw_overlay_layer(self):
+        """
+        Rebuilds the cursor.
+        """
+
+        self.overlay_canvas.clear()
+        with self.overlay_canvas:
             self.draw_cursor()
 
-        if self.tooltip is None:
-            self.tooltip = Tooltip(self)
+    def draw_series_layer(self):
+        """
+        Maps every series onto the current grid and ranges by updating its
+        transform only. Series shown through a non-identity transform are
+        reprojected once the chart settles, see :attr:`transform_settle_delay`.
+        """
+
+        for rect in (self._dim_rect, *self._clip_rects):
+            rect.pos = self.grid_pos
+            rect.size = self.grid_size
+
+        settled = True
+        for name in self.line_instructions:
+            if self.window_outdated(name):
+                if self.line_instructions[name]['source'] is not None:
+                    self.load_window(name)
+                self.render_line(name)
+                continue
+            settled = self.transform_line(name) and settled
 
-        if self.marker is None:
-            self.marker = Marker(self)
-            self.marker.bind(center_x=self.on_marker_x)
+        if not settled:
+            self.settle_trigger.timeout = self.transform_settle_delay
+            self.settle_trigger()
 
-        self.marker.top = self.grid_y
-        self.marker.center_x = self.grid_x
-        self.add_widget(self.marker)
-        self.add_widget(self.tooltip)
+        self.place_marker()
+
+    def settle_series(self, *args):
+        """
+        Reprojects the series whose transform is not the identity, reloading
+        the window of lazy series.
+        """
+
+        unsettled = []
+        for name, instructions in self.line_instructions.items():
+            if not self.transform_line(name):
+                if instructions['source'] is not None:
+                    self.load_window(name)
+                unsettled.append(name)
+
+        if self.progressive:
+            self.render_progressively(unsettled)
+            return
+
+        for name in unsettled:
+            self.render_line(name)
+
+    def rebake_series(self, *args):
+        """
+        Reprojects every series onto the current grid.
+        """
+
+        if self.progressive:
+            self.render_progressively(self.line_instructions)
+            return
+
+        for name in self.line_instructions:
+            self.render_line(name)
 
     def draw_grid_background(self):
         self.color_instructions['grid_background'] = Color(*self.grid_background_color)
         Rectangle(pos=self.grid_pos, size=self.grid_size)
 
     def draw_y_grid(self):
-        
+
+        placement = 'left' if self.y_left_range is not None else 'right'
+        if self.get_y_range(placement) is None:
+            return
+
         x = self.grid_x
         y = self.grid_y
-        height = self.grid_height
         right = self.grid_right
 
-        for i in range(self.y_ticks + 1):
-            norm = i / self.y_ticks
-            py = y + norm * height
-            
+        for offset, _ in self.get_tick_layout('y', placement):
+            py = y + offset
             Line(points=[x, py, right, py], width=1)
 
     def draw_x_grid(self):
 
         x = self.grid_x
         y = self.grid_y
-        width = self.grid_width
         top = self.grid_top
 
-        for i in range(self.x_ticks + 1):
-            norm = i / self.x_ticks
-            px = x + norm * width
+        for offset, _ in self.get_tick_layout('x'):
+            px = x + offset
             Line(points=[px, y, px, top], width=1)
 
     def draw_y_axis(self, placement='left'):
@@ -565,68 +1226,56 @@ class CoreLineChart(Style, RelativeLayout):
         self.color_instructions['x_axis_color'] = Color(*self.x_axis_color)
         Line(points=[x, y, self.grid_right, y], width=1)
 
-    def draw_y_ticks(self, placement='left'):
-
+    def get_tick_layout(self, axis, placement='left'):
+        """
+        Returns the :class:`~core.charts.linechart.ticks.TickLayout` of the
+        x axis, or of the y axis at `placement`, from :attr:`tick_layouts`.
+        """
 
-        if placement == 'left':
-
-            step_y = (self.y_left_range[1] - self.y_left_range[0]) / self.y_ticks
-            x = self.grid_x
-            y = self.grid_y
-            height = self.grid_height
-            length = self.y_tick_length
-
-            if self.tick_position == 'outside':
-                x -= length
-            elif self.tick_position == 'center':
-                x -= length / 2
-
-            for i in range(self.y_ticks + 1):
-
-                val = self.y_left_range[0] + i * step_y
-                norm = (val - self.y_left_range[0]) / (self.y_left_range[1] - self.y_left_range[0])
-                py = y + norm * height
-
-                if self.y_left_formatter:
-                    text = self.y_left_formatter(val)
-                else:
-                    text = str(int(val))
-
-                Line(points=[x, py, x + length, py], width=1)
-                self.draw_tick_text(text, x, py, axis='y', position='left')
-
-        elif placement == 'right':
-
-            step_y = (self.y_right_range[1] - self.y_right_range[0]) / self.y_ticks
-            x = self.grid_right
-            y = self.grid_y
-            height = self.grid_height
-            length = self.y_tick_length
+        if axis == 'x':
+            value_range, length, target = tuple(self.x_range), self.grid_width, self.x_ticks
+            mode, formatter = self.x_tick_mode, self.x_formatter
+        else:
+            value_range, length, target = tuple(self.get_y_range(placement)), self.grid_height, self.y_ticks
+            mode = 'linear'
+            formatter = self.y_left_formatter if placement == 'left' else self.y_right_formatter
+
+        gap = self.tick_label_gap
+        measure = self.label_cache.measure
+        side = 0 if axis == 'x' else 1
+
+        def build():
+            return layout_ticks(
+                value_range, length, target,
+                lambda text: measure(text, font_size=TICK_FONT_SIZE)[side],
+                mode, formatter, gap
+            )
+
+        key = (axis, value_range, length, target, mode, formatter, gap, TICK_FONT_SIZE, self.label_cache)
+        return self.tick_layouts.get(key, build)
 
-            if self.tick_position == 'center':
-                x -= length / 2
+    def draw_y_ticks(self, placement='left'):
 
-            for i in range(self.y_ticks + 1):
-                val = self.y_right_range[0] + i * step_y
-                norm = (val - self.y_right_range[0]) / (self.y_right_range[1] - self.y_right_range[0])
-                py = y + norm * height
+        x = self.grid_x if placement == 'left' else self.grid_right
+        y = self.grid_y
+        length = self.y_tick_length
 
-                if self.y_right_formatter:
-                    text = self.y_right_formatter(val)
+        if self.tick_position == 'outside' and placement == 'left':
+            x -= length
+        elif self.tick_position == 'center':
+            x -= length / 2
 
-                else:
-                    text = str(int(val))
+        for offset, label in self.get_tick_layout('y', placement):
+            py = y + offset
 
-                Line(points=[x, py, x + length, py], width=1)
-                self.draw_tick_text(text, x, py, axis='y', position='right')
+            Line(points=[x, py, x + length, py], width=1)
+            if label is not None:
+                self.draw_tick_text(label, x, py, axis='y', position=placement)
 
     def draw_x_ticks(self):
 
         x = self.grid_x
         y = self.grid_y
-        width = self.grid_width
-        step_x = (self.x_range[1] - self.x_range[0]) / self.x_ticks
-
         length = self.x_tick_length
 
         if self.tick_position == 'outside':
@@ -634,18 +1283,15 @@ class CoreLineChart(Style, RelativeLayout):
         elif self.tick_position == 'center':
             y -= length / 2
 
-        for i in range(self.x_ticks + 1):
-            val = self.x_range[0] + i * step_x
-            norm = (val - self.x_range[0]) / (self.x_range[1] - self.x_range[0])
-            px = x + norm * width 
+        for offset, label in self.get_tick_layout('x'):
+            px = x + offset
 
             Line(points=[px, y, px, y + length], width=1)
-            self.draw_tick_text(str(int(val)), px, y - 20, axis='x')
+            if label is not None:
+                self.draw_tick_text(label, px, y - 20, axis='x')
 
     def draw_tick_text(self, text, x, y, axis, position=None):
-        label = CoreLabel(text=text, font_size=11, color=(1, 1, 1, 1))
-        label.refresh()
-        texture = label.texture
+        texture = self.label_cache.get(text, font_size=TICK_FONT_SIZE, color=(1, 1, 1, 1))
         tw, th = texture.size
 
         if axis == 'x':
@@ -663,8 +1309,9 @@ class CoreLineChart(Style, RelativeLayout):
 
     def draw_cursor(self):
         self.color_instructions['cursor_color'] = Color(*self.cursor_color)
+        x = self.grid_x if self.marker is None else self.marker.center_x
         self.cursor = Line(
-            points=[self.grid_x, self.grid_y, self.grid_x, self.grid_top],
+            points=[x, self.grid_y, x, self.grid_top],
             dash_length=10,
             dash_offset=5,
             width=self.cursor_width
@@ -673,109 +1320,906 @@ class CoreLineChart(Style, RelativeLayout):
     #  ================================= # 
     #                Line
     #  ================================= #   
-    def draw_line(self, name, points, color=None, width=2, placement='left'):
+    def draw_line(
+        self, name, points=None, color=None, width=2, placement='left',
+        xs=None, ys=None, capacity=None, pyramid_path=None, renderer='smooth'
+    ):
+        """
+        Draws the series `name`.
+
+        The data is given either as a sequence of `(x, y)` pairs through
+        `points` or as two columns through `xs`/`ys` (NumPy arrays or any
+        buffer-protocol sequence). Clamping and projection run in bulk.
+
+        With a `capacity`, the series becomes a rolling window that keeps
+        only its latest `capacity` points as :meth:`append_points` feeds it.
+
+        With :attr:`use_pyramid`, the series gets a min/max pyramid, loaded
+        from and saved to `pyramid_path` when it is given.
+
+        `renderer` picks the line instruction: `'smooth'` for an antialiased
+        :class:`~kivy.graphics.SmoothLine`, or `'mesh'` for a
+        :class:`~core.charts.linechart.meshline.MeshLine`, much cheaper to
+        build and to append to for dense series. Lines of more than
+        :data:`SMOOTH_LINE_MAX_POINTS` drawn points always use a MeshLine.
+        """
 
         if color is None:
             color = self.get_random_color()
 
-        self.line_instructions[name] = {'color': None, 'line': None, 'ellipse': []}
-        y_range = self.y_left_range if placement == 'left' else self.y_right_range
-        pixel_points = []
-        data = []
+        x_values, y_values = to_columns(points, xs, ys)
+
+        self.cancel_load(name)
+        self.register_line(name, SeriesData(x_values, y_values, capacity), color, width, placement, renderer)
+        if self.use_pyramid:
+            self.attach_pyramid(name, pyramid_path)
+
+        if self.progressive and self.is_coarse(name):
+            self.render_line_coarse(name)
+            self.queue_render((self.render_step, name))
+        else:
+            self.render_line(name)
+
+    def draw_table(self, x, columns, colors=None, width=2, placement='left', renderer='smooth'):
+        """
+        Draws one series per item of `columns`, a mapping of series names to
+        y columns, against the single x column `x`.
+
+        The x column is stored and projected once for the whole table, and
+        its hit index is shared by the marker and tooltip lookups of every
+        series. The y columns are stored side by side in one block. `colors`
+        optionally maps names to colors. `renderer` is as in :meth:`draw_line`.
+
+        With :attr:`use_pyramid`, each series gets its own min/max pyramid,
+        built in memory, and is drawn from it like other series.
+
+        Table series cannot be extended with :meth:`append_points`; draw the
+        table again instead.
+        """
+
+        colors = colors or {}
+        x_values, y_block = to_table(x, list(columns.values()))
+        shared_x = SharedX(x_values)
+
+        for name, y_values in zip(columns, y_block):
+            color = colors.get(name)
+            if color is None:
+                color = self.get_random_color()
+
+            self.cancel_load(name)
+            self.register_line(name, SeriesData.sharing(shared_x, y_values), color, width, placement, renderer)
+            if self.use_pyramid:
+                self.attach_pyramid(name)
+
+            if self.progressive and self.is_coarse(name):
+                self.render_line_coarse(name)
+                self.queue_render((self.render_step, name))
+            else:
+                self.render_line(name)
+
+    def attach_pyramid(self, name, path=None):
+        """
+        Builds the min/max pyramid of the series `name`, or loads it from
+        `path` (saving it there if it is missing or stale). The series is
+        drawn from it on the next render.
+        """
+
+        data = self.line_instructions[name]['data']
+        xs, ys = data.xs.values, data.ys.values
+        if path is None:
+            pyramid = MinMaxPyramid(xs, ys)
+        else:
+            pyramid = MinMaxPyramid.open(xs, ys, path)
+        self.line_instructions[name]['pyramid'] = pyramid
+
+    def register_line(self, name, data, color, width, placement, renderer='smooth'):
+        """
+        Registers the series `name` on top of the stack with its store
+        `data`, replacing any series of the same name. Nothing is drawn yet.
+        """
+
+        if renderer not in RENDERERS:
+            raise ValueError(f"`renderer` must be one of {tuple(RENDERERS)}, not {renderer!r}.")
+
+        focused = name == self.focus_key
+        if name in self.line_instructions:
+            self.undraw_line(name)
+
+        self.line_instructions[name] = {
+            'group': None,
+            'translate': None,
+            'scale': None,
+            'reference': None,
+            'color': None,
+            'line': None,
+            'dots': None,
+            'dot_meshes': [],
+            'base_color': color,
+            'data': data,
+            'source': None,
+            'pyramid': None,
+            'window': None,
+            'slice': None,
+            'drawn': None,
+            'refine': None,
+            'width': width,
+            'placement': placement,
+            'renderer': renderer,
+        }
+        self._series_order[name] = None
+
+        if focused:  # the replacement keeps the focus
+            self.focus_key = name
+            self._dim_color.rgba = self.get_dim_color()
+            self.place_series_layer(below_chrome=True)
+
+    def draw_lazy_line(self, name, source, color=None, width=2, placement='left', pyramid=None, renderer='smooth'):
+        """
+        Draws the series `name` from `source`, a
+        :class:`~core.charts.sources.LazySeries`, of which only the window
+        around :attr:`x_range` is loaded (see :attr:`lazy_window_margin`).
+        Panning or zooming past the loaded window loads the new one.
+
+        With a :class:`~core.charts.linechart.pyramid.MinMaxPyramid` of the
+        source (see :meth:`~core.charts.sources.MappedSeries.open_pyramid`),
+        windows are read from its level matching the zoom instead. `renderer`
+        is as in :meth:`draw_line`.
+        """
+
+        if color is None:
+            color = self.get_random_color()
 
-        with self.canvas:
-            if self.focus_key is None:
-                set_color = color
+        self.cancel_load(name)
+        self.register_line(name, SeriesData((), ()), color, width, placement, renderer)
+        self.line_instructions[name]['source'] = source
+        self.line_instructions[name]['pyramid'] = pyramid
+        self.load_window(name)
+        self.render_line(name)
+
+    def load_window(self, name):
+        """
+        Replaces the stored data of the lazy series `name` with the window of
+        its source around :attr:`x_range`.
+        """
+
+        instructions = self.line_instructions[name]
+        window = self.get_data_window()
+
+        if instructions['pyramid'] is not None:
+            xs, ys = instructions['pyramid'].window(*window, self.grid_width * self.decimation_factor)
+        else:
+            xs, ys = instructions['source'].window(*window)
+        x_values, y_values = to_columns(xs=xs, ys=ys)
+        instructions['data'] = SeriesData(x_values, y_values)
+        instructions['window'] = window
+        self._hit_index.pop(name, None)
+
+    def get_data_window(self):
+        """
+        Returns :attr:`x_range` widened by :attr:`lazy_window_margin`.
+        """
+
+        x_min, x_max = self.x_range
+        margin = (x_max - x_min) * self.lazy_window_margin
+        return x_min - margin, x_max + margin
+
+    def window_outdated(self, name):
+        """
+        Returns whether :attr:`x_range` left the drawn window of the lazy or
+        pyramid series `name`. Always false for other series.
+        """
+
+        window = self.line_instructions[name]['window']
+        if window is None:
+            return False
+
+        x_min, x_max = self.x_range
+        return x_min < window[0] or x_max > window[1]
+
+    def render_line(self, name):
+        """
+        Projects the stored data of `name` onto the current grid and updates
+        its canvas instructions, decimated according to :attr:`decimation`.
+
+        The projection becomes the series' reference: its transform is reset
+        to the identity and later range or size changes only move the
+        transform (see :meth:`transform_line`). Existing instructions are
+        updated in place; they are only created when the series has no group
+        on the canvas yet. The full-resolution projection is kept in the
+        series store behind :attr:`dot_info`; for series culled to the
+        visible window (see :attr:`viewport_culling`) only that window is
+        projected, the rest once a lookup needs it.
+        """
+
+        instructions = self.line_instructions[name]
+        grid_x, grid_width = self.grid_x, self.grid_width
+        instructions['reference'] = self.get_reference(instructions['placement'])
+        instructions['refine'] = None
+
+        data = instructions['data']
+        self._hit_index.pop(name, None)
+
+        if instructions['pyramid'] is not None and instructions['source'] is None:
+            # Draw the visible window from the matching pyramid level; the
+            # full projection is only computed once a lookup needs it.
+            data.defer_pixels(partial(self.project_line, instructions))
+            window = instructions['window'] = self.get_data_window()
+            xs, ys = instructions['pyramid'].window(*window, grid_width * self.decimation_factor)
+            instructions['drawn'] = (xs, ys)
+            px_values, py_values = self.project_line(instructions, xs, ys)
+        else:
+            instructions['drawn'] = None
+            x_values, y_values = data.xs.values, data.ys.values
+            # Table series reuse the x projection of the first one drawn.
+            project_data = partial(
+                self.project_line if data.shared_x is None else self.project_table, instructions
+            )
+
+            cut = self.cull_line(name)
+            if cut is None:
+                data.set_pixels(*project_data(x_values, y_values))
+                px_values, py_values = data.px.values, data.py.values
             else:
-                if self.focus_key == name:
-                    set_color = color
-                else:
-                    set_color = self.to_grayscale(color)
+                start, end = cut
+                data.defer_pixels(project_data)
+                x_values, y_values = x_values[start:end], y_values[start:end]
+                px_values, py_values = self.project_slice(instructions, start, end)
+
+            # Decimation needs sorted x; unsorted series are drawn in full.
+            if data.x_sorted:
+                kept = decimate(self.decimation, x_values, y_values, px_values, grid_x, grid_width, self.decimation_factor)
+                if kept is not None:
+                    px_values, py_values = take(px_values, kept), take(py_values, kept)
+
+        self.apply_vertices(name, interleave(px_values, py_values))
+
+    def cull_line(self, name):
+        """
+        Returns the `(start, end)` slice of the stored points of `name` to
+        draw for the current :attr:`x_range`, or `None` when the whole series
+        is drawn (see :attr:`viewport_culling`). The drawn window is recorded
+        so that leaving it draws the series again.
+        """
+
+        instructions = self.line_instructions[name]
+        if instructions['source'] is not None:
+            return None  # lazy series hold their window only
+        instructions['window'] = instructions['slice'] = None
+
+        data = instructions['data']
+        if not self.viewport_culling or not data.x_sorted:
+            return None
+
+        window = self.get_data_window()
+        start, end = visible_slice(data.xs.values, *window)
+        if start == 0 and end == len(data):
+            return None
+
+        instructions['window'] = window
+        instructions['slice'] = (start, end)
+        return start, end
+
+    def is_coarse(self, name):
+        """
+        Returns whether the series `name` is large enough to be shown from a
+        subsample first when rendering progressively.
+        """
+
+        instructions = self.line_instructions[name]
+        return (
+            instructions['pyramid'] is None
+            and len(instructions['data']) > 4 * self.grid_width * self.decimation_factor
+        )
 
-            self.line_instructions[name]['color'] = Color(*set_color)
-            self.line_instructions[name]['base_color'] = color
-            self.line_instructions[name]['grayscale'] = self.to_grayscale(color)
+    def render_line_coarse(self, name):
+        """
+        Renders a regular subsample of `name`, about :attr:`decimation_factor`
+        points per pixel column, without projecting the whole series. The
+        full projection is deferred until a lookup needs it.
+        """
+
+        instructions = self.line_instructions[name]
+        instructions['reference'] = self.get_reference(instructions['placement'])
+        instructions['refine'] = None
+
+        data = instructions['data']
+        data.defer_pixels(partial(self.project_line, instructions))
+        self._hit_index.pop(name, None)
+
+        step = max(1, int(len(data) // (self.grid_width * self.decimation_factor)))
+        px_values, py_values = self.project_line(instructions, data.xs.values[::step], data.ys.values[::step])
+        self.apply_vertices(name, interleave(px_values, py_values))
+
+    def refine_line(self, name):
+        """
+        Generator rendering `name` like :meth:`render_line`,
+        :data:`REFINE_CHUNK` points per step, for :meth:`refine_step`. The
+        coarse line stays on screen until the last chunk is in; lines that
+        keep every point are built into a new
+        :class:`~core.charts.linechart.meshline.MeshLine` chunk by chunk.
+        Decimation runs per chunk, which only keeps a few more points where
+        chunks meet.
+        """
+
+        instructions = self.line_instructions[name]
+        reference = self.get_reference(instructions['placement'])
+        grid_x, grid_width, x_range, grid_y, grid_height, y_range = reference
+
+        data = instructions['data']
+        cut = self.cull_line(name)
+        start, end = (0, len(data)) if cut is None else cut
+        decimation = self.decimation if data.x_sorted else None
+        if decimation is not None and end - start <= grid_width * self.decimation_factor:
+            decimation = None
+
+        line = None
+        if decimation is None and self.get_line_class(instructions['renderer'], end - start) is MeshLine:
+            line = MeshLine(width=instructions['width'])
+
+        points = []
+        for first in range(start, end, REFINE_CHUNK):
+            last = min(first + REFINE_CHUNK, end)
+            x_values, y_values = data.xs.values[first:last], data.ys.values[first:last]
+            px_values = project(x_values, x_range, grid_x, grid_width, clamp=False)
+            py_values = project(y_values, y_range, grid_y, grid_height, clamp=False)
+
+            if decimation is not None:
+                # Each chunk gets its share of the grid width.
+                width = grid_width * (last - first) / (end - start)
+                kept = decimate(decimation, x_values, y_values, px_values, grid_x, width, self.decimation_factor)
+                if kept is not None:
+                    px_values, py_values = take(px_values, kept), take(py_values, kept)
+
+            if line is None:
+                points.extend(interleave(px_values, py_values))
+            else:
+                line.extend(interleave_buffer(px_values, py_values))
+            yield
+
+        if line is not None:
+            points = line.point_buffer
+
+        instructions['reference'] = reference
+        self._hit_index.pop(name, None)
+        data.defer_pixels(partial(
+            self.project_line if data.shared_x is None else self.project_table, instructions
+        ))
+        self.apply_vertices(name, points, line)
+        self.transform_line(name)
+
+    def apply_vertices(self, name, points, line=None):
+        """
+        Shows the flat reference pixel list `points` as the line and dots of
+        `name`, with an identity transform. `line` is a line instruction
+        already built over `points`, to use instead of updating the current
+        one.
+        """
+
+        instructions = self.line_instructions[name]
+        if line is None:
+            line_class = self.get_line_class(instructions['renderer'], len(points) // 2)
+        else:
+            line_class = type(line)
+        if instructions['group'] is None:
+            group = instructions['group'] = InstructionGroup()
+            instructions['translate'] = Translate(0, 0)
+            instructions['scale'] = Scale(1, 1, 1)
+            instructions['color'] = Color(*instructions['base_color'])
+            instructions['line'] = line if line is not None else line_class(points=points, width=instructions['width'])
+            instructions['dots'] = InstructionGroup()
+
+            group.add(PushMatrix())
+            group.add(instructions['translate'])
+            group.add(instructions['scale'])
+            group.add(instructions['color'])
+            group.add(instructions['line'])
+            group.add(instructions['dots'])
+            group.add(PopMatrix())
+            self.get_series_parent(name).add(group)
+        else:
+            instructions['translate'].xy = (0, 0)
+            instructions['scale'].xyz = (1, 1, 1)
+            current = instructions['line']
+            if line is None and type(current) is line_class:
+                current.points = points
+            else:
+                group = instructions['group']
+                index = group.indexof(current)
+                group.remove(current)
+                instructions['line'] = line if line is not None else line_class(points=points, width=instructions['width'])
+                group.insert(index, instructions['line'])
+
+        self.layout_dots(instructions, points)
+
+    def get_line_class(self, renderer, count):
+        """
+        Returns the line instruction drawing `count` points with `renderer`,
+        a :class:`~core.charts.linechart.meshline.MeshLine` past
+        :data:`SMOOTH_LINE_MAX_POINTS`.
+        """
+
+        line_class = RENDERERS[renderer]
+        if line_class is SmoothLine and count > SMOOTH_LINE_MAX_POINTS:
+            return MeshLine
+        return line_class
+
+    def project_line(self, instructions, x_values, y_values):
+        """
+        Projects data columns into the reference pixel space of a series.
+        Values are not clamped; the series layer clips to the grid.
+        """
+
+        grid_x, grid_width, x_range, grid_y, grid_height, y_range = instructions['reference']
+        px_values = project(x_values, x_range, grid_x, grid_width, clamp=False)
+        py_values = project(y_values, y_range, grid_y, grid_height, clamp=False)
+        return px_values, py_values
+
+    def project_table(self, instructions, x_values, y_values):
+        """
+        Projects the data columns of a table series like
+        :meth:`project_line`, the x column through the projection shared by
+        the table. Slices of the table, e.g. single points, are projected on
+        their own.
+        """
+
+        if len(x_values) != len(instructions['data'].shared_x):
+            return self.project_line(instructions, x_values, y_values)
+
+        grid_y, grid_height, y_range = instructions['reference'][3:]
+        return (
+            instructions['data'].shared_x.project(instructions['reference']),
+            project(y_values, y_range, grid_y, grid_height, clamp=False)
+        )
+
+    def project_slice(self, instructions, start, end):
+        """
+        Projects the points `start` to `end` of a series like
+        :meth:`project_line`. Table series share the x projection of the
+        slice, as their columns are culled alike.
+        """
+
+        data = instructions['data']
+        x_values, y_values = data.xs.values[start:end], data.ys.values[start:end]
+        if data.shared_x is None:
+            return self.project_line(instructions, x_values, y_values)
+
+        grid_y, grid_height, y_range = instructions['reference'][3:]
+        return (
+            data.shared_x.project(instructions['reference'], start, end).values,
+            project(y_values, y_range, grid_y, grid_height, clamp=False)
+        )
 
-            for x_val, y_val in points:
+    def get_reference(self, placement):
+        """
+        Returns the current grid and ranges as a series reference.
+        """
 
-                cap_x_val = max(self.x_range[0], min(x_val, self.x_range[1]))
-                cap_y_val = max(y_range[0], min(y_val, y_range[1]))
+        return (
+            self.grid_x, self.grid_width, tuple(self.x_range),
+            self.grid_y, self.grid_height, tuple(self.get_y_range(placement))
+        )
 
-                norm_x = (cap_x_val - self.x_range[0]) / (self.x_range[1] - self.x_range[0])
-                norm_y = (cap_y_val - y_range[0]) / (y_range[1] - y_range[0])
+    def get_y_range(self, placement):
+        return self.y_left_range if placement == 'left' else self.y_right_range
 
-                px = self.grid_x + norm_x * self.grid_width
-                py = self.grid_y + norm_y * self.grid_height
-                pixel_points.extend([px, py])
+    def get_series_transform(self, name):
+        """
+        Returns `(scale_x, scale_y, translate_x, translate_y)` mapping the
+        reference pixels of `name` onto the current grid and ranges.
+        """
 
-                dot_radius = self.dot_radius
-                ellipse = Ellipse(pos=(px - dot_radius, py - dot_radius), size=(dot_radius * 2, dot_radius * 2))
-                self.line_instructions[name]['ellipse'].append(ellipse)
+        instructions = self.line_instructions[name]
+        if instructions['reference'] is None:
+            return 1.0, 1.0, 0.0, 0.0
 
-                data.append({'data': (x_val, y_val), 'pos': (px, py)})
+        grid_x, grid_width, x_range, grid_y, grid_height, y_range = instructions['reference']
+        scale_x, translate_x = axis_transform(
+            grid_x, grid_width, x_range, self.grid_x, self.grid_width, self.x_range
+        )
+        scale_y, translate_y = axis_transform(
+            grid_y, grid_height, y_range, self.grid_y, self.grid_height, self.get_y_range(instructions['placement'])
+        )
+        return scale_x, scale_y, translate_x, translate_y
+
+    def transform_line(self, name):
+        """
+        Updates the matrix of `name` so its vertices follow the current grid
+        and ranges without being reprojected. Returns whether the transform
+        is the identity.
+        """
+
+        instructions = self.line_instructions[name]
+        if instructions['group'] is None:
+            return True
+
+        scale_x, scale_y, translate_x, translate_y = self.get_series_transform(name)
+        instructions['translate'].xy = (translate_x, translate_y)
+        instructions['scale'].xyz = (scale_x, scale_y, 1)
+
+        return (
+            abs(scale_x - 1) < 1e-9 and abs(scale_y - 1) < 1e-9 and
+            abs(translate_x) < 1e-6 and abs(translate_y) < 1e-6
+        )
 
-            self.line_instructions[name]['line'] = SmoothLine(points=pixel_points, width=width)
-            self.dot_info[name] = data
+    def map_series_pos(self, name, pos):
+        """
+        Maps a reference pixel position of `name` onto the current grid.
+        """
+
+        scale_x, scale_y, translate_x, translate_y = self.get_series_transform(name)
+        return pos[0] * scale_x + translate_x, pos[1] * scale_y + translate_y
+
+    def layout_dots(self, instructions, points):
+        """
+        Redraws the dots of a series at the flat pixel list `points` through
+        its batched dot meshes, updated in place. Nothing is drawn when
+        :attr:`dot_radius` is 0.
+        """
+
+        layout_dot_meshes(instructions['dots'], instructions['dot_meshes'], points, self.dot_radius)
+
+    def relayout_dots(self):
+        """
+        Lays out the dots of every series again, e.g. for a new
+        :attr:`dot_radius`.
+        """
+
+        for instructions in self.line_instructions.values():
+            if instructions['line'] is not None:
+                self.layout_dots(instructions, instructions['line'].points)
+
+    def append_points(self, name, xs, ys, scroll=True):
+        """
+        Appends the columns `xs`/`ys` to the series `name` without rebuilding it.
+
+        The vertex buffer, the dots and the series store are extended in
+        place. For rolling-window series (see `capacity` in :meth:`draw_line`)
+        the oldest points are dropped, and with `scroll` the :attr:`x_range`
+        follows the newest point without redrawing the axes or the grid.
+        """
+
+        instructions = self.line_instructions[name]
+        data = instructions['data']
+        if data.shared_x is not None:
+            raise ValueError(f"Series {name!r} belongs to a table; draw the table again instead.")
+
+        x_new, y_new = to_columns(xs=xs, ys=ys)
+        count = len(x_new)
+        if not count:
+            return
+
+        previous = len(data)
+        dropped = data.extend(x_new, y_new)
+
+        pyramid = instructions['pyramid']
+        if pyramid is not None:
+            pyramid.extend(data.xs.values, data.ys.values, 0 if dropped else previous)
+
+        cut = instructions['slice']
+        if scroll and data.capacity is not None:
+            x_min, x_max = self.x_range
+            last = float(x_new[-1])
+            if last > x_max:
+                self.scroll_x_range(last - (x_max - x_min), last)
+                if instructions['slice'] is not cut:
+                    return  # the scroll left the culled window and drew it again
+
+        if (
+            instructions['group'] is None
+            or dropped >= previous
+            or pyramid is not None
+            or (
+                self.decimation is not None and data.x_sorted
+                and len(data) > self.grid_width * self.decimation_factor
+            )
+            # A culled line only grows in place when it runs to the last point.
+            or (cut is not None and (dropped or cut[1] != previous))
+            # A SmoothLine growing past its limit is replaced.
+            or (
+                isinstance(instructions['line'], SmoothLine)
+                and len(instructions['line'].points) // 2 - dropped + count > SMOOTH_LINE_MAX_POINTS
+            )
+        ):
+            self.render_line(name)
+            return
+
+        if cut is not None:
+            instructions['slice'] = (cut[0], len(data))
+
+        x_new, y_new = data.xs.values[-count:], data.ys.values[-count:]
+        px_new, py_new = self.project_line(instructions, x_new, y_new)
+        data.extend_pixels(px_new, py_new)
+
+        self._hit_index.pop(name, None)
+
+        line = instructions['line']
+        if isinstance(line, MeshLine):
+            line.extend(interleave(px_new, py_new), dropped)
+            points = None
+        else:
+            points = line.points
+            del points[:dropped * 2]
+            points.extend(interleave(px_new, py_new))
+            line.points = points
+
+        if self.dot_radius > 0:
+            self.layout_dots(instructions, line.points if points is None else points)
+
+    def scroll_x_range(self, x_min, x_max):
+        """
+        Moves :attr:`x_range` to `[x_min, x_max]`, updating the series
+        transforms, the x ticks and the x grid lines only. Axes, y grid and
+        y ticks are left as is.
+        """
+
+        self._scrolling = True
+        try:
+            self.x_range = [x_min, x_max]
+        finally:
+            self._scrolling = False
+
+        self.draw_series_layer()
+        self.draw_x_ticks_layer()
 
     def undraw_line(self, name):
+        self.cancel_load(name)
         if name in self.line_instructions:
             instructions = self.line_instructions[name]
-            if instructions['line'] in self.canvas.children:
-                self.canvas.remove(instructions['line'])
+            if name == self.focus_key:
+                self.unfocus()
+            if instructions['group'] is not None:
+                self.series_group.remove(instructions['group'])
+
+            self._hit_index.pop(name, None)
+            self._series_order.pop(name, None)
+            del self.line_instructions[name]
 
-            if instructions['color'] in self.canvas.children:
-                self.canvas.remove(instructions['color'])
+    def set_series(self, series):
+        """
+        Replaces every series with `series` in a single update of the series
+        layer.
 
-            for ellipse in instructions['ellipse']:
-                children = list(self.canvas.children)
-                if ellipse in children:
-                    self.canvas.remove(ellipse)
+        `series` maps each name to either its points or a dict of keyword
+        arguments for :meth:`draw_line`. Series are stacked in the order of
+        the mapping, the last one on top.
+        """
 
-            del self.dot_info[name]
-            del self.line_instructions[name]
+        self.clear_lines()
+        for name, value in series.items():
+            if isinstance(value, Mapping):
+                self.draw_line(name, **value)
+            else:
+                self.draw_line(name, value)
+
+    def get_series_order(self):
+        """
+        Returns the series names from the bottom to the top of the stack.
+        """
+
+        return list(self._series_order)
+
+    def set_line_color(self, name, color):
+        """
+        Changes the color of the series `name` by updating its single
+        :class:`~kivy.graphics.Color` instruction.
+        """
+
+        instructions = self.line_instructions[name]
+        instructions['base_color'] = color
+
+        if instructions['color'] is not None:
+            instructions['color'].rgba = color
 
     def clear_lines(self):
-        names = list(self.line_instructions.keys())
-        for name in names:
-            self.undraw_line(name)
+        for name in list(self._pending_loads):
+            self.cancel_load(name)
+
+        self.unfocus()
+        self.series_group.clear()
+        self._hit_index.clear()
+        self._series_order.clear()
+        self.line_instructions.clear()
 
     def focus(self, name):
-        for key, value in self.line_instructions.items():
+        """
+        Brings `name` on top and dims the other series behind a veil (see
+        :attr:`focus_dim`). Only the focused series and the veil are touched,
+        whatever the number of series.
+        """
 
-            if key == name:
-                self.bring_on_top(key)
-                color_instructions = value['color']
-                color_instructions.rgba = value['base_color']
+        if name == self.focus_key or name not in self.line_instructions:
+            return
 
-                self.focus_key = key
-                continue
-            
-            color_instructions = value['color']
-            color_instructions.rgba = value['grayscale']
+        self.unfocus()
+        self.bring_on_top(name)
+
+        group = self.line_instructions[name]['group']
+        if group is not None:
+            self.series_group.remove(group)
+            self.focus_group.add(group)
+
+        self.focus_key = name
+        self._dim_color.rgba = self.get_dim_color()
+        self.place_series_layer(below_chrome=True)
 
     def unfocus(self):
-        for key, value in self.line_instructions.items():
-            color_instructions = value['color']
-            color_instructions.rgba = value['base_color']
+        if self.focus_key is None:
+            return
+
+        group = self.line_instructions[self.focus_key]['group']
+        if group is not None:
+            self.focus_group.remove(group)
+            self.series_group.add(group)  # the focused series is on top
 
         self.focus_key = None
+        self._dim_color.a = 0
+        self.place_series_layer(below_chrome=False)
+
+    def place_series_layer(self, below_chrome):
+        """
+        Moves the series layer right above the grid background, below the
+        grid lines and axes, or back above them. The veil dimming unfocused
+        series then never covers the chrome.
+        """
+
+        canvas = self.canvas
+        canvas.remove(self.series_canvas)
+        anchor = self.grid_canvas if below_chrome else self.axes_canvas
+        canvas.insert(canvas.indexof(anchor) + 1, self.series_canvas)
+
+    def get_dim_color(self):
+        return list(self.grid_background_color[:3]) + [self.focus_dim]
+
+    def get_series_parent(self, name):
+        """
+        Returns the instruction group holding the group of `name`.
+        """
+
+        return self.focus_group if name == self.focus_key else self.series_group
 
     def bring_on_top(self, name):
         if name in self.line_instructions:
+            if next(reversed(self._series_order)) == name:
+                return  # already on top
+
+            self._series_order.move_to_end(name)
+            group = self.line_instructions[name]['group']
+            if group is not None and name != self.focus_key:
+                self.series_group.remove(group)
+                self.series_group.add(group)
+
+    def get_series_index(self, name):
+        """
+        Returns the :class:`SeriesIndex` of `name`, building it if needed.
+        Culled series (see :attr:`viewport_culling`) only index their drawn
+        slice, and pyramid series the points drawn from their pyramid, both
+        projected for the purpose.
+        """
+
+        index = self._hit_index.get(name)
+        if index is None:
             instructions = self.line_instructions[name]
+            data = instructions['data']
+            shared_x = data.shared_x
+            cut = instructions['slice']
+            if instructions['drawn'] is not None:
+                xs, ys = instructions['drawn']
+                index = SeriesIndex(
+                    *self.project_line(instructions, xs, ys),
+                    indices=instructions['pyramid'].indices(xs)
+                )
+            elif cut is not None:
+                start, end = cut
+                px_values, py_values = self.project_slice(instructions, start, end)
+                # The shared index is dropped whenever the shared slice changes.
+                if shared_x is not None and shared_x.index is not None:
+                    index = shared_x.index.share(py_values)
+                else:
+                    index = SeriesIndex(px_values, py_values, offset=start)
+                    if shared_x is not None:
+                        shared_x.index = index
+            elif shared_x is not None and shared_x.index is not None and data.px is shared_x.px:
+                index = shared_x.index.share(data.py.values)
+            else:
+                index = SeriesIndex(data.px.values, data.py.values)
+                if shared_x is not None and data.px is shared_x.px:
+                    shared_x.index = index
+            self._hit_index[name] = index
+        return index
+
+    def hit_test(self, x, y):
+        """
+        Returns `(name, index)` of the point nearest to the local position
+        `(x, y)` within :attr:`touch_tolerance`, or `None` when nothing is hit.
+
+        Lookups go through a per-series index sorted by x pixel, built from
+        the stored projection on the first lookup after each redraw.
+        """
+
+        tolerance = self.touch_tolerance
+        best = None
+        grid_x, grid_y = self.grid_x, self.grid_y
+        grid_right, grid_top = self.grid_right, self.grid_top
+
+        for name in self.line_instructions:
+            scale_x, scale_y, translate_x, translate_y = self.get_series_transform(name)
+            bounds = (
+                (grid_x - translate_x) / scale_x, (grid_y - translate_y) / scale_y,
+                (grid_right - translate_x) / scale_x, (grid_top - translate_y) / scale_y
+            )
+            found = self.get_series_index(name).nearest(
+                (x - translate_x) / scale_x, (y - translate_y) / scale_y,
+                tolerance, scale_x, scale_y, bounds
+            )
+            if found is not None and (best is None or found[1] < best[2]):
+                best = (name, found[0], found[1])
+
+        return None if best is None else best[:2]
+
+    def nearest_index(self, name, x):
+        """
+        Returns the index of the point of `name` closest to the local `x`.
+        """
+
+        scale_x, _, translate_x, _ = self.get_series_transform(name)
+        return self.get_series_index(name).nearest_x((x - translate_x) / scale_x)
+
+    def collide_grid(self, x, y):
+        """
+        Checks whether the local position `(x, y)` lies on the grid.
+        """
+
+        return self.grid_x <= x <= self.grid_right and self.grid_y <= y <= self.grid_top
 
-            if instructions['color'] in self.canvas.children:
-                self.canvas.remove(instructions['color'])
-                self.canvas.add(instructions['color'])
-
-            if instructions['line'] in self.canvas.children:
-                self.canvas.remove(instructions['line'])
-                self.canvas.add(instructions['line'])
-
-            for ellipse in instructions['ellipse']:
-                if ellipse in self.canvas.children:
-                    self.canvas.remove(ellipse)
-                    self.canvas.add(ellipse)
+    #  ================================= # 
+    #             Pan & Zoom
+    #  ================================= #
+    def pan_by(self, dx, dy=0):
+        """
+        Shifts the ranges by `dx`/`dy` pixels along :attr:`pan_zoom_axes`.
+        """
+
+        axes = self.pan_zoom_axes
+
+        if 'x' in axes and dx:
+            x_min, x_max = self.x_range
+            shift = dx * (x_max - x_min) / self.grid_width
+            self.x_range = [x_min + shift, x_max + shift]
+
+        if 'y' in axes and dy:
+            for key in ('y_left_range', 'y_right_range'):
+                y_range = getattr(self, key)
+                if y_range is not None:
+                    shift = dy * (y_range[1] - y_range[0]) / self.grid_height
+                    setattr(self, key, [y_range[0] + shift, y_range[1] + shift])
+
+    def zoom_by(self, factor, anchor=None):
+        """
+        Zooms the ranges along :attr:`pan_zoom_axes` by `factor` (above 1
+        zooms in), keeping the local position `anchor` in place. Defaults
+        to the grid center.
+        """
+
+        if anchor is None:
+            anchor = (self.grid_x + self.grid_width / 2, self.grid_y + self.grid_height / 2)
+
+        axes = self.pan_zoom_axes
+
+        if 'x' in axes:
+            ratio = (anchor[0] - self.grid_x) / self.grid_width
+            self.x_range = self.zoom_range(self.x_range, factor, ratio)
+
+        if 'y' in axes:
+            ratio = (anchor[1] - self.grid_y) / self.grid_height
+            for key in ('y_left_range', 'y_right_range'):
+                y_range = getattr(self, key)
+                if y_range is not None:
+                    setattr(self, key, self.zoom_range(y_range, factor, ratio))
+
+    def zoom_range(self, value_range, factor, ratio):
+        low, high = value_range
+        anchor = low + ratio * (high - low)
+        return [anchor - (anchor - low) / factor, anchor + (high - anchor) / factor]
 
     #  ================================= # 
     #          Cursor Movement
@@ -786,6 +2230,224 @@ class CoreLineChart(Style, RelativeLayout):
     def move_marker_left(self):
         self.marker.move_left()
 
+    def to_data_x(self, x):
+        """
+        Returns the data x at the local `x`.
+        """
+
+        low, high = self.x_range
+        return low + (x - self.grid_x) / self.grid_width * (high - low)
+
+    def select_cursor_x(self, x):
+        """
+        Sets :attr:`cursor_x` to the data value `x` and dispatches the
+        crosshair items at it on the next frame. Calls within one frame are
+        coalesced into a single `on_cursor_items`.
+        """
+
+        self._pending_cursor_x = x
+        self.cursor_trigger()
+
+    def place_cursor_x(self, x):
+        """
+        Moves the marker to the data value `x` and sets :attr:`cursor_x`,
+        without dispatching `on_cursor_items`.
+        """
+
+        self._pending_cursor_x = None
+        self.cursor_x = x
+        self.place_marker()
+
+    def place_marker(self):
+        """
+        Moves the marker and the cursor onto the current selection: the
+        point at the marker's `selected_index` of the first series, or
+        :attr:`cursor_x` in the `'interpolate'` :attr:`cursor_mode`. Called
+        whenever the series are mapped onto new ranges or a new grid.
+        """
+
+        marker = self.marker
+        if marker is None:
+            return
+
+        if self.cursor_mode == 'interpolate' and self.cursor_x is not None:
+            low, high = self.x_range
+            x = self.grid_x + (self.cursor_x - low) / (high - low) * self.grid_width
+        else:
+            for points in self.dot_info.values():
+                if not 0 <= marker.selected_index < len(points):
+                    return
+                x = points[int(marker.selected_index)]['pos'][0]
+                break
+            else:
+                return
+
+        marker.top = self.grid_y
+        marker.center_x = min(max(x, self.grid_x), self.grid_right)
+        if self.cursor is not None:
+            self.on_marker_x(marker, marker.center_x)
+
+    def flush_cursor(self, *args):
+        x = self._pending_cursor_x
+        if x is None:
+            return
+        self._pending_cursor_x = None
+        self.cursor_x = x
+        self.dispatch('on_cursor_items', self.get_crosshair_items(x))
+
+    def get_crosshair_items(self, x):
+        """
+        Returns the points of every series at the data value `x`, by series
+        name, in the shape of the :attr:`dot_info` points. `y` is linearly
+        interpolated between the points around `x`; series not spanning `x`
+        and series whose x values are not sorted are left out.
+
+        Each series is searched on its own x column, except the series of a
+        table, whose shared column is searched once for all of them.
+        """
+
+        values = {}
+        tables = {}
+        for name, instructions in self.line_instructions.items():
+            data = instructions['data']
+            if not data.x_sorted:
+                continue  # no single pair of points around `x`
+            if data.shared_x is not None:
+                tables.setdefault(id(data.shared_x), (data.shared_x, []))[1].append((name, data))
+            else:
+                y = interpolate(data.xs.values, data.ys.values, x)
+                if y is not None:
+                    values[name] = y
+
+        for shared_x, series in tables.values():
+            ys = interpolate_columns(shared_x.xs.values, [data.ys.values for _, data in series], x)
+            if ys is not None:
+                values.update(zip((name for name, _ in series), ys))
+
+        x_low, x_high = self.x_range
+        px = self.grid_x + (x - x_low) / (x_high - x_low) * self.grid_width
+
+        items = {}
+        for name, y in values.items():
+            y_low, y_high = self.get_y_range(self.line_instructions[name]['placement'])
+            py = self.grid_y + (y - y_low) / (y_high - y_low) * self.grid_height
+            items[name] = {'data': (x, y), 'pos': (px, py)}
+        return items
+
+    #  ================================= # 
+    #            Async Loading
+    #  ================================= #   
+    def load_series_async(
+        self, name, points=None, color=None, width=2, placement='left',
+        xs=None, ys=None, capacity=None, source=None, sort=False, renderer='smooth',
+        pyramid_path=None
+    ):
+        """
+        Draws the series `name` like :meth:`draw_line`, but prepares it on
+        a worker thread (see :mod:`core.charts.linechart.loader`) so the
+        main thread stays responsive.
+
+        Besides `points` or `xs`/`ys`, the data may come from `source`, a
+        callable returning the `(xs, ys)` columns that runs on the worker,
+        e.g. to parse a file. With `sort`, points are ordered by x. `renderer`
+        and `pyramid_path` are as in :meth:`draw_line`; the pyramid is built
+        on the worker too.
+
+        Progress is reported through `on_series_progress` and the finished
+        vertex buffers are handed to the canvas on the next frame, followed
+        by `on_series_ready`. A newer load, :meth:`draw_line` or
+        :meth:`undraw_line` of the same name cancels the pending load.
+        Returns the :class:`~concurrent.futures.Future` of the preparation.
+        """
+
+        if color is None:
+            color = self.get_random_color()
+
+        if source is None:
+            if points is not None:
+                source = partial(to_columns, points)
+            else:
+                source = partial(to_columns, None, xs, ys)
+
+        self.cancel_load(name)
+        generation = self._load_generations[name] = self._load_generations.get(name, 0) + 1
+        reference = self.get_reference(placement)
+
+        def report(progress):
+            if self._load_generations.get(name) != generation:
+                return False
+            Clock.schedule_once(partial(self.report_load, name, generation, progress))
+            return True
+
+        future = get_executor().submit(
+            prepare_series, source, reference, self.decimation, self.decimation_factor,
+            sort, capacity, report, self.use_pyramid, pyramid_path
+        )
+        self._pending_loads[name] = future
+        future.add_done_callback(
+            lambda future: Clock.schedule_once(
+                partial(
+                    self.finish_load, name, generation, future, reference,
+                    color, width, placement, capacity, renderer
+                )
+            )
+        )
+        return future
+
+    def cancel_load(self, name):
+        """
+        Cancels the pending async load of `name`, if any.
+        """
+
+        future = self._pending_loads.pop(name, None)
+        if future is not None:
+            self._load_generations[name] += 1
+            future.cancel()
+
+    def report_load(self, name, generation, progress, *args):
+        if self._load_generations.get(name) == generation:
+            self.dispatch('on_series_progress', name, progress)
+
+    def finish_load(self, name, generation, future, reference, color, width, placement, capacity, renderer, *args):
+        """
+        Installs the result of an async load on the main thread, unless it
+        was superseded in the meantime. The prepared vertices are shown as
+        they are unless the series is drawn from its pyramid or culled to
+        the visible window (see :attr:`viewport_culling`), which
+        :meth:`render_line` handles like for :meth:`draw_line`.
+        """
+
+        if self._load_generations.get(name) != generation or future.cancelled():
+            return
+        self._pending_loads.pop(name, None)
+
+        try:
+            prepared = future.result()
+        except CancelledError:
+            return
+        except Exception:
+            Logger.exception(f'CoreLineChart: Loading series {name!r} failed')
+            return
+
+        data = SeriesData(prepared.xs, prepared.ys, capacity)
+        data.set_pixels(prepared.px, prepared.py)
+        self.register_line(name, data, color, width, placement, renderer)
+        instructions = self.line_instructions[name]
+        instructions['pyramid'] = prepared.pyramid
+
+        if prepared.pyramid is not None or self.cull_line(name) is not None:
+            self.render_line(name)
+        else:
+            instructions['reference'] = reference
+            self.apply_vertices(name, prepared.points)
+
+            # The grid may have moved while the series was being prepared.
+            if not self.transform_line(name):
+                self.settle_trigger()
+
+        self.dispatch('on_series_progress', name, 1.0)
+        self.dispatch('on_series_ready', name)
+
     #  ================================= # 
     #               Events
     #  ================================= #   
@@ -795,24 +2457,137 @@ class CoreLineChart(Style, RelativeLayout):
     def on_cursor_items(self, value):
         pass
 
+    def on_series_progress(self, name, progress):
+        pass
+
+    def on_series_ready(self, name):
+        pass
+
+    def on_render_complete(self):
+        pass
+
     def on_touch_down(self, touch):
         if self.collide_point(*touch.pos):
             x, y = self.to_local(*touch.pos)
-            for series in self.dot_info.values():
-                for point in series:
-                    px, py = point['pos']
-                    if (
-                        px - self.touch_tolerance <= x <= px + self.touch_tolerance and
-                        py - self.touch_tolerance <= y <= py + self.touch_tolerance
-                    ):
-                        self.tooltip.text = f"X: {point['data'][0]}, Y: {point['data'][1]}"
-                        self.tooltip.top = self.grid_top
-                        self.tooltip.right = self.grid_right
-                        self.tooltip.open()
-                        return True
+
+            if touch.is_mouse_scrolling:
+                if self.do_zoom and touch.button in ('scrollup', 'scrolldown') and self.collide_grid(x, y):
+                    step = self.zoom_step
+                    self.zoom_by(step if touch.button == 'scrolldown' else 1 / step, (x, y))
+                    return True
+                return super().on_touch_down(touch)
+
+            hit = self.hit_test(x, y)
+            if hit is not None:
+                self.show_tooltip(*hit)
+                return True
 
         self.tooltip.dismiss()
-        return super().on_touch_down(touch)
+        if super().on_touch_down(touch):
+            return True
+
+        if (self.do_pan or self.do_zoom) and self.collide_point(*touch.pos):
+            if self.collide_grid(*self.to_local(*touch.pos)):
+                touch.grab(self)
+                self._gesture_touches.append(touch)
+                return True
+        return False
+
+    def on_touch_move(self, touch):
+        if touch.grab_current is self:
+            touches = self._gesture_touches
+
+            if len(touches) == 1 and self.do_pan:
+                self.pan_by(-touch.dx, -touch.dy)
+
+            elif len(touches) >= 2 and self.do_zoom:
+                first, second = touches[:2]
+                if touch is first or touch is second:
+                    other = second if touch is first else first
+                    before = Vector(touch.ppos).distance(other.pos)
+                    after = Vector(touch.pos).distance(other.pos)
+                    if before > 0 and after > 0:
+                        center = self.to_local((touch.x + other.x) / 2, (touch.y + other.y) / 2)
+                        self.zoom_by(after / before, center)
+            return True
+
+        if (self.hover_focus or self.hover_tooltip) and self.collide_point(*touch.pos):
+            self.hover_at(*self.to_local(*touch.pos))
+        return super().on_touch_move(touch)
+
+    def on_hover_focus(self, instance, value):
+        self.bind_hover()
+
+    def on_hover_tooltip(self, instance, value):
+        self.bind_hover()
+
+    def bind_hover(self):
+        """
+        Follows the mouse while :attr:`hover_focus` or :attr:`hover_tooltip`
+        is set.
+        """
+
+        hovering = self.hover_focus or self.hover_tooltip
+        if hovering and not self._hover_bound:
+            Window.bind(mouse_pos=self.on_mouse_pos)
+        elif not hovering and self._hover_bound:
+            Window.unbind(mouse_pos=self.on_mouse_pos)
+        self._hover_bound = hovering
+
+    def on_mouse_pos(self, window, pos):
+        if self.get_root_window() is None:
+            return
+        self.hover_at(*self.to_widget(*pos, relative=True))
+
+    def hover_at(self, x, y):
+        """
+        Focuses the series and shows the tooltip of the point under the
+        local position `(x, y)`, as enabled by :attr:`hover_focus` and
+        :attr:`hover_tooltip`. Both share a single hit test.
+        """
+
+        hit = self.hit_test(x, y) if self.collide_grid(x, y) else None
+
+        if self.hover_focus:
+            if hit is not None:
+                self.focus(hit[0])
+            else:
+                self.unfocus()
+
+        if self.hover_tooltip and self.tooltip is not None:
+            if hit is not None:
+                self.show_tooltip(*hit)
+            else:
+                self.tooltip.dismiss()
+
+    def show_tooltip(self, name, index):
+        """
+        Shows the tooltip for the point `index` of the series `name`, or for
+        that index of every series with :attr:`tooltip_all_series`. The text
+        is applied on the next frame.
+        """
+
+        dot_info = self.dot_info
+        if self.tooltip_all_series:
+            items = {key: info[index] for key, info in dot_info.items() if 0 <= index < len(info)}
+        else:
+            items = {name: dot_info[name][index]}
+
+        self.tooltip.top = self.grid_top
+        self.tooltip.right = self.grid_right
+        self.tooltip.show_items(items)
+
+    def on_focus_dim(self, instance, value):
+        if self.focus_key is not None:
+            self._dim_color.rgba = self.get_dim_color()
+
+    def on_touch_up(self, touch):
+        if touch.grab_current is self:
+            touch.ungrab(self)
+            if touch in self._gesture_touches:
+                self._gesture_touches.remove(touch)
+            return True
+        return super().on_touch_up(touch)
 
     #  ================================= # 
     #             Color Events
@@ -827,6 +2602,9 @@ class CoreLineChart(Style, RelativeLayout):
         if 'grid_background' in self.color_instructions:
             self.color_instructions['grid_background'].rgba = value
 
+        if self.focus_key is not None:
+            self._dim_color.rgba = self.get_dim_color()
+
     def on_grid_color(self, instance, value):
 
         if 'grid_color' in self.color_instructions:
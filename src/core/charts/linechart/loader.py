@@ -0,0 +1,130 @@
+"""
+Charts/Loader
+=============
+
+Off-main-thread preparation of line series.
+
+:func:`prepare_series` does everything :meth:`CoreLineChart.draw_line
+<core.charts.linechart.CoreLineChart.draw_line>` does before touching the
+canvas: parsing the source, sorting, building its min/max pyramid,
+projection, decimation and building the vertex list. It is a plain function of its inputs, so it runs on the shared
+:func:`get_executor` pool while the main thread keeps handling touches and
+animations. NumPy releases the GIL for the bulk of that work.
+"""
+
+from __future__ import annotations
+
+from array import array
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+from core.charts.linechart.projection import to_columns, project, interleave, take, is_sorted
+from core.charts.linechart.decimation import decimate
+from core.charts.linechart.pyramid import MinMaxPyramid
+from core.charts._np import np
+
+
+LOADER_WORKERS = 2
+'''
+Number of threads of the shared loader pool.
+'''
+
+_executor = None
+
+
+def get_executor():
+    """
+    Returns the thread pool series are prepared on, created on first use.
+    """
+
+    global _executor
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=LOADER_WORKERS, thread_name_prefix='chart-loader')
+    return _executor
+
+
+class PreparedSeries:
+
+    __slots__ = ('xs', 'ys', 'px', 'py', 'points', 'pyramid')
+
+    def __init__(self, xs, ys, px, py, points, pyramid=None):
+        self.xs = xs
+        self.ys = ys
+        self.px = px
+        self.py = py
+        self.points = points
+        self.pyramid = pyramid
+
+
+def sort_columns(x_values, y_values):
+    """
+    Returns the columns reordered by increasing x; already sorted columns
+    are returned as is.
+    """
+
+    if np is not None:
+        if len(x_values) > 1 and not bool(np.all(x_values[1:] >= x_values[:-1])):
+            order = np.argsort(x_values, kind='stable')
+            return x_values[order], y_values[order]
+        return x_values, y_values
+
+    if any(x_values[i] > x_values[i + 1] for i in range(len(x_values) - 1)):
+        order = sorted(range(len(x_values)), key=x_values.__getitem__)
+        return array('d', take(x_values, order)), array('d', take(y_values, order))
+    return x_values, y_values
+
+
+def prepare_series(
+    source, reference, decimation=None, decimation_factor=2, sort=False, capacity=None, report=None,
+    pyramid=False, pyramid_path=None
+):
+    """
+    Builds a :class:`PreparedSeries` from `source`, a callable returning the
+    `(xs, ys)` columns, projected into `reference` (see
+    :meth:`~core.charts.linechart.CoreLineChart.render_line`).
+
+    With `pyramid`, the series gets a
+    :class:`~core.charts.linechart.pyramid.MinMaxPyramid`, loaded from and
+    saved to `pyramid_path` when it is given, and no vertex list as it is
+    drawn from the pyramid.
+
+    `report` is called with the completed fraction after each stage and
+    returns `False` once the load is superseded, which raises
+    :class:`~concurrent.futures.CancelledError`.
+    """
+
+    def step(fraction):
+        if report is not None and not report(fraction):
+            raise CancelledError()
+
+    xs, ys = source()
+    x_values, y_values = to_columns(xs=xs, ys=ys)
+    step(0.25)
+
+    if sort:
+        x_values, y_values = sort_columns(x_values, y_values)
+    if capacity is not None and len(x_values) > capacity:
+        x_values, y_values = x_values[-capacity:], y_values[-capacity:]
+    step(0.5)
+
+    grid_x, grid_width, x_range, grid_y, grid_height, y_range = reference
+    px_values = project(x_values, x_range, grid_x, grid_width, clamp=False)
+    py_values = project(y_values, y_range, grid_y, grid_height, clamp=False)
+    step(0.75)
+
+    if pyramid:
+        if pyramid_path is None:
+            pyramid = MinMaxPyramid(x_values, y_values)
+        else:
+            pyramid = MinMaxPyramid.open(x_values, y_values, pyramid_path)
+        return PreparedSeries(x_values, y_values, px_values, py_values, None, pyramid)
+
+    kept = None
+    if sort or is_sorted(x_values):  # decimation needs sorted x
+        kept = decimate(decimation, x_values, y_values, px_values, grid_x, grid_width, decimation_factor)
+    if kept is not None:
+        points = interleave(take(px_values, kept), take(py_values, kept))
+    else:
+        points = interleave(px_values, py_values)
+
+    return PreparedSeries(x_values, y_values, px_values, py_values, points)
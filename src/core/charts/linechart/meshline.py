@@ -0,0 +1,235 @@
+"""
+Charts/Mesh Line
+================
+
+Thick polyline drawn as a triangle strip in :class:`~kivy.graphics.Mesh`
+instructions, an alternative to :class:`~kivy.graphics.SmoothLine` for
+dense series.
+
+Each point gets two vertices, offset on both sides along the miter of its
+two segments, and each segment two triangles between them. With NumPy the
+whole strip is computed in a few array operations. The strip is split into
+meshes of :data:`POINTS_PER_MESH` points (16-bit indices), so appending
+points only rebuilds the last mesh and adds new ones.
+
+The line is not antialiased, which is rarely visible on series dense
+enough to need it.
+"""
+
+from __future__ import annotations
+
+from array import array
+
+from kivy.graphics import InstructionGroup, Mesh
+
+from core.charts._np import np
+
+
+POINTS_PER_MESH = 65536 // 2 - 1
+'''
+Maximum number of points per mesh, 2 vertices each. Consecutive meshes
+share their boundary point.
+'''
+
+MITER_LIMIT = 4
+'''
+Longest miter, in half widths; sharper joins are cut at this length.
+'''
+
+VERTEX_FORMAT = [(b'vPosition', 2, 'float')]
+
+_indices = {}
+
+
+def get_strip_indices(count):
+    """
+    Returns the triangle indices of a strip through `count` points, cached
+    per count.
+    """
+
+    indices = _indices.get(count)
+    if indices is None:
+        segments = max(count - 1, 0)
+        if np is not None:
+            base = (np.arange(segments, dtype=np.uint16) * 2)[:, None]
+            indices = (base + np.array([0, 1, 2, 1, 3, 2], dtype=np.uint16)).ravel()
+        else:
+            indices = array('H')
+            for i in range(0, segments * 2, 2):
+                indices.extend((i, i + 1, i + 2, i + 1, i + 3, i + 2))
+
+        if len(_indices) > 8:
+            _indices.clear()
+        _indices[count] = indices
+    return indices
+
+
+def strip_vertices(points, width, start=0, end=None):
+    """
+    Returns the strip vertices (`x, y` on each side) of the points
+    `start` to `end` of the flat `[x0, y0, x1, y1, ...]` list `points`.
+    Their neighbours outside the range still shape the joins.
+
+    A point is offset by `half * (n1 + n2) / (1 + n1 . n2)`, `n1` and `n2`
+    being the unit normals of its segments, which is the miter at the
+    right length. Joins sharper than :data:`MITER_LIMIT` are cut.
+    """
+
+    count = len(points) // 2
+    end = count if end is None else end
+    first, last = max(start - 1, 0), min(end + 1, count)
+    half = width / 2
+    limit = 2 / MITER_LIMIT ** 2
+
+    if np is not None:
+        xy = np.asarray(points[2 * first:2 * last], dtype=np.float64)
+        x, y = xy[0::2], xy[1::2]
+        if len(x) < 2:
+            return np.repeat(xy, 2).astype(np.float32)[:(end - start) * 4]
+
+        dx, dy = np.diff(x), np.diff(y)
+        length = np.hypot(dx, dy)
+        length[length == 0] = np.inf  # repeated points get no normal
+        nx, ny = -dy / length, dx / length
+
+        bx, by = np.concatenate((nx[:1], nx)), np.concatenate((ny[:1], ny))
+        ax, ay = np.concatenate((nx, nx[-1:])), np.concatenate((ny, ny[-1:]))
+        sx, sy = bx + ax, by + ay
+        denominator = 1 + bx * ax + by * ay
+
+        sharp = np.flatnonzero(denominator < limit)
+        denominator[sharp] = 1
+        scale = half / denominator
+        ox, oy = sx * scale, sy * scale
+
+        if len(sharp):
+            mx, my = sx[sharp], sy[sharp]
+            norm = np.hypot(mx, my)
+            flat = norm < 1e-9  # a full U-turn
+            norm[flat] = 1
+            reach = np.where(flat, half, half * MITER_LIMIT)
+            ox[sharp] = np.where(flat, ax[sharp], mx / norm) * reach
+            oy[sharp] = np.where(flat, ay[sharp], my / norm) * reach
+
+        vertices = np.empty(4 * len(x), dtype=np.float32)
+        vertices[0::4] = x + ox
+        vertices[1::4] = y + oy
+        vertices[2::4] = x - ox
+        vertices[3::4] = y - oy
+        return vertices[4 * (start - first):4 * (end - first)]
+
+    def normal(a, b):
+        if a < first or b >= last:
+            return None
+        dx, dy = points[2 * b] - points[2 * a], points[2 * b + 1] - points[2 * a + 1]
+        length = (dx * dx + dy * dy) ** 0.5
+        return (-dy / length, dx / length) if length else (0.0, 0.0)
+
+    vertices = array('f')
+    for i in range(start, end):
+        x, y = points[2 * i], points[2 * i + 1]
+        before, after = normal(i - 1, i), normal(i, i + 1)
+        bx, by = before or after or (0.0, 0.0)
+        ax, ay = after or before or (0.0, 0.0)
+
+        sx, sy = bx + ax, by + ay
+        denominator = 1 + bx * ax + by * ay
+        if denominator >= limit:
+            ox, oy = sx * half / denominator, sy * half / denominator
+        else:
+            norm = (sx * sx + sy * sy) ** 0.5
+            if norm >= 1e-9:
+                ox, oy = sx / norm * half * MITER_LIMIT, sy / norm * half * MITER_LIMIT
+            else:  # a full U-turn
+                ox, oy = ax * half, ay * half
+
+        vertices.extend((x + ox, y + oy, x - ox, y - oy))
+    return vertices
+
+
+class MeshLine(InstructionGroup):
+    """
+    Polyline of `width` pixels through the flat point list `points`.
+
+    Mirrors the `points`/`width` interface of
+    :class:`~kivy.graphics.SmoothLine`, plus :meth:`extend` to append
+    points without rebuilding the whole strip.
+    """
+
+    def __init__(self, points=(), width=2, **kwargs):
+        super().__init__(**kwargs)
+        self._width = width
+        self._points = array('d', points)
+        self._meshes = []
+        self._build(0)
+
+    @property
+    def points(self):
+        return self._points.tolist()
+
+    @points.setter
+    def points(self, points):
+        self._points = array('d', points)
+        self._build(0)
+
+    @property
+    def point_buffer(self):
+        """
+        The flat points as the stored `array('d')`, without a copy.
+        """
+
+        return self._points
+
+    @property
+    def width(self):
+        return self._width
+
+    @width.setter
+    def width(self, width):
+        self._width = width
+        self._build(0)
+
+    def extend(self, points, dropped=0):
+        """
+        Appends the flat point list `points` after dropping the `dropped`
+        oldest points. Without drops, only the mesh holding the former last
+        point is rebuilt and new meshes are added after it.
+        """
+
+        previous = len(self._points) // 2
+        if dropped:
+            del self._points[:dropped * 2]
+        self._points.extend(points)
+
+        if dropped:
+            self._build(0)
+        else:
+            # The former last point now has a join: rebuild from its mesh.
+            self._build(max(previous - 2, 0) // POINTS_PER_MESH)
+
+    def _build(self, first_mesh):
+        """
+        Rebuilds the meshes from `first_mesh` on.
+        """
+
+        points, meshes = self._points, self._meshes
+        count = len(points) // 2
+        chunks = (max(count - 1, 0) + POINTS_PER_MESH - 1) // POINTS_PER_MESH if count > 1 else 0
+
+        while len(meshes) > chunks:
+            self.remove(meshes.pop())
+
+        for chunk in range(first_mesh, chunks):
+            start = chunk * POINTS_PER_MESH
+            end = min(start + POINTS_PER_MESH + 1, count)
+            vertices = strip_vertices(points, self._width, start, end)
+            indices = get_strip_indices(end - start)
+
+            if chunk < len(meshes):
+                mesh = meshes[chunk]
+                mesh.vertices = vertices
+                mesh.indices = indices
+            else:
+                mesh = Mesh(vertices=vertices, indices=indices, mode='triangles', fmt=VERTEX_FORMAT)
+                self.add(mesh)
+                meshes.append(mesh)
@@ -0,0 +1,185 @@
+"""
+Charts/Projection
+=================
+
+Bulk helpers that turn data columns into grid pixel coordinates.
+
+NumPy is used when it is installed; otherwise the helpers fall back to
+:class:`array.array` buffers so the chart keeps working without it.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from core.charts._np import np
+
+
+def to_columns(points=None, xs=None, ys=None):
+    """
+    Returns the x and y columns of a series as float64 buffers.
+
+    Accepts either a sequence of `(x, y)` pairs (or an `(n, 2)` array) through
+    `points`, or two separate columns through `xs`/`ys`. Columns may be NumPy
+    arrays or any buffer-protocol sequence such as :class:`array.array`.
+    """
+
+    if points is not None:
+        if np is not None:
+            pairs = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+            return np.ascontiguousarray(pairs[:, 0]), np.ascontiguousarray(pairs[:, 1])
+
+        xs = array('d', [point[0] for point in points])
+        ys = array('d', [point[1] for point in points])
+        return xs, ys
+
+    if xs is None or ys is None:
+        raise ValueError("Either `points` or both `xs` and `ys` must be given.")
+
+    if len(xs) != len(ys):
+        raise ValueError(f"`xs` and `ys` differ in length ({len(xs)} != {len(ys)}).")
+
+    if np is not None:
+        return np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)
+
+    return _as_double_array(xs), _as_double_array(ys)
+
+
+def to_table(x, columns):
+    """
+    Returns the float64 x column of a table and its y columns, stored
+    side by side as the rows of one `(len(columns), len(x))` block when
+    NumPy is installed.
+    """
+
+    if np is not None:
+        x_values = np.asarray(x, dtype=np.float64)
+        y_block = np.empty((len(columns), len(x_values)), dtype=np.float64)
+    else:
+        x_values = _as_double_array(x)
+        y_block = []
+
+    for i, ys in enumerate(columns):
+        if len(ys) != len(x_values):
+            raise ValueError(f"y column {i} differs in length from `x` ({len(ys)} != {len(x_values)}).")
+        if np is not None:
+            y_block[i] = ys
+        else:
+            y_block.append(_as_double_array(ys))
+
+    return x_values, y_block
+
+
+def project(values, value_range, origin, length, clamp=True):
+    """
+    Maps `values` from `value_range` onto `[origin, origin + length]`,
+    clamping them to `value_range` first unless `clamp` is false.
+    """
+
+    low, high = value_range
+    scale = length / (high - low)
+
+    if np is not None:
+        values = np.asarray(values, dtype=np.float64)
+        out = np.clip(values, low, high) if clamp else values.copy()
+        out -= low
+        out *= scale
+        out += origin
+        return out
+
+    if not clamp:
+        return array('d', [(value - low) * scale + origin for value in values])
+    return array('d', [(min(max(value, low), high) - low) * scale + origin for value in values])
+
+
+def axis_transform(origin, length, value_range, new_origin, new_length, new_range):
+    """
+    Returns `(scale, offset)` such that `pixel * scale + offset` moves a
+    pixel projected with `(origin, length, value_range)` to where it lands
+    with `(new_origin, new_length, new_range)`.
+    """
+
+    old_factor = length / (value_range[1] - value_range[0])
+    new_factor = new_length / (new_range[1] - new_range[0])
+    scale = new_factor / old_factor
+    return scale, new_origin - origin * scale + (value_range[0] - new_range[0]) * new_factor
+
+
+def interleave(px, py):
+    """
+    Returns a flat `[x0, y0, x1, y1, ...]` list ready for a line instruction.
+    """
+
+    if np is not None:
+        flat = np.empty(len(px) * 2, dtype=np.float64)
+        flat[0::2] = px
+        flat[1::2] = py
+        return flat.tolist()
+
+    flat = [0.0] * (len(px) * 2)
+    flat[0::2] = px
+    flat[1::2] = py
+    return flat
+
+
+def interleave_buffer(px, py):
+    """
+    Returns the flat points of :func:`interleave` as an `array('d')`,
+    appended to other buffers without converting each value.
+    """
+
+    if np is not None:
+        flat = np.empty(len(px) * 2, dtype=np.float64)
+        flat[0::2] = px
+        flat[1::2] = py
+        return array('d', flat.tobytes())
+
+    flat = array('d', bytes(len(px) * 16))
+    flat[0::2] = array('d', px)
+    flat[1::2] = array('d', py)
+    return flat
+
+
+def take(values, indices):
+    """
+    Returns the items of `values` found at `indices`.
+    """
+
+    if np is not None:
+        return values[np.asarray(indices, dtype=np.intp)]
+
+    return array('d', [values[i] for i in indices])
+
+
+def is_sorted(values):
+    """
+    Checks whether `values` never decrease. NaN values make it false.
+    """
+
+    if np is not None:
+        return bool(np.all(values[1:] >= values[:-1]))
+
+    return all(a <= b for a, b in zip(values, values[1:]))
+
+
+def visible_slice(values, low, high):
+    """
+    Returns the `(start, end)` slice of the sorted `values` within
+    `[low, high]`, plus one boundary value on each side so lines drawn from
+    it reach the edges.
+    """
+
+    if np is not None:
+        start = int(np.searchsorted(values, low, side='left'))
+        end = int(np.searchsorted(values, high, side='right'))
+    else:
+        start = bisect_left(values, low)
+        end = bisect_right(values, high)
+    return max(start - 1, 0), min(end + 1, len(values))
+
+
+def _as_double_array(values):
+    if isinstance(values, array) and values.typecode == 'd':
+        return values
+    return array('d', values)
@@ -0,0 +1,261 @@
+"""
+Charts/Pyramid
+==============
+
+Min/max mip-map of a series for instant zoom.
+
+Level `k` splits the series into buckets of `2 ** k` points and keeps the
+lowest and the highest point of each, so a level is built from the one
+below by merging bucket pairs. A chart picks the coarsest level that still
+gives it enough points for the current :attr:`x_range` and grid width; the
+envelope of the line is preserved at every level.
+
+All levels together take 32 bytes per point of the series. Pyramids can
+be saved next to the source data with :meth:`MinMaxPyramid.open` so
+reloads skip the build. A saved pyramid is only reused when the series has
+the same length, end points and strided checksum (see
+:data:`CHECKSUM_SAMPLES`), and the same `stamp`, e.g. the size and
+modification time of the source files. They require NumPy.
+"""
+
+from __future__ import annotations
+
+import os
+
+from core.charts._np import np
+
+
+MIN_BUCKETS = 64
+'''
+Levels stop once they hold this many buckets or fewer.
+'''
+
+CHECKSUM_SAMPLES = 4096
+'''
+Number of evenly spaced points of a series summed into the checksum of
+its saved pyramid.
+'''
+
+
+class _Level:
+
+    __slots__ = ('x_lo', 'y_lo', 'x_hi', 'y_hi', 'count')
+
+    def __init__(self, size=16):
+        self.x_lo = np.empty(size)
+        self.y_lo = np.empty(size)
+        self.x_hi = np.empty(size)
+        self.y_hi = np.empty(size)
+        self.count = 0
+
+    def columns(self, start=0, end=None):
+        end = self.count if end is None else end
+        return self.x_lo[start:end], self.y_lo[start:end], self.x_hi[start:end], self.y_hi[start:end]
+
+    def write(self, start, x_lo, y_lo, x_hi, y_hi):
+        """
+        Overwrites the buckets from `start` on and drops any after them.
+        """
+
+        end = start + len(x_lo)
+        if end > len(self.x_lo):
+            size = max(end, 2 * len(self.x_lo))
+            for name in self.__slots__[:4]:
+                column = np.empty(size)
+                column[:start] = getattr(self, name)[:start]
+                setattr(self, name, column)
+
+        self.x_lo[start:end] = x_lo
+        self.y_lo[start:end] = y_lo
+        self.x_hi[start:end] = x_hi
+        self.y_hi[start:end] = y_hi
+        self.count = end
+
+
+def merge_pairs(x_lo, y_lo, x_hi, y_hi):
+    """
+    Merges consecutive bucket pairs; an odd last bucket stands alone.
+    """
+
+    if len(x_lo) % 2:
+        x_lo, y_lo, x_hi, y_hi = (np.append(column, column[-1]) for column in (x_lo, y_lo, x_hi, y_hi))
+
+    low = y_lo[1::2] < y_lo[0::2]
+    high = y_hi[1::2] > y_hi[0::2]
+    return (
+        np.where(low, x_lo[1::2], x_lo[0::2]),
+        np.where(low, y_lo[1::2], y_lo[0::2]),
+        np.where(high, x_hi[1::2], x_hi[0::2]),
+        np.where(high, y_hi[1::2], y_hi[0::2]),
+    )
+
+
+class MinMaxPyramid:
+
+    def __init__(self, xs=None, ys=None, stamp=()):
+        if np is None:
+            raise ImportError("MinMaxPyramid requires NumPy.")
+
+        self.xs = np.empty(0)
+        self.ys = np.empty(0)
+        self.stamp = tuple(stamp)
+        self.levels = []
+        if xs is not None:
+            self.extend(xs, ys, 0)
+
+    def __len__(self):
+        return len(self.xs)
+
+    @property
+    def nbytes(self):
+        return sum(len(level.x_lo) * 32 for level in self.levels)
+
+    def extend(self, xs, ys, previous):
+        """
+        Updates the pyramid for the series `xs`/`ys`, of which the first
+        `previous` points are unchanged since the last update. Only the
+        trailing buckets are rebuilt.
+        """
+
+        self.xs = xs = np.asarray(xs, dtype=np.float64)
+        self.ys = ys = np.asarray(ys, dtype=np.float64)
+        count = len(xs)
+
+        start = min(previous, count) // 2
+        below = (xs, ys, xs, ys)
+        k = 0
+        while True:
+            if k == len(self.levels):
+                self.levels.append(_Level())
+
+            level = self.levels[k]
+            start = min(start, level.count)
+            level.write(start, *merge_pairs(*(column[2 * start:] for column in below)))
+            if level.count <= MIN_BUCKETS:
+                del self.levels[k + 1:]
+                break
+
+            start //= 2
+            below = level.columns()
+            k += 1
+
+    def level_for(self, count, target):
+        """
+        Returns the coarsest level (0 being the raw series) that still draws
+        at least `target` points for `count` visible points.
+        """
+
+        level = 0
+        while level < len(self.levels) and 2 * count / 2 ** (level + 1) >= target:
+            level += 1
+        return level
+
+    def window(self, x_min, x_max, target):
+        """
+        Returns the `(xs, ys)` columns to draw `[x_min, x_max]` with about
+        `target` points, plus a boundary bucket on each side. The series must
+        be sorted by x.
+        """
+
+        xs = self.xs
+        first = int(np.searchsorted(xs, x_min, side='left'))
+        last = int(np.searchsorted(xs, x_max, side='right'))
+        level = self.level_for(last - first, target)
+
+        if level == 0:
+            start, end = max(first - 1, 0), min(last + 1, len(xs))
+            return xs[start:end].copy(), self.ys[start:end].copy()
+
+        size = 2 ** level
+        buckets = self.levels[level - 1]
+        start = max(first // size - 1, 0)
+        end = min(max(last - 1, 0) // size + 2, buckets.count)
+        x_lo, y_lo, x_hi, y_hi = buckets.columns(start, end)
+
+        # Emit the two extremes of each bucket in x order.
+        low_first = x_lo <= x_hi
+        out_x = np.empty(2 * len(x_lo))
+        out_y = np.empty(2 * len(x_lo))
+        out_x[0::2] = np.where(low_first, x_lo, x_hi)
+        out_y[0::2] = np.where(low_first, y_lo, y_hi)
+        out_x[1::2] = np.where(low_first, x_hi, x_lo)
+        out_y[1::2] = np.where(low_first, y_hi, y_lo)
+        return out_x, out_y
+
+    def indices(self, xs):
+        """
+        Returns the index in the series of each point of the window `xs`.
+        Points sharing their x resolve to the first of them.
+        """
+
+        return np.searchsorted(self.xs, xs, side='left')
+
+    #  ================================= #
+    #            Persistence
+    #  ================================= #
+    def _signature(self):
+        """
+        Returns the length, end points and strided checksum of the series,
+        followed by :attr:`stamp`.
+        """
+
+        xs, ys = self.xs, self.ys
+        count = len(xs)
+        if not count:
+            head = [0.0] * 7
+        else:
+            step = max(count // CHECKSUM_SAMPLES, 1)
+            weights = np.arange(1, len(xs[::step]) + 1, dtype=np.float64)
+            head = [count, xs[0], xs[-1], ys[0], ys[-1], np.dot(xs[::step], weights), np.dot(ys[::step], weights)]
+        return np.array(head + list(self.stamp), dtype=np.float64)
+
+    def save(self, path):
+        arrays = {'signature': self._signature()}
+        for k, level in enumerate(self.levels):
+            for name, column in zip(_Level.__slots__, level.columns()):
+                arrays[f'{k}_{name}'] = column
+
+        with open(path, 'wb') as stream:
+            np.savez(stream, **arrays)
+
+    @classmethod
+    def load(cls, path, xs, ys, stamp=()):
+        """
+        Returns the pyramid saved at `path` for `xs`/`ys` and `stamp`, or
+        `None` when the file is missing or was built from other data.
+        """
+
+        pyramid = cls(stamp=stamp)
+        pyramid.xs = np.asarray(xs, dtype=np.float64)
+        pyramid.ys = np.asarray(ys, dtype=np.float64)
+
+        try:
+            with np.load(path) as stored:
+                if not np.array_equal(stored['signature'], pyramid._signature(), equal_nan=True):
+                    return None
+
+                k = 0
+                while f'{k}_x_lo' in stored:
+                    level = _Level(0)
+                    for name in _Level.__slots__[:4]:
+                        setattr(level, name, stored[f'{k}_{name}'])
+                    level.count = len(level.x_lo)
+                    pyramid.levels.append(level)
+                    k += 1
+        except (OSError, ValueError, KeyError):
+            return None
+        return pyramid
+
+    @classmethod
+    def open(cls, xs, ys, path, stamp=()):
+        """
+        Loads the pyramid of `xs`/`ys` from `path`, building and saving it
+        there when it is missing or stale. `stamp`, a sequence of numbers
+        identifying the source data, must match the one saved.
+        """
+
+        pyramid = cls.load(path, xs, ys, stamp) if os.path.exists(path) else None
+        if pyramid is None:
+            pyramid = cls(xs, ys, stamp)
+            pyramid.save(path)
+        return pyramid
@@ -0,0 +1,259 @@
+"""
+Charts/Series
+=============
+
+Columnar storage for line series and the read-only views that expose it
+in the historical :attr:`~core.charts.linechart.CoreLineChart.dot_info`
+shape.
+
+Every point of a series is stored in four float64 columns: its data `x`
+and `y`, and its reference pixel position `px` and `py` (see
+:meth:`~core.charts.linechart.CoreLineChart.render_line`). That is
+**32 bytes per point**. Rolling-window series preallocate twice their
+capacity, so budget **64 bytes per point of capacity** for them. The
+per-point dicts of :attr:`dot_info` are built on access and never stored.
+
+Series drawn from a pyramid or culled to the visible window defer their
+pixel columns until a lookup reads them, so they cost 16 bytes per point
+until then. The series of a table
+(see :meth:`~core.charts.linechart.CoreLineChart.draw_table`) share their
+`x` and `px` columns, adding 16 bytes per point per series.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+
+from core.charts.linechart.buffers import ColumnBuffer
+from core.charts.linechart.projection import project, is_sorted
+
+
+class SeriesData:
+
+    __slots__ = ('xs', 'ys', 'shared_x', '_px', '_py', '_project', '_sorted')
+
+    def __init__(self, xs, ys, capacity=None):
+        self.xs = ColumnBuffer(xs, capacity)
+        self.ys = ColumnBuffer(ys, capacity)
+        self.shared_x = None
+        self._px = ColumnBuffer((), capacity)
+        self._py = ColumnBuffer((), capacity)
+        self._project = None
+        self._sorted = None
+
+    @classmethod
+    def sharing(cls, shared_x, ys):
+        """
+        Returns a series over the x column of the :class:`SharedX`
+        `shared_x`. The float64 column `ys` is used in place, not copied.
+        """
+
+        data = cls.__new__(cls)
+        data.xs = shared_x.xs
+        data.ys = ColumnBuffer.wrap(ys)
+        data.shared_x = shared_x
+        data._px = ColumnBuffer(())
+        data._py = ColumnBuffer(())
+        data._project = None
+        data._sorted = None
+        return data
+
+    def __len__(self):
+        return len(self.xs)
+
+    @property
+    def capacity(self):
+        return self.xs.capacity
+
+    @property
+    def nbytes(self):
+        """
+        Bytes held by the four columns, including preallocated room.
+        """
+
+        columns = (self.xs, self.ys, self._px, self._py)
+        return sum(column.nbytes for column in columns if column is not None)
+
+    @property
+    def x_sorted(self):
+        """
+        Whether the x column never decreases. Checked on first access, then
+        kept up to date by :meth:`extend` from the appended values only.
+        """
+
+        if self._sorted is None:
+            self._sorted = is_sorted(self.xs.values)
+        return self._sorted
+
+    @property
+    def px(self):
+        if self._px is None:
+            self._build_pixels()
+        return self._px
+
+    @property
+    def py(self):
+        if self._py is None:
+            self._build_pixels()
+        return self._py
+
+    def set_pixels(self, px, py):
+        """
+        Replaces the pixel columns with a fresh projection of the series.
+        A :class:`~core.charts.linechart.buffers.ColumnBuffer` given as `px`
+        is kept as is, so series can share it.
+        """
+
+        capacity = self.xs.capacity
+        self._px = px if isinstance(px, ColumnBuffer) else ColumnBuffer(px, capacity)
+        self._py = ColumnBuffer(py, capacity)
+        self._project = None
+
+    def defer_pixels(self, project):
+        """
+        Drops the pixel columns; `project(xs, ys)` rebuilds them on the next
+        access.
+        """
+
+        self._px = self._py = None
+        self._project = project
+
+    def _build_pixels(self):
+        self.set_pixels(*self._project(self.xs.values, self.ys.values))
+
+    def extend(self, xs, ys):
+        """
+        Appends data values and returns how many of the oldest points were
+        dropped. Their pixels must follow through :meth:`extend_pixels`.
+        """
+
+        if self._sorted and len(self.xs) and len(xs):
+            self._sorted = bool(self.xs.values[-1] <= xs[0]) and is_sorted(xs)
+        dropped = self.xs.extend(xs)
+        self.ys.extend(ys)
+        return dropped
+
+    def extend_pixels(self, px, py):
+        if self._px is not None:  # deferred columns are projected in full later
+            self._px.extend(px)
+            self._py.extend(py)
+
+    def point(self, index, transform=None):
+        """
+        Returns the point at `index` as `{'data': (x, y), 'pos': (px, py)}`.
+
+        `transform` (`(scale_x, scale_y, translate_x, translate_y)`) maps
+        the stored reference pixels onto the screen.
+        """
+
+        if self._px is None:
+            # Deferred pixels: project this point alone.
+            px, py = self._project(self.xs.values[index:index + 1], self.ys.values[index:index + 1])
+            px, py = float(px[0]), float(py[0])
+        else:
+            px = float(self.px.values[index])
+            py = float(self.py.values[index])
+        if transform is not None:
+            scale_x, scale_y, translate_x, translate_y = transform
+            px = px * scale_x + translate_x
+            py = py * scale_y + translate_y
+
+        return {
+            'data': (float(self.xs.values[index]), float(self.ys.values[index])),
+            'pos': (px, py),
+        }
+
+
+class SharedX:
+    """
+    x column shared by the series of a table, together with its projection
+    and hit index so both are computed once for all of them.
+    """
+
+    __slots__ = ('xs', 'key', 'px', 'index')
+
+    def __init__(self, xs):
+        self.xs = ColumnBuffer(xs)
+        self.key = None
+        self.px = None
+        self.index = None
+
+    def __len__(self):
+        return len(self.xs)
+
+    def project(self, reference, start=0, end=None):
+        """
+        Returns the x pixel column of the points `start` to `end` for the
+        series `reference`, projecting it only when the x part of the
+        reference or the slice changed.
+        """
+
+        grid_x, grid_width, x_range = reference[:3]
+        if end is None:
+            end = len(self.xs)
+        key = (grid_x, grid_width, x_range, start, end)
+        if key != self.key:
+            xs = self.xs.values
+            if start or end != len(xs):
+                xs = xs[start:end]
+            self.px = ColumnBuffer(project(xs, x_range, grid_x, grid_width, clamp=False))
+            self.key = key
+            self.index = None
+        return self.px
+
+
+class PointsView(Sequence):
+    """
+    Read-only sequence of the points of one series, in the shape of the
+    former `dot_info` lists.
+    """
+
+    __slots__ = ('_data', '_get_transform')
+
+    def __init__(self, data, get_transform):
+        self._data = data
+        self._get_transform = get_transform
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, index):
+        count = len(self._data)
+
+        if isinstance(index, slice):
+            transform = self._get_transform()
+            return [self._data.point(i, transform) for i in range(*index.indices(count))]
+
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError('point index out of range')
+
+        return self._data.point(index, self._get_transform())
+
+    def __iter__(self):
+        transform = self._get_transform()
+        point = self._data.point
+        for i in range(len(self._data)):
+            yield point(i, transform)
+
+
+class DotInfoView(Mapping):
+    """
+    Read-only mapping of series names to their :class:`PointsView`.
+    """
+
+    __slots__ = ('_chart',)
+
+    def __init__(self, chart):
+        self._chart = chart
+
+    def __getitem__(self, name):
+        instructions = self._chart.line_instructions[name]
+        return PointsView(instructions['data'], lambda: self._chart.get_series_transform(name))
+
+    def __iter__(self):
+        return iter(self._chart.line_instructions)
+
+    def __len__(self):
+        return len(self._chart.line_instructions)
@@ -0,0 +1,141 @@
+"""
+Charts/Texture Cache
+====================
+
+Bounded LRU cache of rendered label textures.
+
+Tick labels repeat across redraws, so rasterizing them once and reusing the
+texture saves a font rendering per tick on every resize. The cache evicts
+the least recently used textures once its memory budget is exceeded and
+keeps hit/miss counters to judge its effectiveness.
+
+Label sizes can be measured without rasterizing through
+:meth:`TextureCache.measure`, so labels that end up hidden cost no texture.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from kivy.uix.label import CoreLabel
+
+
+MAX_EXTENTS = 4096
+'''
+Number of measured label sizes kept before the measurements are reset.
+'''
+
+
+class TextureCache:
+
+    def __init__(self, max_bytes=4 * 1024 * 1024):
+        self._textures = OrderedDict()
+        self._extents = {}
+        self._measurers = {}
+        self._max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_bytes(self):
+        """
+        Memory budget of the cache, counted as 4 bytes per texel.
+        """
+
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value):
+        self._max_bytes = value
+        self._evict()
+
+    def __len__(self):
+        return len(self._textures)
+
+    def get(self, text, font_size=11, color=(1, 1, 1, 1), font_name=None):
+        """
+        Returns the texture of `text`, rendering it only on a cache miss.
+        """
+
+        key = (text, font_size, tuple(color), font_name)
+        texture = self._textures.get(key)
+        if texture is not None:
+            self._textures.move_to_end(key)
+            self.hits += 1
+            return texture
+
+        self.misses += 1
+        options = {'text': text, 'font_size': font_size, 'color': color}
+        if font_name is not None:
+            options['font_name'] = font_name
+
+        label = CoreLabel(**options)
+        label.refresh()
+        texture = label.texture
+
+        self._textures[key] = texture
+        self.size_bytes += self._texture_bytes(texture)
+        self._evict()
+        return texture
+
+    def measure(self, text, font_size=11, font_name=None):
+        """
+        Returns the `(width, height)` the texture of `text` has or would
+        have, without rendering it.
+        """
+
+        key = (text, font_size, font_name)
+        extent = self._extents.get(key)
+        if extent is None:
+            measurer = self._measurers.get((font_size, font_name))
+            if measurer is None:
+                options = {'font_size': font_size}
+                if font_name is not None:
+                    options['font_name'] = font_name
+                measurer = self._measurers[font_size, font_name] = CoreLabel(**options)
+
+            if len(self._extents) >= MAX_EXTENTS:
+                self._extents.clear()
+            extent = self._extents[key] = measurer.get_extents(text)
+        return extent
+
+    def clear(self):
+        self._textures.clear()
+        self._extents.clear()
+        self.size_bytes = 0
+
+    def stats(self):
+        """
+        Returns the counters as a dict, handy for logging.
+        """
+
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._textures),
+            'size_bytes': self.size_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def _evict(self):
+        # Never evict the entry that was just added.
+        while self.size_bytes > self._max_bytes and len(self._textures) > 1:
+            _, texture = self._textures.popitem(last=False)
+            self.size_bytes -= self._texture_bytes(texture)
+            self.evictions += 1
+
+    @staticmethod
+    def _texture_bytes(texture):
+        width, height = texture.size
+        return width * height * 4
+
+
+tick_label_cache = TextureCache()
+'''
+Texture cache shared by every chart for its tick labels.
+'''
@@ -0,0 +1,222 @@
+"""
+Charts/Ticks
+============
+
+Axis tick layout with "nice" steps.
+
+Ticks fall on multiples of 1, 2 or 5 times a power of ten, or for
+timestamps (seconds since the epoch, UTC) on whole seconds, minutes, hours
+and days. The step is the smallest one that keeps the tick count within
+the chart's `x_ticks`/`y_ticks`.
+
+Labels are measured without being rasterized. When they would overlap,
+only every second, fifth or tenth one is kept so the rest stay evenly
+spaced; the tick marks and grid lines of dropped labels stay.
+Layouts are memoized per range, pixel length and font in a
+:class:`TickLayoutCache`, so resizing along the other axis or panning back
+and forth reuses them.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+TIME_STEPS = (
+    1, 2, 5, 10, 15, 30,
+    MINUTE, 2 * MINUTE, 5 * MINUTE, 10 * MINUTE, 15 * MINUTE, 30 * MINUTE,
+    HOUR, 2 * HOUR, 3 * HOUR, 6 * HOUR, 12 * HOUR,
+    DAY, 2 * DAY, 7 * DAY, 14 * DAY,
+)
+'''
+Steps, in seconds, of time axes up to two weeks; longer ones step by a
+nice number of days.
+'''
+
+
+def nice_step(span, target):
+    """
+    Returns the smallest step of the form 1, 2 or 5 times a power of ten
+    that splits `span` into at most `target` intervals.
+    """
+
+    raw = span / max(target, 1)
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for multiple in (1, 2, 5):
+        if multiple * magnitude >= raw * (1 - 1e-9):
+            return multiple * magnitude
+    return 10 * magnitude
+
+
+def time_step(span, target):
+    """
+    Returns the smallest calendar-friendly step, in seconds, that splits
+    `span` into at most `target` intervals.
+    """
+
+    raw = span / max(target, 1)
+    for step in TIME_STEPS:
+        if step >= raw:
+            return step
+    return DAY * nice_step(span / DAY, target)
+
+
+def tick_values(low, high, step):
+    """
+    Returns the multiples of `step` within `[low, high]`.
+    """
+
+    first = math.ceil(low / step - 1e-9)
+    last = math.floor(high / step + 1e-9)
+    return [k * step for k in range(first, last + 1)]
+
+
+def format_tick(value, step):
+    """
+    Formats `value` with just enough decimals to tell ticks `step` apart.
+    """
+
+    if step >= 1 and float(step).is_integer():
+        return str(int(round(value)))
+
+    decimals = max(0, -math.floor(math.log10(step)))
+    text = f'{value:.{decimals}f}'
+    if float(text) == 0:  # no "-0.0"
+        text = f'{0:.{decimals}f}'
+    return text
+
+
+def format_time(value, step):
+    """
+    Formats the timestamp `value` at the precision of the time step `step`.
+    """
+
+    moment = datetime.fromtimestamp(value, tz=timezone.utc)
+    if step < MINUTE:
+        return moment.strftime('%H:%M:%S')
+    if step < DAY:
+        if moment.hour == 0 and moment.minute == 0:
+            return moment.strftime('%b %d')
+        return moment.strftime('%H:%M')
+    if step < 365 * DAY:
+        return moment.strftime('%b %d')
+    return moment.strftime('%Y')
+
+
+class TickLayout:
+
+    __slots__ = ('values', 'offsets', 'labels')
+
+    def __init__(self, values=(), offsets=(), labels=()):
+        self.values = values
+        self.offsets = offsets
+        self.labels = labels
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        """
+        Yields `(offset, label)` per tick; `label` is `None` when dropped.
+        """
+
+        return zip(self.offsets, self.labels)
+
+
+def layout_ticks(value_range, length, target, extent, mode='linear', formatter=None, gap=8):
+    """
+    Returns the :class:`TickLayout` of an axis of `length` pixels showing
+    `value_range`, with at most `target` intervals.
+
+    Offsets are in pixels from the start of the axis. `extent(text)` gives
+    the size of a label along the axis. When labels centered on their tick
+    come closer than `gap` pixels, only those of every second, fifth, tenth
+    (and so on) tick are kept.
+
+    `mode` is `'linear'` or `'time'`. `formatter`, if given, formats the
+    tick values instead of the default for the mode.
+    """
+
+    low, high = value_range
+    span = high - low
+    if span <= 0 or length <= 0 or target <= 0:
+        return TickLayout()
+
+    if mode == 'time':
+        step = time_step(span, target)
+        default_format = format_time
+    else:
+        step = nice_step(span, target)
+        default_format = format_tick
+
+    values = tick_values(low, high, step)
+    scale = length / span
+    offsets = [(value - low) * scale for value in values]
+
+    texts = [formatter(value) if formatter is not None else default_format(value, step) for value in values]
+    halves = [extent(text) / 2 for text in texts]
+    multiples = [round(value / step) for value in values]
+
+    # Keep every `stride`-th label, the smallest nice stride that leaves no
+    # overlap, so the labels that remain stay evenly spaced.
+    stride = 1
+    while True:
+        kept = [i for i, multiple in enumerate(multiples) if multiple % stride == 0]
+        if len(kept) <= 1 or all(
+            offsets[b] - halves[b] - offsets[a] - halves[a] >= gap for a, b in zip(kept, kept[1:])
+        ):
+            break
+        stride = nice_step(stride * 1.5, 1)
+
+    kept = set(kept)
+    labels = [text if i in kept else None for i, text in enumerate(texts)]
+    return TickLayout(values, offsets, labels)
+
+
+class TickLayoutCache:
+    """
+    Bounded LRU cache of :class:`TickLayout` objects, with hit/miss
+    counters like :class:`~core.charts.linechart.texturecache.TextureCache`.
+    """
+
+    def __init__(self, max_entries=256):
+        self._layouts = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._layouts)
+
+    def get(self, key, build):
+        """
+        Returns the layout stored under `key`, calling `build()` to make it
+        on a miss.
+        """
+
+        layout = self._layouts.get(key)
+        if layout is not None:
+            self._layouts.move_to_end(key)
+            self.hits += 1
+            return layout
+
+        self.misses += 1
+        layout = self._layouts[key] = build()
+        while len(self._layouts) > self.max_entries:
+            self._layouts.popitem(last=False)
+        return layout
+
+    def clear(self):
+        self._layouts.clear()
+
+
+tick_layout_cache = TickLayoutCache()
+'''
+Layout cache shared by every chart for its axes.
+'''
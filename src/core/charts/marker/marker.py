@@ -1,6 +1,6 @@
 from kivy.uix.relativelayout import RelativeLayout
 from kivy.uix.label import Label
-from kivy.properties import ObjectProperty, NumericProperty
+from kivy.properties import ObjectProperty, NumericProperty, BooleanProperty
 
 from resources.icons.md_icons import md_icons
 
@@ -20,6 +20,14 @@ class Marker(RelativeLayout):
     :attr:`selected_index` is a :class:`~kivy.properties.NumericProperty`
     '''
 
+    snap_while_dragging = BooleanProperty(False)
+    '''
+    `snap_while_dragging` updates :attr:`selected_index` and dispatches
+    `on_cursor_items` continuously while the marker is dragged.
+
+    :attr:`snap_while_dragging` is a :class:`~kivy.properties.BooleanProperty`
+    '''
+
 
     def __init__(self, chart, **kwargs):
         super().__init__(**kwargs)
@@ -47,6 +55,9 @@ class Marker(RelativeLayout):
         self.chart.bind(marker_text_color=inner_icon.setter('color'))
         self.chart.bind(marker_background_color=outer_icon.setter('color'))
 
+        self.snap_while_dragging = self.chart.marker_snap_while_dragging
+        self.chart.bind(marker_snap_while_dragging=self.setter('snap_while_dragging'))
+
         self.add_widget(outer_icon)
         self.add_widget(inner_icon)
 
@@ -60,6 +71,13 @@ class Marker(RelativeLayout):
     def on_touch_move(self, touch):
         if touch.grab_current is self:
             self.center_x = min(max(touch.x + self._touch_offset[0], self.chart.grid_x), self.chart.grid_right)
+
+            if self.chart.cursor_mode == 'interpolate':
+                self.chart.select_cursor_x(self.chart.to_data_x(self.center_x))
+            elif self.snap_while_dragging:
+                index = self.snap_index(touch.x)
+                if index is not None and index != self.selected_index:
+                    self.select(index)
             return True
         return super().on_touch_move(touch)
 
@@ -67,32 +85,33 @@ class Marker(RelativeLayout):
         if touch.grab_current is self:
             touch.ungrab(self)
 
-            line_info = []
-            for name, info in self.chart.dot_info.items():
-                if info:  # make sure the list is not empty
-                    line_info = info
-                    break
-            else:
-                return True  # nothing to do, no valid data
-
-            local_x = touch.x - self.chart.grid_x
-            if not line_info:  # additional safety, just in case
+            index = self.snap_index(touch.x)
+            if self.chart.cursor_mode == 'interpolate':
+                # The marker stays where it was dropped.
+                self.select(self.selected_index if index is None else index)
                 return True
-
-            try:
-                closest_point = min(line_info, key=lambda item: abs(item['pos'][0] - (local_x + self.chart.grid_x)))
-                index = line_info.index(closest_point)
-            except (ValueError, IndexError, KeyError):
-                return True  # something unexpected happened, silently fail
+            if index is None:
+                return True  # nothing to do, no valid data
 
             self.move(index)
             return True
 
         return super().on_touch_up(touch)
-        
-    def move(self, value):
+
+    def snap_index(self, x):
+        """
+        Returns the index of the point of the first series closest to the
+        chart-local `x`, found by binary search over its sorted x pixels.
+        """
+
+        for name, info in self.chart.dot_info.items():
+            if info:  # make sure the list is not empty
+                return self.chart.nearest_index(name, x)
+        return None
+
+    def move(self, value, dispatch=True):
         first_line_info = []
-        for name, line in self.chart.dot_info.items():
+        for first_name, line in self.chart.dot_info.items():
             first_line_info = line
             break
         else:
@@ -103,16 +122,35 @@ class Marker(RelativeLayout):
             return
 
         # Step 3: Set marker position
-        self.center_x = first_line_info[value]['pos'][0]
+        x = first_line_info[value]['pos'][0]
+        self.center_x = min(max(x, self.chart.grid_x), self.chart.grid_right)
+        self.select(value, dispatch)
+
+    def select(self, value, dispatch=True):
+        """
+        Selects the index `value` and dispatches the matching items of all
+        lines, without moving the marker. In the `'interpolate'` cursor mode
+        of the chart, the items are those at the marker's x instead.
+        """
+
         self.selected_index = value
+        if not dispatch:
+            return
+        if self.chart.cursor_mode == 'interpolate':
+            self.chart.select_cursor_x(self.chart.to_data_x(self.center_x))
+        else:
+            self.chart.dispatch('on_cursor_items', self.get_items(value))
+
+    def get_items(self, value):
+        """
+        Returns the point at index `value` of every line, by line name.
+        """
 
-        # Step 4: Collect items for all lines
         items = {}
         for name, info in self.chart.dot_info.items():
             if 0 <= value < len(info):
                 items[name] = info[value]
-
-        self.chart.dispatch('on_cursor_items', items)
+        return items
 
     def move_left(self):
         index = self.selected_index - 1
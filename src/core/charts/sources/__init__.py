@@ -0,0 +1,3 @@
+from .base import LazySeries
+from .mapped import MappedSeries
+from .delimited import CsvSeries
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""
+Charts/Sources
+==============
+
+Series read on demand from large files.
+
+A lazy series only hands the chart the points of the window it shows (see
+:meth:`~core.charts.linechart.CoreLineChart.draw_lazy_line`), so a file
+far larger than memory can be panned through. Sources require their x
+column to be sorted in ascending order, which lets a window be located by
+binary search.
+
+Sources subclass :class:`LazySeries`, which cannot be instantiated until
+its abstract methods are implemented.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class LazySeries(ABC):
+
+    @abstractmethod
+    def __len__(self):
+        ...
+
+    @property
+    @abstractmethod
+    def x_bounds(self):
+        """
+        The first and last x values of the series.
+        """
+
+    @abstractmethod
+    def window(self, x_min, x_max):
+        """
+        Returns the `(xs, ys)` columns of the points within `[x_min, x_max]`,
+        plus the nearest point on each side so the line runs to the edges
+        of the window.
+        """
+
+    def close(self):
+        """
+        Releases the underlying file. Does nothing by default.
+        """
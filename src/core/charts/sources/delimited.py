@@ -0,0 +1,116 @@
+"""
+Charts/Sources/Delimited
+========================
+
+Chunked reading of delimited text logs.
+
+The file is scanned once, in a streaming pass, to record the byte offset
+and first x value of every chunk of rows. A window then seeks to the chunk
+holding its start and parses rows only until it passes its end.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from itertools import islice
+
+from core.charts.sources.base import LazySeries
+
+
+class CsvSeries(LazySeries):
+    """
+    Series read from a delimited text file of numeric rows.
+
+    `x_column` and `y_column` select the fields, split on `delimiter`
+    without quoting rules. With `header`, the first line is skipped.
+    `chunk_size` rows share one entry of the offset index.
+    """
+
+    def __init__(self, path, x_column=0, y_column=1, delimiter=',', header=False, chunk_size=65536):
+        self.path = path
+        self.x_column = x_column
+        self.y_column = y_column
+        self.delimiter = delimiter.encode()
+        self.chunk_size = chunk_size
+
+        self._stream = open(path, 'rb')
+        self._chunk_xs = []
+        self._chunk_offsets = []
+        self._count = 0
+        self._last_x = None
+        self._scan(header)
+
+    def _scan(self, header):
+        stream = self._stream
+        offset = len(stream.readline()) if header else 0
+        x_column, delimiter, chunk_size = self.x_column, self.delimiter, self.chunk_size
+
+        count = 0
+        x = None
+        for line in stream:
+            if line.strip():
+                x = float(line.split(delimiter)[x_column])
+                if count % chunk_size == 0:
+                    self._chunk_xs.append(x)
+                    self._chunk_offsets.append(offset)
+                count += 1
+            offset += len(line)
+
+        self._count = count
+        self._last_x = x
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def x_bounds(self):
+        if not self._count:
+            return None
+        return self._chunk_xs[0], self._last_x
+
+    def window(self, x_min, x_max):
+        xs, ys = array('d'), array('d')
+        if not self._count:
+            return xs, ys
+
+        # Start in the chunk holding the last row before `x_min`.
+        chunk = max(bisect_left(self._chunk_xs, x_min) - 1, 0)
+        stream = self._stream
+        stream.seek(self._chunk_offsets[chunk])
+
+        x_column, y_column, delimiter = self.x_column, self.y_column, self.delimiter
+        before = None
+        done = False
+        while not done:
+            lines = list(islice(stream, self.chunk_size))
+            if not lines:
+                break
+
+            for line in lines:
+                if not line.strip():
+                    continue
+                fields = line.split(delimiter)
+                x = float(fields[x_column])
+                if x < x_min:
+                    before = (x, fields)
+                    continue
+
+                if before is not None:
+                    xs.append(before[0])
+                    ys.append(float(before[1][y_column]))
+                    before = None
+
+                xs.append(x)
+                ys.append(float(fields[y_column]))
+                if x > x_max:
+                    done = True
+                    break
+
+        if before is not None:  # the whole window lies past the last row
+            xs.append(before[0])
+            ys.append(float(before[1][y_column]))
+        return xs, ys
+
+    def close(self):
+        self._stream.close()
@@ -0,0 +1,120 @@
+"""
+Charts/Sources/Mapped
+=====================
+
+Memory-mapped raw binary columns.
+
+The file is never read as a whole: the operating system pages in the few
+blocks a binary search touches and the slice a window covers.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
+from core.charts.sources.base import LazySeries
+from core.charts.linechart.pyramid import MinMaxPyramid
+from core.charts._np import np
+
+
+_TYPECODES = {'float64': 'd', 'float32': 'f'}
+_DTYPES = {'float64': '<f8', 'float32': '<f4'}
+
+
+class MappedSeries(LazySeries):
+    """
+    Series stored as raw little-endian `float64` or `float32` values.
+
+    With `y_path`, `x_path` and `y_path` each hold one column. Without it,
+    `x_path` holds interleaved `x, y` pairs. `offset` skips a header of that
+    many bytes in each file.
+    """
+
+    def __init__(self, x_path, y_path=None, dtype='float64', offset=0):
+        if dtype not in _TYPECODES:
+            raise ValueError(f"`dtype` must be one of {tuple(_TYPECODES)}, not {dtype!r}.")
+
+        self.dtype = dtype
+        self.path = x_path
+        self.paths = (x_path, ) if y_path is None else (x_path, y_path)
+        self._maps = []
+
+        if y_path is None:
+            values = self._map(x_path, offset)
+            self.xs, self.ys = values[0::2], values[1::2]
+        else:
+            self.xs, self.ys = self._map(x_path, offset), self._map(y_path, offset)
+
+        if len(self.xs) != len(self.ys):
+            raise ValueError(f"x and y columns differ in length ({len(self.xs)} != {len(self.ys)}).")
+
+    def _map(self, path, offset):
+        if np is not None:
+            values = np.memmap(path, dtype=_DTYPES[self.dtype], mode='r', offset=offset)
+            self._maps.append(values)
+            return values
+
+        if sys.byteorder != 'little':
+            raise RuntimeError("Mapping little-endian files on this platform requires NumPy.")
+
+        with open(path, 'rb') as stream:
+            mapping = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mapping)
+
+        view = memoryview(mapping)[offset:]
+        size = array(_TYPECODES[self.dtype]).itemsize
+        return view[:len(view) - len(view) % size].cast(_TYPECODES[self.dtype])
+
+    def __len__(self):
+        return len(self.xs)
+
+    @property
+    def x_bounds(self):
+        if not len(self.xs):
+            return None
+        return float(self.xs[0]), float(self.xs[-1])
+
+    def window(self, x_min, x_max):
+        count = len(self.xs)
+        if np is not None:
+            start = int(np.searchsorted(self.xs, x_min, side='left'))
+            end = int(np.searchsorted(self.xs, x_max, side='right'))
+        else:
+            start = bisect_left(self.xs, x_min)
+            end = bisect_right(self.xs, x_max)
+
+        start, end = max(start - 1, 0), min(end + 1, count)
+
+        if np is not None:
+            return (
+                np.array(self.xs[start:end], dtype=np.float64),
+                np.array(self.ys[start:end], dtype=np.float64),
+            )
+
+        return array('d', self.xs[start:end].tolist()), array('d', self.ys[start:end].tolist())
+
+    def open_pyramid(self, path=None):
+        """
+        Returns the :class:`~core.charts.linechart.pyramid.MinMaxPyramid` of
+        the series, read from `path` (next to the x file by default) or built
+        and saved there. A saved pyramid is rebuilt once the size or
+        modification time of a mapped file changes. Requires NumPy.
+        """
+
+        if path is None:
+            path = f'{self.path}.pyramid.npz'
+
+        stamp = []
+        for source_path in self.paths:
+            stat = os.stat(source_path)
+            stamp.extend((stat.st_size, stat.st_mtime_ns))
+        return MinMaxPyramid.open(self.xs, self.ys, path, stamp)
+
+    def close(self):
+        # Mappings are unmapped once the views into them are released.
+        self.xs = self.ys = ()
+        self._maps.clear()
@@ -1,5 +1,6 @@
 import os
 
+from kivy.clock import Clock
 from kivy.lang import Builder
 from kivy.uix.label import Label
 from kivy.animation import Animation
@@ -53,6 +54,14 @@ class Tooltip(Label, Style):
     :attr:`animation` is a :class:`~kivy.properties.ObjectProperty`
     '''
 
+    is_open = BooleanProperty(False)
+    '''
+    `is_open` is `True` from :meth:`open` until :meth:`dismiss`, while the
+    tooltip is shown or fading in.
+
+    :attr:`is_open` is a :class:`~kivy.properties.BooleanProperty`
+    '''
+
     def __init__(self, chart, **kwargs):
         super().__init__(**kwargs)
 
@@ -63,31 +72,79 @@ class Tooltip(Label, Style):
         self.text_color = self.chart.tooltip_text_color
         self.background_color = self.chart.tooltip_background_color
 
+        # Both fades are built once and restarted on every transition.
+        self._fade_in = Animation(opacity=1.0, duration=0.2)
+        self._fade_out = Animation(opacity=0, duration=0.2)
+        for animation in (self._fade_in, self._fade_out):
+            animation.bind(on_complete=self.on_complete)
+
+        self._pending_text = None
+        self._text_trigger = Clock.create_trigger(self.apply_text, -1)
+
     def open(self):
         """
-        Opens the tooltip at the specified position with the given text.
+        Fades the tooltip in, unless it is already open.
         """
 
-        if self.is_in_progress:
-            self.animation.stop(self)
-        
-        self.is_in_progress = True
-        self.animation = Animation(opacity=1.0, duration=0.2)
-        self.animation.bind(on_complete=self.on_complete)
-        self.animation.start(self)
-
+        if self.is_open:
+            return
+        self.is_open = True
+        self.start(self._fade_in)
 
     def dismiss(self):
         """
-        Dismisses the tooltip with an animation.
+        Fades the tooltip out, unless it is already dismissed.
         """
+
+        if not self.is_open:
+            return
+        self.is_open = False
+        self.start(self._fade_out)
+
+    def start(self, animation):
         if self.is_in_progress:
             self.animation.stop(self)
 
         self.is_in_progress = True
-        self.animation = Animation(opacity=0, duration=0.2)
-        self.animation.bind(on_complete=self.on_complete)
-        self.animation.start(self)
+        self.animation = animation
+        animation.start(self)
+
+    def set_text(self, text):
+        """
+        Sets the text on the next frame, so the label is laid out at most
+        once per frame however often the text changes.
+        """
+
+        self._pending_text = text
+        self._text_trigger()
+
+    def apply_text(self, *args):
+        if self._pending_text is not None:
+            self.text, self._pending_text = self._pending_text, None
+
+    def show_items(self, items):
+        """
+        Shows the points of `items`, a mapping of series names to points in
+        the shape of :attr:`~core.charts.linechart.CoreLineChart.dot_info`,
+        and opens the tooltip.
+        """
+
+        self.set_text(self.format_items(items))
+        self.open()
+
+    def format_items(self, items):
+        """
+        Returns the text for `items`: the x and y values of a single point,
+        or the shared x and one y value per series.
+        """
+
+        if len(items) == 1:
+            point = next(iter(items.values()))
+            return f"X: {point['data'][0]}, Y: {point['data'][1]}"
+
+        lines = [f"X: {next(iter(items.values()))['data'][0]}"]
+        lines.extend(f"{name}: {point['data'][1]}" for name, point in items.items())
+        return '\n'.join(lines)
 
     def on_complete(self, *args):
         """
@@ -0,0 +1,35 @@
+"""
+Headless Kivy setup shared by the test suite.
+
+Like :mod:`benchmarks.headless`, the SDL offscreen video driver is used when
+there is no display, and must be selected before Kivy is imported.
+"""
+
+import logging
+import os
+
+import pytest
+
+if not os.environ.get('DISPLAY') and not os.environ.get('WAYLAND_DISPLAY'):
+    os.environ.setdefault('SDL_VIDEODRIVER', 'offscreen')
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+os.environ.setdefault('KIVY_LOG_MODE', 'PYTHON')
+logging.getLogger('kivy').setLevel(logging.ERROR)
+
+from config import set_fonts  # noqa: E402
+set_fonts()
+
+
+@pytest.fixture
+def chart():
+    """
+    A drawn 1200x600 chart showing x in [0, 100] and y in [0, 10].
+    """
+
+    from core.charts.linechart import CoreLineChart
+
+    chart = CoreLineChart(size=(1200, 600))
+    chart.x_range = [0, 100]
+    chart.y_left_range = [0, 10]
+    chart.redraw()
+    return chart
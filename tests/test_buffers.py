@@ -0,0 +1,56 @@
+import pytest
+
+from core.charts.linechart import buffers
+from core.charts.linechart.buffers import ColumnBuffer
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'python':
+        monkeypatch.setattr(buffers, 'np', None)
+    return request.param
+
+
+def test_unbounded_buffer_grows(backend):
+    buffer = ColumnBuffer([0.0, 1.0])
+    for start in range(2, 100, 7):
+        assert buffer.extend([float(i) for i in range(start, start + 7)]) == 0
+
+    assert list(buffer.values) == [float(i) for i in range(100)]
+
+
+def test_rolling_window_drops_the_oldest_values(backend):
+    buffer = ColumnBuffer([0.0, 1.0, 2.0, 3.0, 4.0], capacity=3)
+    assert list(buffer.values) == [2.0, 3.0, 4.0]
+
+    assert buffer.extend([5.0, 6.0]) == 2
+    assert list(buffer.values) == [4.0, 5.0, 6.0]
+
+    for value in range(7, 50):
+        assert buffer.extend([float(value)]) == 1
+    assert list(buffer.values) == [47.0, 48.0, 49.0]
+
+
+def test_extending_past_the_capacity_keeps_the_newest(backend):
+    buffer = ColumnBuffer([0.0], capacity=3)
+    assert buffer.extend([1.0, 2.0, 3.0, 4.0, 5.0]) == 1
+    assert list(buffer.values) == [3.0, 4.0, 5.0]
+
+
+def test_wrap_shares_the_values_until_it_grows():
+    np = pytest.importorskip('numpy')
+    values = np.arange(4, dtype=np.float64)
+    buffer = ColumnBuffer.wrap(values)
+    assert np.shares_memory(buffer.values, values)
+
+    buffer.extend([4.0, 5.0, 6.0])
+    assert not np.shares_memory(buffer.values, values)
+    assert list(buffer.values) == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+
+
+def test_fingerprint_is_reset_by_extend(backend):
+    buffer = ColumnBuffer([0.0, 1.0])
+    before = buffer.fingerprint
+    buffer.extend([2.0])
+    assert buffer.fingerprint != before
+    assert buffer.fingerprint == ColumnBuffer([0.0, 1.0, 2.0]).fingerprint
@@ -0,0 +1,26 @@
+import io
+import json
+
+from benchmarks.compare import compare, load_results, save_results
+
+
+RESULTS = {'cases': {'draw_line': {'1000': {'wall_ms': 2.0, 'instructions': 10, 'peak_bytes': 100}}}}
+
+
+def test_save_results_to_a_path(tmp_path):
+    path = tmp_path / 'results.json'
+    save_results(RESULTS, str(path))
+    assert load_results(str(path)) == RESULTS
+
+
+def test_save_results_to_a_stream():
+    stream = io.StringIO()
+    save_results(RESULTS, stream)
+    assert json.loads(stream.getvalue()) == RESULTS
+    assert not stream.closed
+
+
+def test_compare_reports_metrics_over_the_threshold():
+    baseline = {'cases': {'draw_line': {'1000': {'wall_ms': 1.0, 'instructions': 10, 'peak_bytes': 90}}}}
+    regressions = compare(RESULTS, baseline, threshold=0.25)
+    assert [regression['metric'] for regression in regressions] == ['wall_ms']
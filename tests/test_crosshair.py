@@ -0,0 +1,64 @@
+import pytest
+
+from core.charts.linechart import crosshair
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'python':
+        monkeypatch.setattr(crosshair, 'np', None)
+    return request.param
+
+
+def test_interpolate(backend):
+    xs, ys = [0.0, 10.0, 20.0], [0.0, 10.0, 30.0]
+    assert crosshair.interpolate(xs, ys, 5) == pytest.approx(5)
+    assert crosshair.interpolate(xs, ys, 15) == pytest.approx(20)
+    assert crosshair.interpolate(xs, ys, 20) == 30
+    assert crosshair.interpolate(xs, ys, -1) is None
+    assert crosshair.interpolate(xs, ys, 21) is None
+
+
+def test_interpolate_columns(backend):
+    xs = [0.0, 1.0, 2.0]
+    columns = [[0.0, 1.0, 2.0], [5.0, 5.0, 7.0]]
+    assert crosshair.interpolate_columns(xs, columns, 1.5) == pytest.approx([1.5, 6.0])
+    assert crosshair.interpolate_columns(xs, columns, 2) == pytest.approx([2.0, 7.0])
+    assert crosshair.interpolate_columns(xs, columns, 3) is None
+
+
+def test_crosshair_items_across_sample_rates(chart):
+    chart.draw_line('slow', xs=[0, 10, 20], ys=[0, 10, 20])
+    chart.draw_line('fast', xs=[0, 1, 2, 3, 4, 5, 6, 7, 8], ys=[0, 2, 4, 6, 8, 10, 12, 14, 16])
+    chart.draw_table([0, 4, 8], {'t': [1, 1, 5]})
+
+    items = chart.get_crosshair_items(7)
+    assert items['slow']['data'] == (7, pytest.approx(7))
+    assert items['fast']['data'] == (7, pytest.approx(14))
+    assert items['t']['data'] == (7, pytest.approx(4))
+
+
+def test_crosshair_skips_unsorted_series(chart):
+    chart.draw_line('sorted', xs=[0, 10], ys=[0, 10])
+    chart.draw_line('unsorted', xs=[0, 10, 5, 20], ys=[0, 10, 0, 10])
+
+    items = chart.get_crosshair_items(7)
+    assert 'unsorted' not in items
+    assert items['sorted']['data'][1] == pytest.approx(7)
+
+
+def test_cursor_items_are_dispatched_once_per_frame(chart):
+    from kivy.clock import Clock
+
+    chart.draw_line('a', xs=[0, 100], ys=[0, 10])
+    chart.cursor_mode = 'interpolate'
+    received = []
+    chart.bind(on_cursor_items=lambda instance, items: received.append(items))
+
+    for x in (10, 20, 30):
+        chart.select_cursor_x(x)
+    Clock.tick()
+
+    assert len(received) == 1
+    assert chart.cursor_x == 30
+    assert received[0]['a']['data'][1] == pytest.approx(3)
@@ -0,0 +1,56 @@
+import math
+
+import pytest
+
+from core.charts.linechart import decimation
+from core.charts.linechart.projection import to_columns
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'python':
+        monkeypatch.setattr(decimation, 'np', None)
+    return request.param
+
+
+def wave(count):
+    return to_columns(xs=range(count), ys=[math.sin(i / 7) for i in range(count)])
+
+
+def test_lttb_keeps_the_threshold_and_the_end_points(backend):
+    xs, ys = wave(1000)
+    kept = list(decimation.lttb_indices(xs, ys, 100))
+
+    assert len(kept) == 100
+    assert kept[0] == 0 and kept[-1] == 999
+    assert kept == sorted(set(kept))
+
+
+def test_lttb_keeps_everything_under_the_threshold(backend):
+    xs, ys = wave(50)
+    assert list(decimation.lttb_indices(xs, ys, 100)) == list(range(50))
+
+
+def test_minmax_keeps_the_extremes_of_each_column(backend):
+    xs, ys = wave(1000)
+    px = [x / 10 for x in xs]  # ten points per pixel column
+    kept = list(decimation.minmax_indices(px, ys))
+
+    assert kept[0] == 0 and kept[-1] == 999
+    for column in range(100):
+        points = range(column * 10, column * 10 + 10)
+        assert min(points, key=ys.__getitem__) in kept
+        assert max(points, key=ys.__getitem__) in kept
+    assert len(kept) <= 2 * 100 + 2
+
+
+def test_decimate_leaves_small_series_alone(backend):
+    xs, ys = wave(100)
+    assert decimation.decimate('lttb', xs, ys, xs, 0, 100) is None
+    assert decimation.decimate(None, xs, ys, xs, 0, 10) is None
+
+
+def test_decimate_rejects_unknown_modes(backend):
+    xs, ys = wave(100)
+    with pytest.raises(ValueError):
+        decimation.decimate('median', xs, ys, xs, 0, 10)
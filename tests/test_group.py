@@ -0,0 +1,68 @@
+import pytest
+from kivy.clock import Clock
+
+from core.charts.group.group import ChartGroup, nearest_value_index
+from core.charts.linechart import CoreLineChart
+from core.charts.linechart.buffers import ColumnBuffer
+
+
+def make_chart(xs):
+    chart = CoreLineChart(size=(1200, 600))
+    chart.x_range = [0, 30]
+    chart.y_left_range = [0, 30]
+    chart.redraw()
+    chart.draw_line('a', xs=xs, ys=list(range(len(xs))))
+    return chart
+
+
+def test_nearest_value_index():
+    values = [0.0, 1.0, 2.0, 20.0]
+    assert nearest_value_index(values, 10) == 2
+    assert nearest_value_index(values, 12) == 3
+    assert nearest_value_index(values, -5) == 0
+    assert nearest_value_index(values, 50) == 3
+
+
+def test_fingerprint_follows_the_values():
+    a, b = ColumnBuffer([0.0, 1.0, 2.0]), ColumnBuffer([0.0, 1.0, 2.0])
+    assert a.fingerprint == b.fingerprint
+
+    b.extend([3.0])
+    assert a.fingerprint != b.fingerprint
+    a.extend([3.0])
+    assert a.fingerprint == b.fingerprint
+    assert ColumnBuffer([0.0, 5.0, 2.0, 3.0]).fingerprint != a.fingerprint
+
+
+def test_followers_snap_to_their_own_x():
+    same = list(range(30))
+    skewed = [0, 1, 2, 20, 21, 22] + [23] * 23 + [29]
+    charts = [make_chart(same), make_chart(same), make_chart(skewed)]
+    assert charts[0].line_instructions['a']['data'].xs is not charts[1].line_instructions['a']['data'].xs
+
+    group = ChartGroup(charts)
+    received = []
+    group.bind(on_cursor_items=lambda instance, items: received.append(items))
+
+    charts[0].marker.move(10)
+    Clock.tick()
+
+    assert [chart.marker.selected_index for chart in charts] == [10, 10, 2]
+    assert received[-1][charts[2]]['a']['data'] == (2.0, 2.0)
+
+
+def test_charts_with_the_same_x_share_one_lookup(monkeypatch):
+    from core.charts.group import group as group_module
+
+    calls = []
+    search = group_module.nearest_value_index
+    monkeypatch.setattr(group_module, 'nearest_value_index', lambda values, x: calls.append(x) or search(values, x))
+
+    xs = list(range(30))
+    charts = [make_chart(xs) for _ in range(4)]
+    group = ChartGroup(charts)
+    group.select_x(12.4)
+    Clock.tick()
+
+    assert len(calls) == 1
+    assert all(chart.marker.selected_index == 12 for chart in charts)
@@ -0,0 +1,64 @@
+import pytest
+
+from core.charts.linechart import hittest
+from core.charts.linechart.hittest import SeriesIndex
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'python':
+        monkeypatch.setattr(hittest, 'np', None)
+    return request.param
+
+
+def test_nearest_x_prefers_the_leftmost_point(backend):
+    index = SeriesIndex([0.0, 10.0, 20.0], [0.0, 0.0, 0.0])
+    assert index.nearest_x(4) == 0
+    assert index.nearest_x(5) == 0
+    assert index.nearest_x(6) == 1
+    assert index.nearest_x(100) == 2
+    assert SeriesIndex([], []).nearest_x(0) is None
+
+
+def test_nearest_within_tolerance(backend):
+    index = SeriesIndex([0.0, 10.0, 20.0], [0.0, 50.0, 0.0])
+    found, distance = index.nearest(11, 48, tolerance=5)
+    assert found == 1
+    assert distance == pytest.approx(5 ** 0.5)
+    assert index.nearest(11, 30, tolerance=5) is None
+    assert index.nearest(15, 0, tolerance=4) is None
+
+
+def test_nearest_measures_tolerance_on_screen(backend):
+    index = SeriesIndex([0.0, 10.0], [0.0, 0.0])
+    # Drawn at twice the size, the point at x = 10 is 6 screen pixels away.
+    assert index.nearest(13, 0, tolerance=5, scale_x=2) is None
+    assert index.nearest(12, 0, tolerance=5, scale_x=2)[0] == 1
+
+
+def test_nearest_skips_points_out_of_bounds(backend):
+    index = SeriesIndex([0.0, 10.0, 12.0], [0.0, 0.0, 0.0])
+    assert index.nearest(11.5, 0, tolerance=5)[0] == 2
+    assert index.nearest(11.5, 0, tolerance=5, bounds=(0, 0, 11, 10))[0] == 1
+
+
+def test_unsorted_points_keep_their_series_index(backend):
+    index = SeriesIndex([20.0, 0.0, 10.0], [0.0, 0.0, 0.0])
+    assert index.nearest_x(1) == 1
+    assert index.nearest(19, 0, tolerance=5)[0] == 0
+
+
+def test_offset_and_indices_map_back_to_the_series(backend):
+    assert SeriesIndex([0.0, 10.0], [0.0, 0.0], offset=40).nearest_x(9) == 41
+
+    index = SeriesIndex([10.0, 0.0], [0.0, 0.0], indices=[7, 3])
+    assert index.nearest_x(1) == 3
+    assert index.nearest(9, 0, tolerance=2)[0] == 7
+
+
+def test_share_reuses_the_x_order(backend):
+    index = SeriesIndex([20.0, 0.0, 10.0], [0.0, 0.0, 0.0])
+    other = index.share([5.0, 6.0, 7.0])
+    assert other.px is index.px
+    assert other.nearest(10, 7, tolerance=1)[0] == 2
+    assert other.nearest(10, 5, tolerance=1) is None
@@ -0,0 +1,174 @@
+import time
+
+import pytest
+
+from core.charts.linechart import CoreLineChart
+
+
+@pytest.mark.parametrize('flag', ['hover_focus', 'hover_tooltip'])
+def test_hover_flags_at_construction(flag):
+    chart = CoreLineChart(**{flag: True})
+    assert chart._hover_bound
+
+    setattr(chart, flag, False)
+    assert not chart._hover_bound
+
+
+def test_marker_follows_its_point_after_a_pan(chart):
+    chart.draw_line('a', xs=list(range(200)), ys=[5] * 200)
+    chart.marker.move(50)
+    items = []
+    chart.bind(on_cursor_items=lambda instance, value: items.append(value))
+
+    chart.x_range = [40, 140]
+    chart.update_layers()
+
+    x = chart.dot_info['a'][50]['pos'][0]
+    assert chart.marker.selected_index == 50
+    assert chart.marker.center_x == pytest.approx(x)
+    assert chart.cursor.points[0] == pytest.approx(x)
+    assert not items
+
+
+def test_interpolating_cursor_follows_its_x_after_a_pan(chart):
+    chart.draw_line('a', xs=list(range(200)), ys=[5] * 200)
+    chart.cursor_mode = 'interpolate'
+    chart.place_cursor_x(50.5)
+
+    chart.x_range = [40, 140]
+    chart.update_layers()
+
+    assert chart.marker.center_x == pytest.approx(chart.grid_x + 10.5 / 100 * chart.grid_width)
+
+
+def test_pyramid_hit_test_indexes_the_drawn_window(chart):
+    xs = [i / 1000 for i in range(100000)]
+    ys = [5 + (i % 7) / 10 for i in range(100000)]
+    chart.use_pyramid = True
+    chart.draw_line('a', xs=xs, ys=ys)
+    chart.x_range = [20, 30]
+    chart.update_layers()
+
+    scale_x = chart.grid_width / 10
+    scale_y = chart.grid_height / 10
+    index = 25000
+    found = chart.hit_test(
+        chart.grid_x + (xs[index] - 20) * scale_x,
+        chart.grid_y + ys[index] * scale_y
+    )
+
+    assert found is not None and found[0] == 'a'
+    assert abs(xs[found[1]] - xs[index]) * scale_x <= chart.touch_tolerance
+    assert chart.line_instructions['a']['data']._px is None
+
+
+def test_culled_table_shares_its_x_slice(chart, monkeypatch):
+    from core.charts.linechart import series
+
+    xs = [i / 10 for i in range(10000)]
+    chart.x_range = [20, 30]
+    chart.draw_table(xs, {'a': [2] * 10000, 'b': [8] * 10000})
+    a, b = chart.line_instructions['a'], chart.line_instructions['b']
+    assert a['slice'] == b['slice'] and a['slice'] != (0, 10000)
+
+    def fail(*args):
+        raise AssertionError('a table column projected its own x')
+
+    # The x slice was projected once, by the first column drawn.
+    monkeypatch.setattr(series, 'project', fail)
+    monkeypatch.setattr(chart, 'project_line', fail)
+    chart.render_line('a')
+    chart.render_line('b')
+    index_a, index_b = chart.get_series_index('a'), chart.get_series_index('b')
+
+    assert index_b.px is index_a.px
+    assert index_a.nearest_x(index_a.px[5]) == a['slice'][0] + 5
+
+
+def test_progressive_refine_runs_in_chunks(chart):
+    from core.charts.linechart.linechart import REFINE_CHUNK
+
+    count = 3 * REFINE_CHUNK + 5
+    xs = [100 * i / count for i in range(count)]
+    ys = [5 + i % 3 for i in range(count)]
+    chart.progressive = True
+    chart.frame_budget = 0
+    chart.draw_line('a', xs=xs, ys=ys)
+
+    steps = 0
+    while chart._render_steps:
+        chart.run_render_steps()
+        steps += 1
+    refined = list(chart.line_instructions['a']['line'].points)
+
+    chart.render_line('a')
+    assert steps > 4
+    assert refined == chart.line_instructions['a']['line'].points
+
+
+def test_render_line_drops_a_pending_refine(chart):
+    from core.charts.linechart.linechart import REFINE_CHUNK
+
+    count = 3 * REFINE_CHUNK
+    chart.progressive = True
+    chart.frame_budget = 0
+    chart.draw_line('a', xs=[100 * i / count for i in range(count)], ys=[5] * count)
+    while chart.line_instructions['a']['refine'] is None:
+        chart.run_render_steps()
+
+    chart.render_line('a')
+    line = chart.line_instructions['a']['line']
+    while chart._render_steps:
+        chart.run_render_steps()
+    assert chart.line_instructions['a']['line'] is line
+
+
+def finish_async(chart, future, name):
+    """
+    Waits for an async load and runs the frame installing it.
+    """
+
+    from kivy.clock import Clock
+
+    future.result(timeout=10)
+    deadline = time.monotonic() + 10
+    while name not in chart.line_instructions and time.monotonic() < deadline:
+        Clock.tick()
+    return chart.line_instructions[name]
+
+
+def test_async_load_is_culled(chart):
+    count = 10000
+    future = chart.load_series_async('a', xs=[i / 10 for i in range(count)], ys=[5] * count)
+    instructions = finish_async(chart, future, 'a')
+
+    start, end = instructions['slice']
+    assert end - start < count
+    assert len(instructions['line'].points) // 2 == end - start
+
+
+def test_async_load_uses_the_pyramid(chart):
+    count = 100000
+    chart.use_pyramid = True
+    future = chart.load_series_async('a', xs=[i / 1000 for i in range(count)], ys=[5] * count)
+    instructions = finish_async(chart, future, 'a')
+
+    assert instructions['pyramid'] is not None
+    assert instructions['drawn'] is not None
+    assert len(instructions['line'].points) // 2 == len(instructions['drawn'][0])
+
+
+def test_table_columns_use_the_pyramid(chart):
+    count = 100000
+    xs = [i / 1000 for i in range(count)]
+    chart.use_pyramid = True
+    chart.draw_table(xs, {'a': [2] * count, 'b': [8] * count})
+
+    for name, y in (('a', 2), ('b', 8)):
+        instructions = chart.line_instructions[name]
+        assert instructions['pyramid'] is not None
+        assert len(instructions['line'].points) // 2 < count
+
+        found = chart.hit_test(chart.grid_x + chart.grid_width / 2, chart.grid_y + y / 10 * chart.grid_height)
+        assert found is not None and found[0] == name
+        assert xs[found[1]] == pytest.approx(50, abs=1)
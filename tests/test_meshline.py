@@ -0,0 +1,75 @@
+import pytest
+from kivy.graphics import Mesh
+
+from core.charts.linechart import meshline
+from core.charts.linechart.meshline import POINTS_PER_MESH, MeshLine, strip_vertices
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'python':
+        monkeypatch.setattr(meshline, 'np', None)
+    return request.param
+
+
+def zigzag(count):
+    points = []
+    for i in range(count):
+        points += [float(i * 10), float(10 * (i % 2))]
+    return points
+
+
+def meshes(line):
+    return [child for child in line.children if isinstance(child, Mesh)]
+
+
+def test_straight_line_is_offset_by_half_the_width(backend):
+    vertices = list(strip_vertices([0.0, 0.0, 10.0, 0.0, 20.0, 0.0], 4))
+    assert vertices == pytest.approx([0, 2, 0, -2, 10, 2, 10, -2, 20, 2, 20, -2])
+
+
+def test_right_angle_join_reaches_the_miter():
+    vertices = list(strip_vertices([0.0, 0.0, 10.0, 0.0, 10.0, 10.0], 2))
+    assert vertices[4:8] == pytest.approx([9, 1, 11, -1])
+
+
+def test_backends_agree(monkeypatch):
+    points = zigzag(50)
+    with_numpy = list(strip_vertices(points, 3))
+    monkeypatch.setattr(meshline, 'np', None)
+    assert list(strip_vertices(points, 3)) == pytest.approx(with_numpy, abs=1e-4)
+
+
+def test_slices_keep_their_neighbour_joins(backend):
+    points = zigzag(20)
+    full = list(strip_vertices(points, 2))
+    assert list(strip_vertices(points, 2, 5, 12)) == pytest.approx(full[5 * 4:12 * 4], abs=1e-4)
+
+
+def test_sharp_joins_are_cut(backend):
+    vertices = list(strip_vertices([0.0, 0.0, 100.0, 1.0, 0.0, 2.0], 2))
+    reach = ((vertices[4] - 100) ** 2 + (vertices[5] - 1) ** 2) ** 0.5
+    assert reach == pytest.approx(meshline.MITER_LIMIT)
+
+
+def test_long_lines_are_split_into_meshes():
+    line = MeshLine(points=zigzag(2 * POINTS_PER_MESH + 10), width=2)
+    assert len(meshes(line)) == 3
+    assert len(line.points) == 2 * (2 * POINTS_PER_MESH + 10)
+
+
+def test_extend_matches_a_fresh_line():
+    points = zigzag(POINTS_PER_MESH + 100)
+    line = MeshLine(points=points[:2 * (POINTS_PER_MESH - 5)], width=2)
+    line.extend(points[2 * (POINTS_PER_MESH - 5):])
+    fresh = MeshLine(points=points, width=2)
+
+    assert len(meshes(line)) == len(meshes(fresh)) == 2
+    for mesh, expected in zip(meshes(line), meshes(fresh)):
+        assert list(mesh.vertices) == list(expected.vertices)
+
+
+def test_extend_drops_the_oldest_points():
+    line = MeshLine(points=zigzag(10), width=2)
+    line.extend([100.0, 0.0], dropped=3)
+    assert line.points == zigzag(10)[6:] + [100.0, 0.0]
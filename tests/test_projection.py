@@ -0,0 +1,56 @@
+import pytest
+
+from core.charts.linechart import projection
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'python':
+        monkeypatch.setattr(projection, 'np', None)
+    return request.param
+
+
+def test_to_columns_from_points_and_columns(backend):
+    xs, ys = projection.to_columns([(0, 1), (2, 3)])
+    assert list(xs) == [0.0, 2.0] and list(ys) == [1.0, 3.0]
+
+    xs, ys = projection.to_columns(xs=[0, 2], ys=[1, 3])
+    assert list(xs) == [0.0, 2.0] and list(ys) == [1.0, 3.0]
+
+
+def test_to_columns_rejects_mismatched_columns(backend):
+    with pytest.raises(ValueError):
+        projection.to_columns(xs=[0, 1], ys=[0])
+    with pytest.raises(ValueError):
+        projection.to_columns(xs=[0, 1])
+
+
+def test_project_clamps_unless_told_not_to(backend):
+    assert list(projection.project([0, 5, 20], (0, 10), 100, 50)) == [100, 125, 150]
+    assert list(projection.project([0, 5, 20], (0, 10), 100, 50, clamp=False)) == [100, 125, 200]
+
+
+def test_axis_transform_moves_projected_pixels():
+    values = [0.0, 3.0, 10.0]
+    before = projection.project(values, (0, 10), 50, 100, clamp=False)
+    after = projection.project(values, (2, 6), 40, 200, clamp=False)
+
+    scale, offset = projection.axis_transform(50, 100, (0, 10), 40, 200, (2, 6))
+    assert [pixel * scale + offset for pixel in before] == pytest.approx(list(after))
+
+
+def test_interleave(backend):
+    assert projection.interleave([0.0, 1.0], [2.0, 3.0]) == [0.0, 2.0, 1.0, 3.0]
+    assert list(projection.interleave_buffer([0.0, 1.0], [2.0, 3.0])) == [0.0, 2.0, 1.0, 3.0]
+
+
+def test_visible_slice_keeps_a_boundary_point(backend):
+    values = projection.to_columns(xs=range(10), ys=range(10))[0]
+    assert projection.visible_slice(values, 3, 5) == (2, 7)
+    assert projection.visible_slice(values, -5, 50) == (0, 10)
+    assert projection.visible_slice(values, 3.5, 3.6) == (3, 5)
+
+
+def test_is_sorted(backend):
+    assert projection.is_sorted(projection.to_columns(xs=[0, 1, 1, 2], ys=[0] * 4)[0])
+    assert not projection.is_sorted(projection.to_columns(xs=[0, 2, 1], ys=[0] * 3)[0])
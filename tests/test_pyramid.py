@@ -0,0 +1,87 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from core.charts.linechart.pyramid import MIN_BUCKETS, MinMaxPyramid  # noqa: E402
+
+
+def series(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.arange(count, dtype=np.float64), np.cumsum(rng.standard_normal(count))
+
+
+def test_levels_keep_the_envelope():
+    xs, ys = series(10000)
+    pyramid = MinMaxPyramid(xs, ys)
+
+    assert pyramid.levels[-1].count <= MIN_BUCKETS
+    for k, level in enumerate(pyramid.levels):
+        size = 2 ** (k + 1)
+        x_lo, y_lo, x_hi, y_hi = level.columns()
+        assert y_lo.min() == ys.min() and y_hi.max() == ys.max()
+        assert y_lo[3] == ys[3 * size:4 * size].min()
+        assert y_hi[3] == ys[3 * size:4 * size].max()
+
+
+def test_window_draws_about_the_target():
+    xs, ys = series(100000)
+    pyramid = MinMaxPyramid(xs, ys)
+
+    out_x, out_y = pyramid.window(0, 100000, 1000)
+    assert 1000 <= len(out_x) <= 4000
+    assert np.all(np.diff(out_x) >= 0)
+    assert out_y.min() == ys.min() and out_y.max() == ys.max()
+
+    out_x, out_y = pyramid.window(10, 20, 1000)
+    assert list(out_x) == list(xs[9:22])
+    assert list(pyramid.indices(out_x)) == list(range(9, 22))
+
+
+def test_extend_matches_a_fresh_build():
+    xs, ys = series(5000)
+    pyramid = MinMaxPyramid(xs[:3001], ys[:3001])
+    pyramid.extend(xs, ys, 3001)
+
+    fresh = MinMaxPyramid(xs, ys)
+    assert len(pyramid.levels) == len(fresh.levels)
+    for level, expected in zip(pyramid.levels, fresh.levels):
+        for column, expected_column in zip(level.columns(), expected.columns()):
+            assert np.array_equal(column, expected_column)
+
+
+def test_open_saves_and_reloads(tmp_path):
+    path = str(tmp_path / 'series.pyramid')
+    xs, ys = series(10000)
+    built = MinMaxPyramid.open(xs, ys, path, stamp=(1, 2))
+
+    loaded = MinMaxPyramid.load(path, xs, ys, stamp=(1, 2))
+    assert loaded is not None
+    assert len(loaded.levels) == len(built.levels)
+    assert np.array_equal(loaded.levels[2].columns()[1], built.levels[2].columns()[1])
+
+
+@pytest.mark.parametrize('change', ['length', 'value', 'stamp'])
+def test_stale_pyramids_are_not_loaded(tmp_path, change):
+    path = str(tmp_path / 'series.pyramid')
+    xs, ys = series(10000)
+    MinMaxPyramid(xs, ys, stamp=(1,)).save(path)
+
+    stamp = (1,)
+    if change == 'length':
+        xs, ys = xs[:-1], ys[:-1]
+    elif change == 'value':
+        ys = ys.copy()
+        ys[5000] += 1
+    else:
+        stamp = (2,)
+    assert MinMaxPyramid.load(path, xs, ys, stamp) is None
+
+
+def test_corrupt_files_are_rebuilt(tmp_path):
+    path = tmp_path / 'series.pyramid'
+    path.write_bytes(b'not a pyramid')
+    xs, ys = series(1000)
+
+    pyramid = MinMaxPyramid.open(xs, ys, str(path))
+    assert len(pyramid) == 1000
+    assert MinMaxPyramid.load(str(path), xs, ys) is not None
@@ -0,0 +1,103 @@
+import os
+from array import array
+
+import pytest
+
+from core.charts.sources import CsvSeries, LazySeries, MappedSeries
+from core.charts.sources import mapped
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'python':
+        monkeypatch.setattr(mapped, 'np', None)
+    return request.param
+
+
+def write_doubles(path, values, header=b''):
+    path.write_bytes(header + array('d', values).tobytes())
+    return str(path)
+
+
+def test_lazy_series_is_abstract():
+    with pytest.raises(TypeError):
+        LazySeries()
+
+
+def test_mapped_columns(tmp_path, backend):
+    x_path = write_doubles(tmp_path / 'x.bin', range(10))
+    y_path = write_doubles(tmp_path / 'y.bin', [v * 2 for v in range(10)])
+    series = MappedSeries(x_path, y_path)
+
+    assert len(series) == 10
+    assert series.x_bounds == (0.0, 9.0)
+    xs, ys = series.window(3, 5)
+    assert list(xs) == [2.0, 3.0, 4.0, 5.0, 6.0]
+    assert list(ys) == [4.0, 6.0, 8.0, 10.0, 12.0]
+    series.close()
+
+
+def test_mapped_pairs_after_a_header(tmp_path, backend):
+    pairs = [value for i in range(10) for value in (i, -i)]
+    series = MappedSeries(write_doubles(tmp_path / 'xy.bin', pairs, header=b'HEADER!!'), offset=8)
+
+    xs, ys = series.window(8.5, 100)
+    assert list(xs) == [8.0, 9.0]
+    assert list(ys) == [-8.0, -9.0]
+    series.close()
+
+
+def test_mapped_series_validate_their_columns(tmp_path):
+    x_path = write_doubles(tmp_path / 'x.bin', range(10))
+    y_path = write_doubles(tmp_path / 'y.bin', range(9))
+    with pytest.raises(ValueError):
+        MappedSeries(x_path, y_path)
+    with pytest.raises(ValueError):
+        MappedSeries(x_path, dtype='int8')
+
+
+def test_mapped_pyramid_is_rebuilt_when_the_file_changes(tmp_path):
+    pytest.importorskip('numpy')
+    x_path = write_doubles(tmp_path / 'x.bin', range(1000))
+    y_path = write_doubles(tmp_path / 'y.bin', [v % 7 for v in range(1000)])
+    pyramid_path = str(tmp_path / 'series.pyramid')
+
+    series = MappedSeries(x_path, y_path)
+    series.open_pyramid(pyramid_path)
+    saved = os.stat(pyramid_path).st_mtime_ns
+    series.open_pyramid(pyramid_path)
+    assert os.stat(pyramid_path).st_mtime_ns == saved
+
+    stat = os.stat(y_path)
+    os.utime(y_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    os.utime(pyramid_path, ns=(saved - 10 ** 9, saved - 10 ** 9))
+    series.open_pyramid(pyramid_path)
+    assert os.stat(pyramid_path).st_mtime_ns != saved - 10 ** 9
+    series.close()
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / 'log.csv'
+    rows = ['time,value'] + [f'{i},{i * 10}' for i in range(100)]
+    rows.insert(50, '')
+    path.write_text('\n'.join(rows) + '\n')
+    return str(path)
+
+
+def test_csv_window_across_chunks(csv_path):
+    series = CsvSeries(csv_path, header=True, chunk_size=8)
+
+    assert len(series) == 100
+    assert series.x_bounds == (0.0, 99.0)
+    xs, ys = series.window(20.5, 60)
+    assert list(xs) == [float(i) for i in range(20, 62)]
+    assert list(ys) == [float(i * 10) for i in range(20, 62)]
+    series.close()
+
+
+def test_csv_window_outside_the_data(csv_path):
+    series = CsvSeries(csv_path, header=True, chunk_size=8)
+    assert list(series.window(200, 300)[0]) == [99.0]
+    assert list(series.window(-10, -5)[0]) == [0.0]
+    series.close()
@@ -0,0 +1,65 @@
+import pytest
+
+from core.charts.linechart import ticks
+from core.charts.linechart.ticks import TickLayoutCache, layout_ticks
+
+
+def test_nice_step():
+    assert ticks.nice_step(10, 10) == 1
+    assert ticks.nice_step(10, 4) == 5
+    assert ticks.nice_step(0.3, 5) == pytest.approx(0.1)
+    assert ticks.nice_step(7, 1) == 10
+
+
+def test_time_step():
+    assert ticks.time_step(60, 6) == 10
+    assert ticks.time_step(6 * ticks.HOUR, 5) == 2 * ticks.HOUR
+    assert ticks.time_step(365 * ticks.DAY, 4) == 100 * ticks.DAY
+
+
+def test_tick_values_include_both_ends():
+    assert ticks.tick_values(0, 10, 2.5) == [0, 2.5, 5, 7.5, 10]
+    assert ticks.tick_values(0.1, 0.3, 0.1) == pytest.approx([0.1, 0.2, 0.3])
+
+
+def test_format_tick():
+    assert ticks.format_tick(20, 5) == '20'
+    assert ticks.format_tick(0.25, 0.05) == '0.25'
+    assert ticks.format_tick(-1e-12, 0.1) == '0.0'
+
+
+def test_format_time():
+    assert ticks.format_time(90, 10) == '00:01:30'
+    assert ticks.format_time(ticks.DAY + ticks.HOUR, ticks.HOUR) == '01:00'
+    assert ticks.format_time(ticks.DAY, ticks.HOUR) == 'Jan 02'
+
+
+def test_layout_ticks_offsets():
+    layout = layout_ticks((0, 10), 200, 5, lambda text: 10)
+    assert list(layout.values) == [0, 2, 4, 6, 8, 10]
+    assert list(layout.offsets) == [0, 40, 80, 120, 160, 200]
+    assert list(layout.labels) == ['0', '2', '4', '6', '8', '10']
+
+
+def test_layout_ticks_thins_overlapping_labels_evenly():
+    layout = layout_ticks((0, 10), 100, 10, lambda text: 15, gap=8)
+    assert len(layout) == 11
+    assert [label for label in layout.labels if label is not None] == ['0', '5', '10']
+
+
+def test_layout_ticks_formatter_and_empty_ranges():
+    layout = layout_ticks((0, 1), 100, 1, lambda text: 10, formatter=lambda value: f'<{value}>')
+    assert list(layout.labels) == ['<0>', '<1>']
+    assert len(layout_ticks((5, 5), 100, 5, lambda text: 10)) == 0
+
+
+def test_layout_cache_evicts_the_least_recently_used():
+    cache = TickLayoutCache(max_entries=2)
+    cache.get('a', lambda: 'A')
+    cache.get('b', lambda: 'B')
+    assert cache.get('a', lambda: 'other') == 'A'
+    cache.get('c', lambda: 'C')
+
+    assert len(cache) == 2
+    assert cache.get('b', lambda: 'B2') == 'B2'
+    assert (cache.hits, cache.misses) == (1, 4)